@@ -0,0 +1,110 @@
+# Lean Code — BSD 3-Clause License — Vivian Voss, 2026
+# Scope: Micro-benchmark — JSON serialization time and bytes on the wire for a realistic generated resume.
+#
+# Run from the repository root:  python -m benchmarks.serialization [iterations]
+
+import gzip
+import json
+import sys
+import timeit
+import zlib
+
+import brotli
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+import settings
+from routes.responses import dumps
+from schemas import GeneratedResumeResponse
+
+LOREM = (
+    "Led a cross-functional team delivering a customer-facing platform, "
+    "cutting release lead time and improving reliability across services. "
+)
+
+
+def realistic_resume() -> GeneratedResumeResponse:
+    """A resume shaped like an LLM result for a senior profile."""
+    skills = ["Python", "FastAPI", "SQLite", "PostgreSQL", "Docker", "Kubernetes", "Svelte",
+              "TypeScript", "AWS", "Terraform", "Kafka", "Redis", "GraphQL", "CI/CD", "Linux"]
+    return GeneratedResumeResponse(
+        id=42,
+        job_title="Senior Backend Engineer",
+        company_name="Example Corp",
+        match_score=87.5,
+        language="en",
+        profile_version=128,
+        created_at="2026-10-18 09:30:00",
+        job_analysis={
+            "required_skills": [{"name": s, "matched": i % 3 != 0} for i, s in enumerate(skills)],
+            "preferred_skills": [{"name": f"{s} (advanced)", "matched": i % 2 == 0} for i, s in enumerate(skills[:8])],
+            "experience_years": {"required": 6, "candidate": 9},
+            "education": {"required": "Master", "candidate": "Master"},
+        },
+        resume={
+            "personal_info": {
+                "full_name": "Jane Doe", "email": "jane@example.com", "phone": "+32 470 00 00 00",
+                "location": "Brussels, Belgium", "linkedin_url": "https://linkedin.com/in/janedoe",
+                "photo": "/api/photos/" + "ab" * 32, "photo_ref": "ab" * 32,
+            },
+            "summary": LOREM * 4,
+            "work_experiences": [
+                {
+                    "id": i, "company": f"Company {i}", "title": "Engineer", "start_date": f"20{10 + i}-01",
+                    "end_date": None if i == 0 else f"20{11 + i}-06", "description": LOREM * 6,
+                    "match_reasons": [f"Used {s} in production" for s in skills[i:i + 4]],
+                    "order": i,
+                }
+                for i in range(8)
+            ],
+            "skills": [{"name": s, "matched": i % 3 != 0} for i, s in enumerate(skills * 2)],
+            "education": [
+                {"id": i, "institution": f"University {i}", "degree": "MSc",
+                 "field_of_study": "Computer Science", "graduation_year": 2008 + i}
+                for i in range(2)
+            ],
+            "projects": [
+                {"id": i, "name": f"Project {i}", "description": LOREM * 2, "technologies": ", ".join(skills[:5])}
+                for i in range(5)
+            ],
+            "languages": [{"id": i, "name": n, "level": "C1"} for i, n in enumerate(["English", "French", "Dutch"])],
+        },
+    )
+
+
+def main(iterations: int = 2000):
+    resume = realistic_resume()
+    adapter = TypeAdapter(GeneratedResumeResponse)
+    encoded = jsonable_encoder(resume)
+
+    serializers = {
+        "jsonable_encoder + json.dumps": lambda: json.dumps(jsonable_encoder(resume)).encode(),
+        "pydantic dump_json (response_model)": lambda: adapter.dump_json(resume),
+        "orjson (FastJSONResponse.render)": lambda: dumps(encoded),
+        "json.dumps (encoded dict)": lambda: json.dumps(encoded).encode(),
+    }
+    print(f"{'serializer':<42}{'µs/op':>10}")
+    for name, serialize in serializers.items():
+        seconds = min(timeit.repeat(serialize, number=iterations, repeat=5)) / iterations
+        print(f"{name:<42}{seconds * 1e6:>10.1f}")
+
+    body = adapter.dump_json(resume)
+    sizes = {
+        "identity": (body, None),
+        f"gzip -{settings.COMPRESSION_GZIP_LEVEL}": (
+            gzip.compress(body, settings.COMPRESSION_GZIP_LEVEL),
+            lambda: zlib.compress(body, settings.COMPRESSION_GZIP_LEVEL),
+        ),
+        f"brotli q{settings.COMPRESSION_BROTLI_QUALITY}": (
+            brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY),
+            lambda: brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY),
+        ),
+    }
+    print(f"\n{'encoding':<20}{'bytes':>10}{'ratio':>8}{'µs/op':>10}")
+    for name, (data, compress) in sizes.items():
+        cost = min(timeit.repeat(compress, number=iterations // 10, repeat=3)) / (iterations // 10) if compress else 0
+        print(f"{name:<20}{len(data):>10}{len(data) / len(body):>8.2f}{cost * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
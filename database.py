@@ -1,8 +1,15 @@
 # Lean Code — BSD 3-Clause License — Vivian Voss, 2026
 # Scope: SQLite engine, session context manager, and schema migration runner.
 
+import asyncio
+import base64
+import functools
+import json
 import re
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Callable
 from contextlib import contextmanager
 
 from fastapi import HTTPException
@@ -14,6 +21,15 @@ VALID_TABLES = frozenset({
     "projects", "languages", "jobs", "generated_resumes", "job_versions",
 })
 
+# Columns of a users read. The photo itself stays in photo_blobs; readers get
+# the URL it is served from, so profile reads never carry image bytes.
+USER_COLUMNS = (
+    "id, full_name, email, phone, location, linkedin_url, summary, photo_ref, photo_thumb_ref, "
+    "CASE WHEN photo_ref IS NOT NULL "
+    "THEN '/api/photos/' || COALESCE(photo_thumb_ref, photo_ref) END AS photo, "
+    "created_at, updated_at"
+)
+
 
 _INLINE_DDL = """
     CREATE TABLE IF NOT EXISTS users (
@@ -25,10 +41,20 @@ _INLINE_DDL = """
         linkedin_url TEXT,
         summary TEXT,
         photo TEXT,
+        photo_ref TEXT,
+        photo_thumb_ref TEXT,
         created_at TEXT DEFAULT CURRENT_TIMESTAMP,
         updated_at TEXT DEFAULT CURRENT_TIMESTAMP
     );
 
+    CREATE TABLE IF NOT EXISTS photo_blobs (
+        hash TEXT PRIMARY KEY,
+        mime_type TEXT NOT NULL,
+        data BLOB NOT NULL,
+        size INTEGER NOT NULL,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+
     CREATE TABLE IF NOT EXISTS work_experiences (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         company TEXT NOT NULL,
@@ -95,7 +121,8 @@ _INLINE_DDL = """
         updated_at TEXT,
         is_saved INTEGER DEFAULT 1,
         user_id INTEGER DEFAULT 1,
-        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        resume_count INTEGER NOT NULL DEFAULT 0
     );
 
     CREATE TABLE IF NOT EXISTS job_versions (
@@ -131,15 +158,271 @@ _INLINE_DDL = """
         latency_ms INTEGER,
         input_tokens INTEGER,
         output_tokens INTEGER,
+        profile_version INTEGER,
         FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE
     );
 
-    CREATE INDEX IF NOT EXISTS idx_generated_resumes_created
-    ON generated_resumes(created_at DESC);
+    CREATE TABLE IF NOT EXISTS generation_batches (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        language TEXT NOT NULL DEFAULT 'en',
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS generation_tasks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        status TEXT NOT NULL DEFAULT 'queued'
+            CHECK(status IN ('queued', 'running', 'succeeded', 'failed')),
+        job_description TEXT NOT NULL,
+        job_id INTEGER,
+        language TEXT NOT NULL DEFAULT 'en',
+        bypass_cache INTEGER NOT NULL DEFAULT 0,
+        resume_id INTEGER,
+        error TEXT,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        started_at TEXT,
+        finished_at TEXT,
+        batch_id INTEGER REFERENCES generation_batches(id) ON DELETE CASCADE,
+        FOREIGN KEY (resume_id) REFERENCES generated_resumes(id) ON DELETE SET NULL
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_generation_tasks_status ON generation_tasks(status);
+
+    CREATE TABLE IF NOT EXISTS llm_response_cache (
+        provider TEXT NOT NULL,
+        model TEXT NOT NULL,
+        prompt_hash TEXT NOT NULL,
+        parsed TEXT NOT NULL,
+        breadcrumbs TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        last_used_at REAL NOT NULL,
+        PRIMARY KEY (provider, model, prompt_hash)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_llm_response_cache_last_used
+    ON llm_response_cache(last_used_at);
+
+    CREATE TABLE IF NOT EXISTS profile_changes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        table_name TEXT NOT NULL,
+        row_id INTEGER NOT NULL,
+        operation TEXT NOT NULL CHECK(operation IN ('insert', 'update', 'delete')),
+        changed_at TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_profile_changes_table ON profile_changes(table_name, id);
+
+    CREATE TABLE IF NOT EXISTS table_versions (
+        table_name TEXT PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 0,
+        changed_at TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+        title, company_name, original_text,
+        content='jobs', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    );
+
+    CREATE VIRTUAL TABLE IF NOT EXISTS job_versions_fts USING fts5(
+        original_text,
+        content='job_versions', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    );
+
+    CREATE VIRTUAL TABLE IF NOT EXISTS generated_resumes_fts USING fts5(
+        job_title, company_name, body,
+        tokenize='unicode61 remove_diacritics 2'
+    );
 """
 
 
-MIGRATIONS: list[tuple[str, str]] = [
+# Tables whose rows make up the profile. Triggers journal every write to them
+# in profile_changes; the latest journal id is the profile version.
+PROFILE_TABLES = ("users", "work_experiences", "education", "skills", "projects", "languages")
+
+_PROFILE_TRIGGERS_DDL = "".join(
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_{table}_{operation}_journal
+    AFTER {operation.upper()} ON {table}
+    BEGIN
+        INSERT INTO profile_changes (table_name, row_id, operation)
+        VALUES ('{table}', {row}.id, '{operation}');
+    END;
+    """
+    for table in PROFILE_TABLES
+    for operation, row in (("insert", "NEW"), ("update", "NEW"), ("delete", "OLD"))
+)
+
+PROFILE_VERSION_SQL = "SELECT COALESCE(MAX(id), 0) FROM profile_changes"
+
+# Tables outside the profile only need a counter: triggers bump their row in
+# table_versions on every write, giving HTTP validators a cheap row version.
+VERSIONED_TABLES = ("jobs", "job_versions", "generated_resumes")
+
+_TABLE_VERSION_TRIGGERS_DDL = "".join(
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_{table}_{operation}_version
+    AFTER {operation.upper()} ON {table}
+    BEGIN
+        INSERT INTO table_versions (table_name, version) VALUES ('{table}', 1)
+        ON CONFLICT(table_name) DO UPDATE
+        SET version = version + 1, changed_at = CURRENT_TIMESTAMP;
+    END;
+    """
+    for table in VERSIONED_TABLES
+    for operation in ("insert", "update", "delete")
+)
+
+# jobs.resume_count mirrors the number of generated_resumes per job, so job
+# lists and details read a column instead of aggregating the resumes table.
+_RESUME_COUNT_TRIGGERS_DDL = """
+    CREATE TRIGGER IF NOT EXISTS trg_generated_resumes_insert_count
+    AFTER INSERT ON generated_resumes
+    BEGIN
+        UPDATE jobs SET resume_count = resume_count + 1 WHERE id = NEW.job_id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_generated_resumes_delete_count
+    AFTER DELETE ON generated_resumes
+    BEGIN
+        UPDATE jobs SET resume_count = resume_count - 1 WHERE id = OLD.job_id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_generated_resumes_update_count
+    AFTER UPDATE OF job_id ON generated_resumes
+    WHEN OLD.job_id IS NOT NEW.job_id
+    BEGIN
+        UPDATE jobs SET resume_count = resume_count - 1 WHERE id = OLD.job_id;
+        UPDATE jobs SET resume_count = resume_count + 1 WHERE id = NEW.job_id;
+    END;
+"""
+
+
+# Full-text search. jobs_fts and job_versions_fts index their tables' own
+# columns (external content: no second copy of the text), so deletes must
+# hand FTS5 the old values. Resumes are JSON: generated_resumes_fts stores
+# the text leaves of resume_content, minus photo references.
+SEARCH_INDEXES = {
+    "jobs": ("title", "company_name", "original_text"),
+    "job_versions": ("original_text",),
+}
+
+
+def _resume_search_text(row: str) -> str:
+    return (
+        f"CASE WHEN json_valid({row}.resume_content) THEN ("
+        f"SELECT group_concat(value, ' ') FROM json_tree({row}.resume_content) "
+        f"WHERE type = 'text' AND key NOT IN ('photo', 'photo_ref')"
+        f") ELSE {row}.resume_content END"
+    )
+
+
+def _search_trigger(table: str, operation: str, body: str, columns: str = "") -> str:
+    return f"""
+    CREATE TRIGGER IF NOT EXISTS trg_{table}_{operation}_search
+    AFTER {operation.upper()}{columns} ON {table}
+    BEGIN
+        {body}
+    END;
+    """
+
+
+def _external_content_triggers(table: str, columns: tuple[str, ...]) -> str:
+    names = ", ".join(columns)
+    insert = f"INSERT INTO {table}_fts (rowid, {names}) VALUES (NEW.id, {', '.join(f'NEW.{c}' for c in columns)});"
+    delete = (
+        f"INSERT INTO {table}_fts ({table}_fts, rowid, {names}) "
+        f"VALUES ('delete', OLD.id, {', '.join(f'OLD.{c}' for c in columns)});"
+    )
+    return (
+        _search_trigger(table, "insert", insert)
+        + _search_trigger(table, "delete", delete)
+        + _search_trigger(table, "update", delete + "\n        " + insert, f" OF {names}")
+    )
+
+
+_RESUME_SEARCH_INSERT = (
+    "INSERT INTO generated_resumes_fts (rowid, job_title, company_name, body) "
+    f"VALUES (NEW.id, NEW.job_title, NEW.company_name, {_resume_search_text('NEW')});"
+)
+_RESUME_SEARCH_DELETE = "DELETE FROM generated_resumes_fts WHERE rowid = OLD.id;"
+
+_SEARCH_TRIGGERS_DDL = "".join(
+    _external_content_triggers(table, columns) for table, columns in SEARCH_INDEXES.items()
+) + (
+    _search_trigger("generated_resumes", "insert", _RESUME_SEARCH_INSERT)
+    + _search_trigger("generated_resumes", "delete", _RESUME_SEARCH_DELETE)
+    + _search_trigger(
+        "generated_resumes",
+        "update",
+        _RESUME_SEARCH_DELETE + "\n        " + _RESUME_SEARCH_INSERT,
+        " OF job_title, company_name, resume_content",
+    )
+)
+
+
+def _migrate_search_index(conn):
+    """Index the rows written before the search triggers existed."""
+    for table in SEARCH_INDEXES:
+        conn.execute(f"INSERT INTO {table}_fts ({table}_fts) VALUES ('rebuild')")
+    conn.execute("DELETE FROM generated_resumes_fts")
+    conn.execute(
+        "INSERT INTO generated_resumes_fts (rowid, job_title, company_name, body) "
+        f"SELECT id, job_title, company_name, {_resume_search_text('generated_resumes')} "
+        "FROM generated_resumes"
+    )
+
+
+def get_profile_version(conn) -> int:
+    """Return the profile version: it grows with every write to a profile table."""
+    return conn.execute(PROFILE_VERSION_SQL).fetchone()[0]
+
+
+def _migrate_photos_to_blob_store(conn):
+    from services.photo_store import decode_data_url, store_blob
+
+    rows = conn.execute(
+        "SELECT id, photo FROM users WHERE photo IS NOT NULL AND photo != ''"
+    ).fetchall()
+    for row in rows:
+        try:
+            mime_type, data = decode_data_url(row["photo"])
+        except ValueError:
+            continue
+        conn.execute(
+            "UPDATE users SET photo_ref = ?, photo = NULL WHERE id = ?",
+            (store_blob(conn, mime_type, data), row["id"]),
+        )
+
+
+def _migrate_strip_resume_photos(conn):
+    from services.photo_store import decode_data_url, store_blob
+
+    rows = conn.execute(
+        "SELECT id, resume_content FROM generated_resumes "
+        "WHERE json_valid(resume_content) "
+        "AND json_extract(resume_content, '$.personal_info.photo') IS NOT NULL"
+    ).fetchall()
+    for row in rows:
+        content = json.loads(row["resume_content"])
+        personal_info = content["personal_info"]
+        photo = personal_info.pop("photo")
+        if not personal_info.get("photo_ref"):
+            try:
+                personal_info["photo_ref"] = store_blob(conn, *decode_data_url(photo))
+            except (TypeError, ValueError):
+                pass
+        conn.execute(
+            "UPDATE generated_resumes SET resume_content = ? WHERE id = ?",
+            (json.dumps(content), row["id"]),
+        )
+    if rows:
+        # Hand the pages the embedded images occupied back to the filesystem
+        conn.commit()
+        conn.execute("VACUUM")
+
+
+# Each migration is one SQL statement, or a function taking the connection
+# for data moves SQL alone cannot express.
+MIGRATIONS: list[tuple[str, str | Callable[[sqlite3.Connection], None]]] = [
     ("20240601_jobs_title",                "ALTER TABLE jobs ADD COLUMN title TEXT DEFAULT 'Untitled Job'"),
     ("20240601_jobs_company_name",         "ALTER TABLE jobs ADD COLUMN company_name TEXT"),
     ("20240601_jobs_updated_at",           "ALTER TABLE jobs ADD COLUMN updated_at TEXT"),
@@ -162,6 +445,21 @@ MIGRATIONS: list[tuple[str, str]] = [
     ("20260527_breadcrumbs_latency_ms",    "ALTER TABLE generated_resumes ADD COLUMN latency_ms INTEGER"),
     ("20260527_breadcrumbs_input_tokens",  "ALTER TABLE generated_resumes ADD COLUMN input_tokens INTEGER"),
     ("20260527_breadcrumbs_output_tokens", "ALTER TABLE generated_resumes ADD COLUMN output_tokens INTEGER"),
+    ("20261018_tasks_batch_id",            "ALTER TABLE generation_tasks ADD COLUMN batch_id INTEGER REFERENCES generation_batches(id) ON DELETE CASCADE"),
+    ("20261018_tasks_batch_id_index",      "CREATE INDEX IF NOT EXISTS idx_generation_tasks_batch_id ON generation_tasks(batch_id)"),
+    ("20261018_users_photo_ref",           "ALTER TABLE users ADD COLUMN photo_ref TEXT"),
+    ("20261018_photos_to_blob_store",      _migrate_photos_to_blob_store),
+    ("20261018_users_photo_thumb_ref",     "ALTER TABLE users ADD COLUMN photo_thumb_ref TEXT"),
+    ("20261018_resumes_strip_photos",      _migrate_strip_resume_photos),
+    ("20261018_resumes_profile_version",   "ALTER TABLE generated_resumes ADD COLUMN profile_version INTEGER"),
+    ("20261018_jobs_saved_updated_index",  "CREATE INDEX IF NOT EXISTS idx_jobs_saved_updated ON jobs(is_saved, updated_at DESC, id DESC)"),
+    ("20261018_resumes_created_id_index",  "CREATE INDEX IF NOT EXISTS idx_generated_resumes_created_id ON generated_resumes(created_at DESC, id DESC)"),
+    ("20261018_resumes_drop_created_index", "DROP INDEX IF EXISTS idx_generated_resumes_created"),
+    ("20261018_resumes_job_index",         "CREATE INDEX IF NOT EXISTS idx_generated_resumes_job ON generated_resumes(job_id, created_at DESC)"),
+    ("20261018_search_index",              _migrate_search_index),
+    ("20261018_skills_name_nocase_index",  "CREATE INDEX IF NOT EXISTS idx_skills_user_name_nocase ON skills(user_id, name COLLATE NOCASE)"),
+    ("20261018_jobs_resume_count",         "ALTER TABLE jobs ADD COLUMN resume_count INTEGER NOT NULL DEFAULT 0"),
+    ("20261018_jobs_resume_count_backfill", "UPDATE jobs SET resume_count = (SELECT COUNT(*) FROM generated_resumes gr WHERE gr.job_id = jobs.id)"),
 ]
 
 
@@ -191,6 +489,37 @@ def exists_or_404(conn, table: str, id: int, entity_name: str):
         raise HTTPException(status_code=404, detail=f"{entity_name} not found")
 
 
+def encode_cursor(*values) -> str:
+    """Opaque keyset cursor for the sort key of the last row on a page."""
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: tuple[type, ...]) -> list:
+    """Inverse of encode_cursor; raises ValueError for anything it did not produce.
+
+    ``types`` is the expected type of each sort-key value, e.g. ``(str, int)``
+    for (timestamp, id), so a forged cursor never reaches the query.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if (
+        not isinstance(values, list)
+        or len(values) != len(types)
+        # type() rather than isinstance: JSON true/false must not pass as an int id
+        or any(type(value) is not expected for value, expected in zip(values, types))
+    ):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def like_pattern(term: str) -> str:
+    """Substring pattern for ``LIKE ? ESCAPE '\\'`` with the term's wildcards escaped."""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
 def fetch_one(conn, table: str, id: int, model_class):
     if table not in VALID_TABLES:
         raise ValueError(f"Invalid table name: {table}")
@@ -198,15 +527,156 @@ def fetch_one(conn, table: str, id: int, model_class):
     return model_class.model_validate(dict(cursor.fetchone()))
 
 
+class ConnectionPool:
+    """Idle SQLite connections for one database file, reused across requests.
+
+    Connections are opened on demand, tuned once with the configured
+    PRAGMAs and handed to one caller at a time, so they may move between
+    threads. Checkout never blocks: nested ``get_db`` calls simply take a
+    second connection. On return, uncommitted work is rolled back, as
+    closing the connection used to do, and at most ``size`` connections
+    are kept; the rest are closed.
+    """
+
+    def __init__(self, path: str, size: int):
+        self.path = path
+        self.size = size
+        self._idle: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def acquire(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._connect()
+
+    def release(self, conn: sqlite3.Connection):
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            conn.close()
+            return
+        conn.row_factory = sqlite3.Row
+        with self._lock:
+            if not self._closed and len(self._idle) < self.size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._closed = True
+        for conn in idle:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute(f"PRAGMA journal_mode = {settings.SQLITE_JOURNAL_MODE}")
+        conn.execute(f"PRAGMA synchronous = {settings.SQLITE_SYNCHRONOUS}")
+        conn.execute(f"PRAGMA mmap_size = {int(settings.SQLITE_MMAP_SIZE)}")
+        conn.execute(f"PRAGMA cache_size = {int(settings.SQLITE_CACHE_SIZE)}")
+        conn.execute(f"PRAGMA temp_store = {settings.SQLITE_TEMP_STORE}")
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def _current_pool() -> ConnectionPool:
+    """Pool for settings.DATABASE, replacing the old one if the path changed."""
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool.path != settings.DATABASE:
+            if _pool is not None:
+                _pool.close()
+            _pool = ConnectionPool(settings.DATABASE, settings.SQLITE_POOL_SIZE)
+        return _pool
+
+
+def open_pool():
+    """Open the first pooled connection so the first request skips setup."""
+    pool = _current_pool()
+    pool.release(pool.acquire())
+
+
+def close_pool():
+    """Close every idle pooled connection; checked-out ones close on return."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
+
+
 @contextmanager
 def get_db():
-    conn = sqlite3.connect(settings.DATABASE)
+    pool = _current_pool()
+    conn = pool.acquire()
     try:
-        conn.execute("PRAGMA foreign_keys = ON")
-        conn.row_factory = sqlite3.Row
         yield conn
     finally:
-        conn.close()
+        pool.release(conn)
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _db_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.DB_EXECUTOR_WORKERS, thread_name_prefix="db"
+            )
+        return _executor
+
+
+async def run_in_db(func, /, *args, **kwargs):
+    """Run blocking database work on the DB executor and await its result.
+
+    Keeps sqlite3 calls off the event loop so a slow query or large write
+    cannot stall other requests or in-flight LLM calls.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_db_executor(), functools.partial(func, *args, **kwargs))
+
+
+def shutdown_db_executor():
+    """Wait for queued database work to finish and stop the DB executor threads."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+class AsyncService:
+    """Awaitable counterpart of a synchronous service.
+
+    Every method of the wrapped service becomes a coroutine function that
+    runs the original on the DB executor: ``await async_job_service.get(1)``.
+    """
+
+    def __init__(self, service):
+        self._service = service
+
+    def __getattr__(self, name):
+        method = getattr(self._service, name)
+        if not callable(method):
+            return method
+
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+            return await run_in_db(method, *args, **kwargs)
+
+        return call
 
 
 def _migrate_recreate_with_constraint(conn, source_table, rename_map, additions, constraint_clause):
@@ -420,7 +890,7 @@ def _migrate_apply_pending(conn):
     for version_id, sql in MIGRATIONS:
         if version_id in applied:
             continue
-        match = _ADD_COLUMN_RE.match(sql)
+        match = _ADD_COLUMN_RE.match(sql) if isinstance(sql, str) else None
         if match:
             table, column = match.group(1), match.group(2)
             existing = {row[1] for row in conn.execute(
@@ -434,7 +904,10 @@ def _migrate_apply_pending(conn):
                 conn.commit()
                 continue
         try:
-            conn.execute(sql)
+            if callable(sql):
+                sql(conn)
+            else:
+                conn.execute(sql)
         except Exception as e:
             raise type(e)(f"[{version_id}] {e}") from e
         conn.execute(
@@ -454,6 +927,13 @@ def init_db():
         _migrate_skills_unique_constraint(conn)
         _migrate_generated_resumes_fk_cascade(conn)
         _migrate_apply_pending(conn)
+        # After the migrations: recreating a table drops its triggers
+        conn.executescript(
+            _PROFILE_TRIGGERS_DDL
+            + _TABLE_VERSION_TRIGGERS_DDL
+            + _RESUME_COUNT_TRIGGERS_DDL
+            + _SEARCH_TRIGGERS_DDL
+        )
         conn.execute(
             "UPDATE jobs SET updated_at = created_at WHERE updated_at IS NULL"
         )
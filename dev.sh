@@ -13,6 +13,7 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 cd "$SCRIPT_DIR"
 
 export PLAYWRIGHT_BROWSERS_PATH=0
+export PDF_TEMPLATE_RELOAD=1
 
 echo -e "${BLUE}╔══════════════════════════════════════════╗${NC}"
 echo -e "${BLUE}║       MyCV Development Server            ║${NC}"
@@ -8,22 +8,46 @@ logging.basicConfig(
 
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.datastructures import Default
 from fastapi.staticfiles import StaticFiles
-from database import init_db
+import settings
+from database import init_db, open_pool, close_pool, shutdown_db_executor
+from services.browser_pool import browser_pool
+from services.pdf_generator import pdf_generator_service
+from services.generation_queue import generation_queue
 from routes import users, work_experiences, education, skills, projects, languages
 from routes.resumes import router as resumes_router, profile_router
 from routes.jobs import router as jobs_router
 from routes.photos import router as photos_router
 from routes.profile_import import router as profile_import_router
+from routes.tasks import router as tasks_router
+from routes.search import router as search_router
+from routes.responses import CompressionMiddleware, FastJSONResponse
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     init_db()
+    open_pool()
+    browser_pool.start()
+    generation_queue.start()
+    if settings.PDF_TEMPLATE_RELOAD:
+        pdf_generator_service.watch_templates()
     yield
+    await generation_queue.stop()
+    pdf_generator_service.stop_watching()
+    browser_pool.close()
+    shutdown_db_executor()
+    close_pool()
 
 
-app = FastAPI(title="MyCV API", lifespan=lifespan)
+# Default() keeps FastAPI's pydantic-core serialization for response_model routes
+app = FastAPI(
+    title="MyCV API",
+    lifespan=lifespan,
+    default_response_class=Default(FastJSONResponse),
+)
+app.add_middleware(CompressionMiddleware)
 
 # Include routers
 app.include_router(users.router)
@@ -37,6 +61,8 @@ app.include_router(profile_router)
 app.include_router(jobs_router)
 app.include_router(photos_router)
 app.include_router(profile_import_router)
+app.include_router(tasks_router)
+app.include_router(search_router)
 
 # Serve static files
 app.mount("/", StaticFiles(directory="public", html=True), name="public")
@@ -0,0 +1,82 @@
+# Lean Code — BSD 3-Clause License — Vivian Voss, 2026
+# Scope: Apply a section batch (create, update, delete, reorder) in one transaction.
+
+import json
+
+from fastapi import HTTPException
+
+from database import VALID_TABLES
+from schemas import SectionBatch
+from services.profile import profile_service
+
+
+def apply_batch(
+    conn,
+    table: str,
+    columns: tuple[str, ...],
+    batch: SectionBatch,
+    entity_name: str,
+    order_column: str | None = None,
+) -> None:
+    """Apply every operation of a batch to ``table`` and commit once.
+
+    All referenced ids are checked up front, so an unknown id fails the
+    whole batch with 404 before anything is written. Deletes run first,
+    then updates, then inserts; with ``order_column`` new rows are
+    appended after the current last position and ``batch.reorder`` is
+    applied last. Each kind of operation is a single ``executemany``.
+    """
+    if table not in VALID_TABLES:
+        raise ValueError(f"Invalid table name: {table}")
+
+    reorder = getattr(batch, "reorder", [])
+    ids = {item.id for item in batch.update} | set(batch.delete) | {item.id for item in reorder}
+    if ids:
+        found = {
+            row[0]
+            for row in conn.execute(
+                f"SELECT id FROM {table} WHERE user_id = 1 AND id IN (SELECT value FROM json_each(?))",
+                (json.dumps(sorted(ids)),),
+            )
+        }
+        missing = sorted(ids - found)
+        if missing:
+            raise HTTPException(
+                status_code=404,
+                detail=f"{entity_name} not found: {', '.join(map(str, missing))}",
+            )
+
+    conn.executemany(f"DELETE FROM {table} WHERE id = ?", [(row_id,) for row_id in batch.delete])
+
+    if batch.update:
+        conn.executemany(
+            f"UPDATE {table} SET {', '.join(f'{column} = ?' for column in columns)}, "
+            f"updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+            [(*_values(item, columns), item.id) for item in batch.update],
+        )
+
+    if batch.create:
+        insert_columns, placeholders = ", ".join(columns), ", ".join("?" for _ in columns)
+        if order_column:
+            insert_columns += f", {order_column}"
+            placeholders += (
+                f", (SELECT COALESCE(MAX({order_column}), -1) + 1 FROM {table} WHERE user_id = 1)"
+            )
+        conn.executemany(
+            f"INSERT INTO {table} ({insert_columns}, user_id) VALUES ({placeholders}, 1)",
+            [_values(item, columns) for item in batch.create],
+        )
+
+    if reorder:
+        conn.executemany(
+            f"UPDATE {table} SET {order_column} = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+            [(item.display_order, item.id) for item in reorder],
+        )
+
+    conn.commit()
+    profile_service.bump_version()
+
+
+def _values(item, columns: tuple[str, ...]) -> tuple:
+    values = item.model_dump(mode="json")
+    return tuple(values[column] for column in columns)
@@ -0,0 +1,67 @@
+# Lean Code — BSD 3-Clause License — Vivian Voss, 2026
+# Scope: Conditional GET for read endpoints — weak ETags from change versions, 304 before the handler runs.
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+
+from fastapi import Depends, HTTPException, Request, Response
+
+from database import get_db
+
+
+def journal(table: str | None = None) -> str:
+    """Version source: the latest profile_changes entry, for one profile table or all of them."""
+    where = f"WHERE table_name = '{table}' " if table else ""
+    return f"SELECT id, changed_at FROM profile_changes {where}ORDER BY id DESC LIMIT 1"
+
+
+def table_version(table: str) -> str:
+    """Version source: the trigger-maintained counter of a non-profile table."""
+    return f"SELECT version, changed_at FROM table_versions WHERE table_name = '{table}'"
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison, as If-None-Match requires."""
+    if not if_none_match:
+        return False
+    etag = etag.removeprefix("W/")
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def _http_date(changed_at: str) -> str:
+    moment = datetime.fromisoformat(changed_at).replace(tzinfo=timezone.utc)
+    return format_datetime(moment, usegmt=True)
+
+
+def conditional(*sources: str):
+    """Dependency answering 304 Not Modified while the client's copy is current.
+
+    Each source is a query returning (version, changed_at). Their versions,
+    with the request path, make a weak ETag; the newest changed_at is sent
+    as Last-Modified. A matching If-None-Match short-circuits the request
+    before the handler loads or serializes anything.
+    """
+
+    def check(request: Request, response: Response):
+        versions, changed = [], []
+        with get_db() as conn:
+            for sql in sources:
+                row = conn.execute(sql).fetchone()
+                versions.append(str(row[0]) if row else "0")
+                if row and row[1]:
+                    changed.append(row[1])
+
+        digest = hashlib.sha1(
+            f"{request.url.path}?{request.url.query}:{'-'.join(versions)}".encode()
+        ).hexdigest()[:20]
+        headers = {"ETag": f'W/"{digest}"', "Cache-Control": "private, no-cache"}
+        if changed:
+            headers["Last-Modified"] = _http_date(max(changed))
+
+        if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
+
+    return Depends(check)
@@ -1,26 +1,34 @@
 from fastapi import APIRouter
 from database import get_db, get_or_404, exists_or_404, fetch_one
-from schemas import Education, EducationCreate, EducationUpdate
+from schemas import Education, EducationCreate, EducationUpdate, EducationBatch
+from routes.batch import apply_batch
+from services.profile import profile_service
+from routes.conditional import conditional, journal
 
 router = APIRouter(prefix="/api/education", tags=["education"])
 
+EDUCATION_COLUMNS = ("institution", "degree", "field_of_study", "graduation_year", "gpa", "notes")
 
-@router.get("", response_model=list[Education])
-async def list_education():
+
+def _list_all(conn) -> list[Education]:
+    cursor = conn.execute(
+        """
+        SELECT * FROM education
+        WHERE user_id = 1
+        ORDER BY graduation_year DESC
+        """
+    )
+    return [Education.model_validate(dict(row)) for row in cursor.fetchall()]
+
+
+@router.get("", response_model=list[Education], dependencies=[conditional(journal("education"))])
+def list_education():
     with get_db() as conn:
-        cursor = conn.execute(
-            """
-            SELECT * FROM education
-            WHERE user_id = 1
-            ORDER BY graduation_year DESC
-            """
-        )
-        rows = cursor.fetchall()
-        return [Education.model_validate(dict(row)) for row in rows]
+        return _list_all(conn)
 
 
 @router.post("", response_model=Education)
-async def create_education(edu: EducationCreate):
+def create_education(edu: EducationCreate):
     with get_db() as conn:
         cursor = conn.execute(
             """
@@ -37,17 +45,25 @@ async def create_education(edu: EducationCreate):
             ),
         )
         conn.commit()
+        profile_service.bump_version()
         return fetch_one(conn, "education", cursor.lastrowid, Education)
 
 
-@router.get("/{edu_id}", response_model=Education)
-async def get_education(edu_id: int):
+@router.patch("/batch", response_model=list[Education])
+def batch_education(batch: EducationBatch):
+    with get_db() as conn:
+        apply_batch(conn, "education", EDUCATION_COLUMNS, batch, "Education")
+        return _list_all(conn)
+
+
+@router.get("/{edu_id}", response_model=Education, dependencies=[conditional(journal("education"))])
+def get_education(edu_id: int):
     with get_db() as conn:
         return get_or_404(conn, "education", edu_id, "Education", Education)
 
 
 @router.put("/{edu_id}", response_model=Education)
-async def update_education(edu_id: int, edu: EducationUpdate):
+def update_education(edu_id: int, edu: EducationUpdate):
     with get_db() as conn:
         exists_or_404(conn, "education", edu_id, "Education")
 
@@ -74,13 +90,15 @@ async def update_education(edu_id: int, edu: EducationUpdate):
             ),
         )
         conn.commit()
+        profile_service.bump_version()
         return fetch_one(conn, "education", edu_id, Education)
 
 
 @router.delete("/{edu_id}")
-async def delete_education(edu_id: int):
+def delete_education(edu_id: int):
     with get_db() as conn:
         exists_or_404(conn, "education", edu_id, "Education")
         conn.execute("DELETE FROM education WHERE id = ?", (edu_id,))
         conn.commit()
+        profile_service.bump_version()
         return {"deleted": edu_id}
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Response
+
+import settings
 from schemas import (
     JobCreate,
     JobUpdate,
@@ -7,29 +9,44 @@ from schemas import (
     JobVersion,
     ResumeHistoryItem,
 )
-from services.jobs import job_service
+from services.jobs import async_job_service
+from routes.conditional import conditional, table_version
 
 router = APIRouter(prefix="/api/jobs", tags=["jobs"])
 
-
-@router.get("", response_model=list[JobListItem])
-async def list_jobs():
-    """List all saved jobs with preview and resume count"""
-    jobs = job_service.list_all()
+# Job reads include resume counts, so resume writes invalidate them too
+_jobs_conditional = conditional(table_version("jobs"), table_version("generated_resumes"))
+
+
+@router.get("", response_model=list[JobListItem], dependencies=[_jobs_conditional])
+async def list_jobs(
+    response: Response,
+    limit: int = Query(default=settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: str | None = None,
+    title: str | None = None,
+    company: str | None = None,
+):
+    """List a page of saved jobs with preview and resume count; X-Next-Cursor points at the next page"""
+    try:
+        jobs, next_cursor = await async_job_service.list_page(limit, cursor, title, company)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return [JobListItem.model_validate(job) for job in jobs]
 
 
 @router.post("", response_model=JobResponse, status_code=201)
 async def create_job(request: JobCreate):
     """Save new job independently"""
-    job = job_service.create(request.original_text)
+    job = await async_job_service.create(request.original_text)
     return JobResponse.model_validate(job)
 
 
-@router.get("/{job_id}", response_model=JobResponse)
+@router.get("/{job_id}", response_model=JobResponse, dependencies=[_jobs_conditional])
 async def get_job(job_id: int):
     """Get single job"""
-    job = job_service.get(job_id)
+    job = await async_job_service.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     return JobResponse.model_validate(job)
@@ -39,7 +56,7 @@ async def get_job(job_id: int):
 async def update_job(job_id: int, request: JobUpdate):
     """Update job title or text"""
     data = request.model_dump(exclude_unset=True)
-    job = job_service.update(job_id, data)
+    job = await async_job_service.update(job_id, data)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     return JobResponse.model_validate(job)
@@ -48,36 +65,36 @@ async def update_job(job_id: int, request: JobUpdate):
 @router.delete("/{job_id}", status_code=204)
 async def delete_job(job_id: int):
     """Delete job and linked resumes"""
-    deleted = job_service.delete(job_id)
+    deleted = await async_job_service.delete(job_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Job not found")
     return None
 
 
-@router.get("/{job_id}/resumes", response_model=list[ResumeHistoryItem])
+@router.get("/{job_id}/resumes", response_model=list[ResumeHistoryItem], dependencies=[_jobs_conditional])
 async def get_job_resumes(job_id: int):
     """Get resumes linked to job"""
-    job = job_service.get(job_id)
+    job = await async_job_service.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    resumes = job_service.get_resumes(job_id)
+    resumes = await async_job_service.get_resumes(job_id)
     return [ResumeHistoryItem.model_validate(r) for r in resumes]
 
 
-@router.get("/{job_id}/versions", response_model=list[JobVersion])
+@router.get("/{job_id}/versions", response_model=list[JobVersion], dependencies=[conditional(table_version("jobs"), table_version("job_versions"))])
 async def get_job_versions(job_id: int):
     """Get version history"""
-    job = job_service.get(job_id)
+    job = await async_job_service.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    versions = job_service.get_versions(job_id)
+    versions = await async_job_service.get_versions(job_id)
     return [JobVersion.model_validate(v) for v in versions]
 
 
 @router.post("/{job_id}/versions/{version_id}/restore", response_model=JobResponse)
 async def restore_job_version(job_id: int, version_id: int):
     """Restore previous version"""
-    job = job_service.restore_version(job_id, version_id)
+    job = await async_job_service.restore_version(job_id, version_id)
     if not job:
         raise HTTPException(status_code=404, detail="Version not found")
     return JobResponse.model_validate(job)
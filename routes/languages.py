@@ -1,32 +1,34 @@
 from fastapi import APIRouter
-from pydantic import BaseModel
 from database import get_db, get_or_404, exists_or_404, fetch_one
-from schemas import Language, LanguageCreate, LanguageUpdate
+from schemas import Language, LanguageCreate, LanguageUpdate, LanguageBatch, LanguageOrder
+from routes.batch import apply_batch
+from services.profile import profile_service
+from routes.conditional import conditional, journal
 
 router = APIRouter(prefix="/api/languages", tags=["languages"])
 
+LANGUAGES_COLUMNS = ("name", "level")
 
-class ReorderItem(BaseModel):
-    id: int
-    display_order: int
 
+def _list_all(conn) -> list[Language]:
+    cursor = conn.execute(
+        """
+        SELECT * FROM languages
+        WHERE user_id = 1
+        ORDER BY display_order ASC, id ASC
+        """
+    )
+    return [Language.model_validate(dict(row)) for row in cursor.fetchall()]
 
-@router.get("", response_model=list[Language])
-async def list_languages():
+
+@router.get("", response_model=list[Language], dependencies=[conditional(journal("languages"))])
+def list_languages():
     with get_db() as conn:
-        cursor = conn.execute(
-            """
-            SELECT * FROM languages
-            WHERE user_id = 1
-            ORDER BY display_order ASC, id ASC
-            """
-        )
-        rows = cursor.fetchall()
-        return [Language.model_validate(dict(row)) for row in rows]
+        return _list_all(conn)
 
 
 @router.post("", response_model=Language)
-async def create_language(lang: LanguageCreate):
+def create_language(lang: LanguageCreate):
     with get_db() as conn:
         cursor = conn.execute(
             "SELECT COALESCE(MAX(display_order), -1) + 1 FROM languages WHERE user_id = 1"
@@ -41,11 +43,12 @@ async def create_language(lang: LanguageCreate):
             (lang.name, lang.level.value, next_order),
         )
         conn.commit()
+        profile_service.bump_version()
         return fetch_one(conn, "languages", cursor.lastrowid, Language)
 
 
 @router.put("/reorder", response_model=list[Language])
-async def reorder_languages(items: list[ReorderItem]):
+def reorder_languages(items: list[LanguageOrder]):
     with get_db() as conn:
         for item in items:
             conn.execute(
@@ -53,26 +56,26 @@ async def reorder_languages(items: list[ReorderItem]):
                 (item.display_order, item.id),
             )
         conn.commit()
+        profile_service.bump_version()
 
-        cursor = conn.execute(
-            """
-            SELECT * FROM languages
-            WHERE user_id = 1
-            ORDER BY display_order ASC, id ASC
-            """
-        )
-        rows = cursor.fetchall()
-        return [Language.model_validate(dict(row)) for row in rows]
+        return _list_all(conn)
+
+
+@router.patch("/batch", response_model=list[Language])
+def batch_languages(batch: LanguageBatch):
+    with get_db() as conn:
+        apply_batch(conn, "languages", LANGUAGES_COLUMNS, batch, "Language", order_column="display_order")
+        return _list_all(conn)
 
 
-@router.get("/{lang_id}", response_model=Language)
-async def get_language(lang_id: int):
+@router.get("/{lang_id}", response_model=Language, dependencies=[conditional(journal("languages"))])
+def get_language(lang_id: int):
     with get_db() as conn:
         return get_or_404(conn, "languages", lang_id, "Language", Language)
 
 
 @router.put("/{lang_id}", response_model=Language)
-async def update_language(lang_id: int, lang: LanguageUpdate):
+def update_language(lang_id: int, lang: LanguageUpdate):
     with get_db() as conn:
         exists_or_404(conn, "languages", lang_id, "Language")
 
@@ -87,13 +90,15 @@ async def update_language(lang_id: int, lang: LanguageUpdate):
             (lang.name, lang.level.value, lang_id),
         )
         conn.commit()
+        profile_service.bump_version()
         return fetch_one(conn, "languages", lang_id, Language)
 
 
 @router.delete("/{lang_id}")
-async def delete_language(lang_id: int):
+def delete_language(lang_id: int):
     with get_db() as conn:
         exists_or_404(conn, "languages", lang_id, "Language")
         conn.execute("DELETE FROM languages WHERE id = ?", (lang_id,))
         conn.commit()
+        profile_service.bump_version()
         return {"deleted": lang_id}
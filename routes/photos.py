@@ -1,46 +1,66 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Response
 from database import get_db
 from schemas import PhotoUpload, PhotoResponse
+from services.photo_store import photo_store
+from services.profile import profile_service
+from routes.conditional import conditional, journal, etag_matches
 
 router = APIRouter(prefix="/api/photos", tags=["photos"])
 
+# A hash names exactly one image, so clients may keep it forever.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
 
-@router.get("", response_model=PhotoResponse | None)
+
+def _photo_response(photo_ref: str | None, thumb_ref: str | None) -> PhotoResponse | None:
+    image_data = photo_store.data_url(photo_ref)
+    if image_data is None:
+        return None
+    return PhotoResponse(
+        image_data=image_data,
+        photo_ref=photo_ref,
+        thumbnail_url=f"/api/photos/{thumb_ref or photo_ref}",
+    )
+
+
+@router.get("", response_model=PhotoResponse | None, dependencies=[conditional(journal("users"))])
 def get_photo():
-    """Get the current photo data URL."""
-    with get_db() as conn:
-        row = conn.execute("SELECT photo FROM users WHERE id = 1").fetchone()
-        if not row or not row["photo"]:
-            return None
-        return PhotoResponse(image_data=row["photo"])
+    """Get the current print-size photo data URL."""
+    return _photo_response(*photo_store.get_user_photo_refs())
+
+
+@router.get("/{photo_hash}")
+def get_photo_blob(photo_hash: str, if_none_match: str | None = Header(default=None)):
+    """Serve stored photo bytes by content hash."""
+    headers = {"Cache-Control": IMMUTABLE_CACHE_CONTROL, "ETag": f'"{photo_hash}"'}
+    if etag_matches(if_none_match, headers["ETag"]) and photo_store.exists(photo_hash):
+        return Response(status_code=304, headers=headers)
+    blob = photo_store.get(photo_hash)
+    if blob is None:
+        raise HTTPException(404, "Photo not found")
+    mime_type, data = blob
+    return Response(content=data, media_type=mime_type, headers=headers)
 
 
 @router.put("", response_model=PhotoResponse)
 def upload_photo(photo: PhotoUpload):
-    """Upload or replace photo."""
+    """Upload or replace photo, stored as normalized print and thumbnail variants."""
     with get_db() as conn:
         # Check if user exists
         row = conn.execute("SELECT id FROM users WHERE id = 1").fetchone()
         if not row:
             raise HTTPException(400, "Personal info must be created first")
 
-        conn.execute(
-            "UPDATE users SET photo = ?, updated_at = CURRENT_TIMESTAMP WHERE id = 1",
-            (photo.image_data,),
-        )
-        conn.commit()
-        return PhotoResponse(image_data=photo.image_data)
+    try:
+        refs = photo_store.set_user_photo(photo.image_data)
+    except ValueError as e:
+        raise HTTPException(422, str(e))
+    profile_service.bump_version()
+    return _photo_response(*refs)
 
 
 @router.delete("", status_code=204)
 def delete_photo():
     """Delete photo."""
-    with get_db() as conn:
-        row = conn.execute("SELECT photo FROM users WHERE id = 1").fetchone()
-        if not row or not row["photo"]:
-            raise HTTPException(404, "Photo not found")
-
-        conn.execute(
-            "UPDATE users SET photo = NULL, updated_at = CURRENT_TIMESTAMP WHERE id = 1"
-        )
-        conn.commit()
+    if not photo_store.clear_user_photo():
+        raise HTTPException(404, "Photo not found")
+    profile_service.bump_version()
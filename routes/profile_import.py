@@ -1,152 +1,159 @@
 import logging
-from fastapi import APIRouter, HTTPException
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, Query
 from database import get_db
 from schemas import ProfileImport, ProfileImportResponse
+from services.profile import profile_service
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/profile", tags=["profile-import"])
 
+# Per section: (columns written, columns identifying an entry when merging)
+SECTIONS = {
+    "work_experiences": (
+        ("company", "title", "start_date", "end_date", "is_current", "description", "location"),
+        ("company", "title", "start_date"),
+    ),
+    "education": (
+        ("institution", "degree", "field_of_study", "graduation_year", "gpa", "notes"),
+        ("institution", "degree"),
+    ),
+    "skills": (("name",), ("name",)),
+    "projects": (
+        ("name", "description", "technologies", "url", "start_date", "end_date"),
+        ("name",),
+    ),
+    "languages": (("name", "level", "display_order"), ("name",)),
+}
+
+# Skills are unique per user; a duplicate in the import is skipped, not an error
+_ON_CONFLICT = {"skills": " ON CONFLICT(user_id, name) DO NOTHING"}
+
+
+def _section_rows(profile: ProfileImport, section: str) -> list[tuple]:
+    columns = SECTIONS[section][0]
+    rows = []
+    for index, entry in enumerate(getattr(profile, section)):
+        values = entry.model_dump(mode="json")
+        if section == "work_experiences":
+            values["is_current"] = 1 if entry.is_current else 0
+        elif section == "languages":
+            values["display_order"] = index
+        rows.append(tuple(values[column] for column in columns))
+    return rows
+
+
+def _insert_rows(conn, section: str, rows: list[tuple]) -> int:
+    columns = SECTIONS[section][0]
+    return conn.executemany(
+        f"INSERT INTO {section} ({', '.join(columns)}, user_id) "
+        f"VALUES ({', '.join('?' for _ in columns)}, 1){_ON_CONFLICT.get(section, '')}",
+        rows,
+    ).rowcount
+
+
+def _replace_section(conn, section: str, rows: list[tuple]) -> dict[str, int]:
+    deleted = conn.execute(f"DELETE FROM {section} WHERE user_id = 1").rowcount
+    inserted = _insert_rows(conn, section, rows)
+    return {"inserted": inserted, "updated": 0, "deleted": deleted, "unchanged": 0}
+
+
+def _merge_section(conn, section: str, rows: list[tuple]) -> dict[str, int]:
+    """Diff the incoming rows against the stored ones, keeping matched ids.
+
+    An incoming row matches the oldest unmatched stored row with the same
+    key columns; it is updated only if another column differs. Unmatched
+    incoming rows are inserted and unmatched stored rows deleted, so the
+    section ends up exactly as imported.
+    """
+    columns, key_columns = SECTIONS[section]
+    key_positions = [columns.index(column) for column in key_columns]
+
+    stored: dict[tuple, list[tuple]] = {}
+    for row in conn.execute(
+        f"SELECT id, {', '.join(columns)} FROM {section} WHERE user_id = 1 ORDER BY id"
+    ).fetchall():
+        values = tuple(row)[1:]
+        stored.setdefault(tuple(values[i] for i in key_positions), []).append((row["id"], values))
+
+    inserts, updates, unchanged = [], [], 0
+    for values in rows:
+        matches = stored.get(tuple(values[i] for i in key_positions))
+        if not matches:
+            inserts.append(values)
+            continue
+        row_id, current = matches.pop(0)
+        if current == values:
+            unchanged += 1
+        else:
+            updates.append((*values, row_id))
+    deletes = [(row_id,) for matches in stored.values() for row_id, _ in matches]
+
+    conn.executemany(f"DELETE FROM {section} WHERE id = ?", deletes)
+    if updates:
+        touched = ", updated_at = CURRENT_TIMESTAMP" if section != "skills" else ""
+        conn.executemany(
+            f"UPDATE {section} SET {', '.join(f'{column} = ?' for column in columns)}{touched} WHERE id = ?",
+            updates,
+        )
+    inserted = _insert_rows(conn, section, inserts)
+    return {"inserted": inserted, "updated": len(updates), "deleted": len(deletes), "unchanged": unchanged}
+
 
 @router.put("/import", response_model=ProfileImportResponse)
-async def import_profile(profile: ProfileImport):
-    """Import complete profile from JSON, replacing all existing data except photo."""
+def import_profile(
+    profile: ProfileImport,
+    mode: Literal["replace", "merge"] = Query(default="replace"),
+):
+    """Import complete profile from JSON, replacing all existing data except photo.
+
+    ``mode=replace`` deletes and re-inserts every entry. ``mode=merge`` ends
+    in the same data but keeps the ids of entries that are still present,
+    touching only rows that changed.
+    """
+    apply_section = _merge_section if mode == "merge" else _replace_section
+    personal_info = profile.personal_info
     try:
         with get_db() as conn:
-            # 1. Clear existing data for user_id=1 (except photo)
-            conn.execute("DELETE FROM work_experiences WHERE user_id = 1")
-            conn.execute("DELETE FROM education WHERE user_id = 1")
-            conn.execute("DELETE FROM skills WHERE user_id = 1")
-            conn.execute("DELETE FROM projects WHERE user_id = 1")
-            conn.execute("DELETE FROM languages WHERE user_id = 1")
-
-            # 2. Update or insert user (preserve photo column)
-            cursor = conn.execute("SELECT id, photo FROM users WHERE id = 1")
-            row = cursor.fetchone()
-
-            if row:
-                conn.execute(
-                    """
-                    UPDATE users SET
-                        full_name = ?,
-                        email = ?,
-                        phone = ?,
-                        location = ?,
-                        linkedin_url = ?,
-                        summary = ?,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE id = 1
-                    """,
-                    (
-                        profile.personal_info.full_name,
-                        profile.personal_info.email,
-                        profile.personal_info.phone,
-                        profile.personal_info.location,
-                        profile.personal_info.linkedin_url,
-                        profile.personal_info.summary,
-                    ),
-                )
-            else:
-                conn.execute(
-                    """
-                    INSERT INTO users (id, full_name, email, phone, location, linkedin_url, summary)
-                    VALUES (1, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        profile.personal_info.full_name,
-                        profile.personal_info.email,
-                        profile.personal_info.phone,
-                        profile.personal_info.location,
-                        profile.personal_info.linkedin_url,
-                        profile.personal_info.summary,
-                    ),
-                )
-
-            # 3. Insert work experiences
-            for exp in profile.work_experiences:
-                conn.execute(
-                    """
-                    INSERT INTO work_experiences (company, title, start_date, end_date, is_current, description, location, user_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, 1)
-                    """,
-                    (
-                        exp.company,
-                        exp.title,
-                        exp.start_date,
-                        exp.end_date,
-                        1 if exp.is_current else 0,
-                        exp.description,
-                        exp.location,
-                    ),
-                )
-
-            # 4. Insert education
-            for edu in profile.education:
-                conn.execute(
-                    """
-                    INSERT INTO education (institution, degree, field_of_study, graduation_year, gpa, notes, user_id)
-                    VALUES (?, ?, ?, ?, ?, ?, 1)
-                    """,
-                    (
-                        edu.institution,
-                        edu.degree,
-                        edu.field_of_study,
-                        edu.graduation_year,
-                        edu.gpa,
-                        edu.notes,
-                    ),
-                )
-
-            # 5. Insert skills
-            for skill in profile.skills:
-                try:
-                    conn.execute(
-                        "INSERT INTO skills (name, user_id) VALUES (?, 1)",
-                        (skill.name,),
-                    )
-                except Exception:
-                    # Skill might already exist (UNIQUE constraint)
-                    pass
-
-            # 6. Insert projects
-            for project in profile.projects:
-                conn.execute(
-                    """
-                    INSERT INTO projects (name, description, technologies, url, start_date, end_date, user_id)
-                    VALUES (?, ?, ?, ?, ?, ?, 1)
-                    """,
-                    (
-                        project.name,
-                        project.description,
-                        project.technologies,
-                        project.url,
-                        project.start_date,
-                        project.end_date,
-                    ),
-                )
-
-            # 7. Insert languages
-            for idx, lang in enumerate(profile.languages):
-                conn.execute(
-                    """
-                    INSERT INTO languages (name, level, display_order, user_id)
-                    VALUES (?, ?, ?, 1)
-                    """,
-                    (lang.name, lang.level.value, idx),
-                )
-
-            # 8. Commit (all or nothing)
+            # Update or insert user (preserve photo columns)
+            conn.execute(
+                """
+                INSERT INTO users (id, full_name, email, phone, location, linkedin_url, summary)
+                VALUES (1, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    full_name = excluded.full_name,
+                    email = excluded.email,
+                    phone = excluded.phone,
+                    location = excluded.location,
+                    linkedin_url = excluded.linkedin_url,
+                    summary = excluded.summary,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (
+                    personal_info.full_name,
+                    personal_info.email,
+                    personal_info.phone,
+                    personal_info.location,
+                    personal_info.linkedin_url,
+                    personal_info.summary,
+                ),
+            )
+
+            changes = {
+                section: apply_section(conn, section, _section_rows(profile, section))
+                for section in SECTIONS
+            }
+
+            # Commit (all or nothing)
             conn.commit()
+            profile_service.bump_version()
 
             return ProfileImportResponse(
                 message="Profile imported successfully",
-                counts={
-                    "work_experiences": len(profile.work_experiences),
-                    "education": len(profile.education),
-                    "skills": len(profile.skills),
-                    "projects": len(profile.projects),
-                    "languages": len(profile.languages),
-                },
+                counts={section: len(getattr(profile, section)) for section in SECTIONS},
+                changes=changes,
             )
 
     except Exception as e:
@@ -1,26 +1,34 @@
 from fastapi import APIRouter
 from database import get_db, get_or_404, exists_or_404, fetch_one
-from schemas import Project, ProjectCreate, ProjectUpdate
+from schemas import Project, ProjectCreate, ProjectUpdate, ProjectBatch
+from routes.batch import apply_batch
+from services.profile import profile_service
+from routes.conditional import conditional, journal
 
 router = APIRouter(prefix="/api/projects", tags=["projects"])
 
+PROJECTS_COLUMNS = ("name", "description", "technologies", "url", "start_date", "end_date")
 
-@router.get("", response_model=list[Project])
-async def list_projects():
+
+def _list_all(conn) -> list[Project]:
+    cursor = conn.execute(
+        """
+        SELECT * FROM projects
+        WHERE user_id = 1
+        ORDER BY created_at DESC
+        """
+    )
+    return [Project.model_validate(dict(row)) for row in cursor.fetchall()]
+
+
+@router.get("", response_model=list[Project], dependencies=[conditional(journal("projects"))])
+def list_projects():
     with get_db() as conn:
-        cursor = conn.execute(
-            """
-            SELECT * FROM projects
-            WHERE user_id = 1
-            ORDER BY created_at DESC
-            """
-        )
-        rows = cursor.fetchall()
-        return [Project.model_validate(dict(row)) for row in rows]
+        return _list_all(conn)
 
 
 @router.post("", response_model=Project)
-async def create_project(proj: ProjectCreate):
+def create_project(proj: ProjectCreate):
     with get_db() as conn:
         cursor = conn.execute(
             """
@@ -37,17 +45,25 @@ async def create_project(proj: ProjectCreate):
             ),
         )
         conn.commit()
+        profile_service.bump_version()
         return fetch_one(conn, "projects", cursor.lastrowid, Project)
 
 
-@router.get("/{proj_id}", response_model=Project)
-async def get_project(proj_id: int):
+@router.patch("/batch", response_model=list[Project])
+def batch_projects(batch: ProjectBatch):
+    with get_db() as conn:
+        apply_batch(conn, "projects", PROJECTS_COLUMNS, batch, "Project")
+        return _list_all(conn)
+
+
+@router.get("/{proj_id}", response_model=Project, dependencies=[conditional(journal("projects"))])
+def get_project(proj_id: int):
     with get_db() as conn:
         return get_or_404(conn, "projects", proj_id, "Project", Project)
 
 
 @router.put("/{proj_id}", response_model=Project)
-async def update_project(proj_id: int, proj: ProjectUpdate):
+def update_project(proj_id: int, proj: ProjectUpdate):
     with get_db() as conn:
         exists_or_404(conn, "projects", proj_id, "Project")
 
@@ -74,13 +90,15 @@ async def update_project(proj_id: int, proj: ProjectUpdate):
             ),
         )
         conn.commit()
+        profile_service.bump_version()
         return fetch_one(conn, "projects", proj_id, Project)
 
 
 @router.delete("/{proj_id}")
-async def delete_project(proj_id: int):
+def delete_project(proj_id: int):
     with get_db() as conn:
         exists_or_404(conn, "projects", proj_id, "Project")
         conn.execute("DELETE FROM projects WHERE id = ?", (proj_id,))
         conn.commit()
+        profile_service.bump_version()
         return {"deleted": proj_id}
@@ -0,0 +1,145 @@
+# Lean Code — BSD 3-Clause License — Vivian Voss, 2026
+# Scope: Response encoding — fast JSON rendering and gzip/brotli compression above a size threshold.
+
+import zlib
+from typing import Any
+
+import brotli
+import orjson
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+
+import settings
+
+# Formats that are compressed already; re-compressing them only costs CPU
+_PRECOMPRESSED_TYPES = ("image/", "video/", "audio/", "application/pdf", "application/zip", "font/woff")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON with orjson."""
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered by orjson.
+
+    Installed as ``Default(FastJSONResponse)`` so routes with a response_model
+    keep FastAPI's own pydantic-core serialization; this class renders the
+    rest (plain dicts and lists).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def _accepted(accept_encoding: str) -> set[str]:
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, *params = [item.strip() for item in part.split(";")]
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding and q > 0:
+            accepted.add(coding.lower())
+    return accepted
+
+
+def negotiate(accept_encoding: str, encodings: tuple[str, ...] | None = None) -> str | None:
+    """Pick the first configured encoding the client accepts, or None."""
+    accepted = _accepted(accept_encoding)
+    for encoding in encodings if encodings is not None else settings.COMPRESSION_ENCODINGS:
+        if encoding in accepted or "*" in accepted:
+            return encoding
+    return None
+
+
+class _Encoder:
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+            self.compress, self._finish = self._compressor.process, self._compressor.finish
+        else:
+            self._compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+            self.compress, self._finish = self._compressor.compress, self._compressor.flush
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+
+class CompressionMiddleware:
+    """Compress response bodies of at least COMPRESSION_MIN_SIZE bytes.
+
+    Brotli is preferred when accepted, gzip otherwise.
+    Responses that already carry a Content-Encoding, are compressed
+    formats (images, PDFs, zips) or are event streams pass through
+    untouched. Streamed bodies are compressed chunk by chunk.
+    """
+
+    def __init__(self, app, minimum_size: int | None = None):
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+        encoder = None
+
+        async def send_compressed(message):
+            nonlocal start, encoder
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body, more_body = message.get("body", b""), message.get("more_body", False)
+            if start is not None:
+                pending, start = start, None
+                headers = MutableHeaders(raw=pending["headers"])
+                if not self._compressible(headers) or (not more_body and len(body) < self.minimum_size):
+                    await send(pending)
+                    await send(message)
+                    return
+                encoder = _Encoder(encoding)
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                del headers["Content-Length"]
+                if not more_body:
+                    body = encoder.compress(body) + encoder.finish()
+                    headers["Content-Length"] = str(len(body))
+                    await send(pending)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                await send(pending)
+
+            if encoder is None:
+                await send(message)
+                return
+            chunk = encoder.compress(body)
+            if not more_body:
+                chunk += encoder.finish()
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
+
+    @staticmethod
+    def _compressible(headers: MutableHeaders) -> bool:
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        if content_type.startswith("text/event-stream"):
+            return False
+        return not content_type.startswith(_PRECOMPRESSED_TYPES)
@@ -1,16 +1,29 @@
+import json
 import logging
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import Response
+import settings
+from fastapi import APIRouter, HTTPException, Query, Header
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from schemas import (
     ResumeGenerateRequest,
     GeneratedResumeResponse,
+    GenerationTask,
+    GenerationBatch,
+    ResumeBulkGenerateRequest,
     ResumeHistoryItem,
     ResumeUpdateRequest,
+    PdfBatchRequest,
     CompleteProfile,
 )
-from services.resume_generator import resume_generator_service, ProfileIncompleteError
-from services.profile import profile_service
-from services.pdf_generator import pdf_generator_service
+from database import run_in_db
+from services.resume_generator import (
+    resume_generator_service,
+    async_resume_generator_service,
+    ProfileIncompleteError,
+)
+from services.generation_queue import generation_queue
+from services.profile import async_profile_service
+from services.pdf_generator import pdf_generator_service, PdfQueueFullError, stream_zip
+from routes.conditional import conditional, etag_matches, journal, table_version
 
 logger = logging.getLogger(__name__)
 
@@ -18,12 +31,29 @@ router = APIRouter(prefix="/api/resumes", tags=["resumes"])
 
 
 @router.post("/generate", response_model=GeneratedResumeResponse)
-async def generate_resume(request: ResumeGenerateRequest):
+async def generate_resume(
+    request: ResumeGenerateRequest,
+    run_async: bool = Query(default=False, alias="async"),
+):
+    if run_async:
+        task = await generation_queue.submit(
+            request.job_description,
+            request.job_id,
+            request.language,
+            bypass_cache=request.bypass_cache,
+        )
+        return JSONResponse(
+            status_code=202,
+            content=GenerationTask.model_validate(task).model_dump(),
+            headers={"Location": f"/api/tasks/{task['id']}"},
+        )
+
     try:
         result = await resume_generator_service.generate(
             request.job_description,
             request.job_id,
-            request.language
+            request.language,
+            bypass_cache=request.bypass_cache,
         )
         return result
     except ProfileIncompleteError as e:
@@ -42,15 +72,91 @@ async def generate_resume(request: ResumeGenerateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("", response_model=list[ResumeHistoryItem])
-async def list_resumes():
-    history = resume_generator_service.get_history()
+@router.post("/generate/bulk", response_model=GenerationBatch, status_code=202)
+async def generate_resumes_bulk(request: ResumeBulkGenerateRequest):
+    """Queue a tailored resume for each saved job; poll the batch for progress."""
+    try:
+        batch = await generation_queue.submit_bulk(
+            request.job_ids,
+            request.language,
+            bypass_cache=request.bypass_cache,
+        )
+    except (ProfileIncompleteError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return GenerationBatch.model_validate(batch)
+
+
+@router.get("/generate/bulk/{batch_id}", response_model=GenerationBatch)
+async def get_bulk_generation(batch_id: int):
+    batch = await run_in_db(generation_queue.get_batch, batch_id)
+    if batch is None:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    return GenerationBatch.model_validate(batch)
+
+
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.post("/generate/stream")
+async def generate_resume_stream(request: ResumeGenerateRequest):
+    """Generate a resume as server-sent events.
+
+    Fields are sent as soon as the model completes them; the last event is
+    "resume" with the saved record, or "error" if generation failed midway.
+    """
+    try:
+        events = await resume_generator_service.generate_stream(
+            request.job_description,
+            request.job_id,
+            request.language,
+            bypass_cache=request.bypass_cache,
+        )
+    except (ProfileIncompleteError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def body():
+        try:
+            async for event, data in events:
+                yield _sse(event, data)
+        except Exception as e:
+            logger.error(f"Error streaming resume generation: {type(e).__name__}: {e}")
+            yield _sse("error", {"detail": str(e)})
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("", response_model=list[ResumeHistoryItem], dependencies=[conditional(table_version("generated_resumes"))])
+async def list_resumes(
+    response: Response,
+    limit: int = Query(default=settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: str | None = None,
+    title: str | None = None,
+    company: str | None = None,
+):
+    try:
+        history, next_cursor = await async_resume_generator_service.get_history_page(
+            limit, cursor, title, company
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return [ResumeHistoryItem.model_validate(item) for item in history]
 
 
-@router.get("/{resume_id}", response_model=GeneratedResumeResponse)
+# A resume without its own photo_ref shows the user's current photo
+@router.get(
+    "/{resume_id}",
+    response_model=GeneratedResumeResponse,
+    dependencies=[conditional(table_version("generated_resumes"), journal("users"))],
+)
 async def get_resume(resume_id: int):
-    resume = resume_generator_service.get_resume(resume_id)
+    resume = await async_resume_generator_service.get_resume(resume_id)
     if resume is None:
         raise HTTPException(status_code=404, detail="Resume not found")
     return resume
@@ -58,7 +164,7 @@ async def get_resume(resume_id: int):
 
 @router.put("/{resume_id}", response_model=GeneratedResumeResponse)
 async def update_resume(resume_id: int, request: ResumeUpdateRequest):
-    resume = resume_generator_service.update_resume(resume_id, request.resume)
+    resume = await async_resume_generator_service.update_resume(resume_id, request.resume)
     if resume is None:
         raise HTTPException(status_code=404, detail="Resume not found")
     return resume
@@ -66,33 +172,43 @@ async def update_resume(resume_id: int, request: ResumeUpdateRequest):
 
 @router.delete("/{resume_id}", status_code=204)
 async def delete_resume(resume_id: int):
-    deleted = resume_generator_service.delete_resume(resume_id)
+    deleted = await async_resume_generator_service.delete_resume(resume_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Resume not found")
     return None
 
 
 @router.get("/{resume_id}/pdf")
-def export_resume_pdf(
+async def export_resume_pdf(
     resume_id: int,
     template: str = Query(default="classic", pattern="^(classic|modern|brussels|eu_classic)$"),
-    language: str = Query(default="en", pattern="^(en|fr|nl)$")
+    language: str = Query(default="en", pattern="^(en|fr|nl)$"),
+    if_none_match: str | None = Header(default=None),
 ):
-    resume = resume_generator_service.get_resume(resume_id)
+    resume = await async_resume_generator_service.get_resume(resume_id)
     if resume is None:
         raise HTTPException(status_code=404, detail="Resume not found")
 
     # Use the language from the resume if not explicitly provided, or use the query param
     pdf_language = language if language else resume.language
+    resume_data = resume.resume.model_dump() if resume.resume else {}
 
     try:
-        pdf_bytes = pdf_generator_service.generate_pdf(
-            resume.resume.model_dump() if resume.resume else {},
+        prepared = pdf_generator_service.prepare_render(resume_data, template, pdf_language)
+        etag = f'"{prepared[1]}"'
+        cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=cache_headers)
+
+        pdf_bytes = await pdf_generator_service.generate_pdf_async(
+            resume_data,
             template,
-            pdf_language
+            pdf_language,
+            resume_id=resume_id,
+            prepared=prepared,
         )
         filename = pdf_generator_service.generate_filename(
-            resume.resume.model_dump() if resume.resume else {},
+            resume_data,
             resume.company_name
         )
 
@@ -100,9 +216,16 @@ def export_resume_pdf(
             content=pdf_bytes,
             media_type="application/pdf",
             headers={
-                "Content-Disposition": f'attachment; filename="{filename}"'
+                "Content-Disposition": f'attachment; filename="{filename}"',
+                **cache_headers,
             }
         )
+    except PdfQueueFullError as e:
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -110,9 +233,44 @@ def export_resume_pdf(
         raise HTTPException(status_code=500, detail=f"Could not generate PDF: {type(e).__name__}: {e}")
 
 
+@router.post("/{resume_id}/pdf/batch")
+async def export_resume_pdf_batch(resume_id: int, request: PdfBatchRequest):
+    resume = await async_resume_generator_service.get_resume(resume_id)
+    if resume is None:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    resume_data = resume.resume.model_dump() if resume.resume else {}
+    variants = list(dict.fromkeys((v.template, v.language) for v in request.variants))
+
+    try:
+        pdfs = await pdf_generator_service.generate_pdf_batch(resume_data, variants, resume_id=resume_id)
+    except PdfQueueFullError as e:
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception("Batch PDF generation failed")
+        raise HTTPException(status_code=500, detail=f"Could not generate PDF: {type(e).__name__}: {e}")
+
+    stem = pdf_generator_service.generate_filename(resume_data, resume.company_name).removesuffix(".pdf")
+    entries = [
+        (f"{stem}_{template}_{language}.pdf", pdf_bytes)
+        for (template, language), pdf_bytes in zip(variants, pdfs)
+    ]
+    return StreamingResponse(
+        stream_zip(entries),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{stem}.zip"'},
+    )
+
+
 profile_router = APIRouter(prefix="/api/profile", tags=["profile"])
 
 
-@profile_router.get("/complete", response_model=CompleteProfile)
+@profile_router.get("/complete", response_model=CompleteProfile, dependencies=[conditional(journal())])
 async def get_complete_profile():
-    return profile_service.get_complete()
+    return await async_profile_service.get_complete()
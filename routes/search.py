@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Query
+
+import settings
+from schemas import SearchResult
+from services.search import async_search_service
+from routes.conditional import conditional, table_version
+
+router = APIRouter(prefix="/api/search", tags=["search"])
+
+
+@router.get(
+    "",
+    response_model=list[SearchResult],
+    dependencies=[
+        conditional(table_version("jobs"), table_version("job_versions"), table_version("generated_resumes"))
+    ],
+)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(default=20, ge=1, le=settings.PAGE_SIZE_MAX),
+):
+    """Full-text search over saved jobs, their earlier versions and generated resumes, best match first"""
+    return await async_search_service.search(q, limit)
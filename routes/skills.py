@@ -1,13 +1,15 @@
-import sqlite3
-from fastapi import APIRouter, HTTPException
+import json
+from fastapi import APIRouter
 from database import get_db, exists_or_404
 from schemas import Skill, SkillCreate
+from services.profile import profile_service
+from routes.conditional import conditional, journal
 
 router = APIRouter(prefix="/api/skills", tags=["skills"])
 
 
-@router.get("", response_model=list[Skill])
-async def list_skills():
+@router.get("", response_model=list[Skill], dependencies=[conditional(journal("skills"))])
+def list_skills():
     with get_db() as conn:
         cursor = conn.execute(
             """
@@ -20,41 +22,54 @@ async def list_skills():
         return [Skill.model_validate(dict(row)) for row in rows]
 
 
+def normalize_skill_names(raw: str) -> list[str]:
+    """Split a comma list, collapse whitespace and drop case-insensitive repeats, keeping first spellings."""
+    names = {}
+    for part in raw.split(","):
+        name = " ".join(part.split())
+        if name:
+            names.setdefault(name.casefold(), name)
+    return list(names.values())
+
+
 @router.post("", response_model=list[Skill])
-async def create_skills(skill_input: SkillCreate):
-    names = [name.strip() for name in skill_input.names.split(",") if name.strip()]
-    created_skills = []
+def create_skills(skill_input: SkillCreate):
+    """Add a comma list of skills; names already present in any case resolve to the stored skill."""
+    names = json.dumps(normalize_skill_names(skill_input.names))
 
     with get_db() as conn:
-        for name in names:
-            cursor = conn.execute(
-                "SELECT * FROM skills WHERE name = ? AND user_id = 1", (name,)
+        conn.execute(
+            """
+            INSERT INTO skills (name, user_id)
+            SELECT value, 1 FROM json_each(?)
+            WHERE NOT EXISTS (
+                SELECT 1 FROM skills WHERE user_id = 1 AND name = value COLLATE NOCASE
             )
-            existing = cursor.fetchone()
-            if existing:
-                created_skills.append(Skill.model_validate(dict(existing)))
-            else:
-                try:
-                    cursor = conn.execute(
-                        "INSERT INTO skills (name, user_id) VALUES (?, 1)",
-                        (name,),
-                    )
-                    skill_id = cursor.lastrowid
-                    created_skills.append(Skill(id=skill_id, name=name))
-                except sqlite3.IntegrityError:
-                    raise HTTPException(
-                        status_code=409,
-                        detail=f"Skill '{name}' already exists for this user",
-                    )
+            ON CONFLICT(user_id, name) DO NOTHING
+            """,
+            (names,),
+        )
+        rows = conn.execute(
+            """
+            SELECT MIN(s.id) AS id, s.name
+            FROM json_each(?) AS input
+            JOIN skills s ON s.user_id = 1 AND s.name = input.value COLLATE NOCASE
+            GROUP BY input.key
+            ORDER BY input.key
+            """,
+            (names,),
+        ).fetchall()
         conn.commit()
+        profile_service.bump_version()
 
-    return created_skills
+    return [Skill.model_validate(dict(row)) for row in rows]
 
 
 @router.delete("/{skill_id}")
-async def delete_skill(skill_id: int):
+def delete_skill(skill_id: int):
     with get_db() as conn:
         exists_or_404(conn, "skills", skill_id, "Skill")
         conn.execute("DELETE FROM skills WHERE id = ?", (skill_id,))
         conn.commit()
+        profile_service.bump_version()
         return {"deleted": skill_id}
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from database import run_in_db
+from schemas import GenerationTask
+from services.generation_queue import generation_queue
+from services.resume_generator import resume_generator_service
+
+router = APIRouter(prefix="/api/tasks", tags=["tasks"])
+
+
+def _to_response(task: dict | None) -> GenerationTask | None:
+    if task is None:
+        return None
+    response = GenerationTask.model_validate(task)
+    if task["resume_id"] is not None:
+        response.resume = resume_generator_service.get_resume(task["resume_id"])
+    return response
+
+
+@router.get("/{task_id}", response_model=GenerationTask)
+async def get_task(task_id: int):
+    """Poll a background generation; the resume is included once it succeeds"""
+    response = await run_in_db(lambda: _to_response(generation_queue.get(task_id)))
+    if response is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return response
+
+
+@router.get("/{task_id}/events")
+async def watch_task(task_id: int):
+    """Server-sent "task" events on every status change, ending when the task finishes"""
+    if await run_in_db(generation_queue.get, task_id) is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    async def body():
+        async for task in generation_queue.watch(task_id):
+            data = (await run_in_db(_to_response, task)).model_dump_json()
+            yield f"event: task\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,14 +1,16 @@
 from fastapi import APIRouter
-from database import get_db
+from database import get_db, USER_COLUMNS
 from schemas import User, UserUpdate
+from services.profile import profile_service
+from routes.conditional import conditional, journal
 
 router = APIRouter(prefix="/api/users", tags=["users"])
 
 
-@router.get("", response_model=User | None)
-async def get_user():
+@router.get("", response_model=User | None, dependencies=[conditional(journal("users"))])
+def get_user():
     with get_db() as conn:
-        cursor = conn.execute("SELECT * FROM users WHERE id = 1")
+        cursor = conn.execute(f"SELECT {USER_COLUMNS} FROM users WHERE id = 1")
         row = cursor.fetchone()
         if row is None:
             return None
@@ -16,7 +18,7 @@ async def get_user():
 
 
 @router.put("", response_model=User)
-async def update_user(info: UserUpdate):
+def update_user(info: UserUpdate):
     with get_db() as conn:
         cursor = conn.execute("SELECT id FROM users WHERE id = 1")
         exists = cursor.fetchone() is not None
@@ -59,7 +61,8 @@ async def update_user(info: UserUpdate):
                 ),
             )
         conn.commit()
+        profile_service.bump_version()
 
-        cursor = conn.execute("SELECT * FROM users WHERE id = 1")
+        cursor = conn.execute(f"SELECT {USER_COLUMNS} FROM users WHERE id = 1")
         row = cursor.fetchone()
         return User.model_validate(dict(row))
@@ -1,26 +1,34 @@
 from fastapi import APIRouter
 from database import get_db, get_or_404, exists_or_404, fetch_one
-from schemas import WorkExperience, WorkExperienceCreate, WorkExperienceUpdate
+from schemas import WorkExperience, WorkExperienceCreate, WorkExperienceUpdate, WorkExperienceBatch
+from routes.batch import apply_batch
+from services.profile import profile_service
+from routes.conditional import conditional, journal
 
 router = APIRouter(prefix="/api/work-experiences", tags=["work-experiences"])
 
+WORK_EXPERIENCES_COLUMNS = ("company", "title", "start_date", "end_date", "is_current", "description", "location")
 
-@router.get("", response_model=list[WorkExperience])
-async def list_work_experiences():
+
+def _list_all(conn) -> list[WorkExperience]:
+    cursor = conn.execute(
+        """
+        SELECT * FROM work_experiences
+        WHERE user_id = 1
+        ORDER BY is_current DESC, start_date DESC
+        """
+    )
+    return [WorkExperience.model_validate(dict(row)) for row in cursor.fetchall()]
+
+
+@router.get("", response_model=list[WorkExperience], dependencies=[conditional(journal("work_experiences"))])
+def list_work_experiences():
     with get_db() as conn:
-        cursor = conn.execute(
-            """
-            SELECT * FROM work_experiences
-            WHERE user_id = 1
-            ORDER BY is_current DESC, start_date DESC
-            """
-        )
-        rows = cursor.fetchall()
-        return [WorkExperience.model_validate(dict(row)) for row in rows]
+        return _list_all(conn)
 
 
 @router.post("", response_model=WorkExperience)
-async def create_work_experience(exp: WorkExperienceCreate):
+def create_work_experience(exp: WorkExperienceCreate):
     with get_db() as conn:
         cursor = conn.execute(
             """
@@ -38,17 +46,25 @@ async def create_work_experience(exp: WorkExperienceCreate):
             ),
         )
         conn.commit()
+        profile_service.bump_version()
         return fetch_one(conn, "work_experiences", cursor.lastrowid, WorkExperience)
 
 
-@router.get("/{exp_id}", response_model=WorkExperience)
-async def get_work_experience(exp_id: int):
+@router.patch("/batch", response_model=list[WorkExperience])
+def batch_work_experiences(batch: WorkExperienceBatch):
+    with get_db() as conn:
+        apply_batch(conn, "work_experiences", WORK_EXPERIENCES_COLUMNS, batch, "Work experience")
+        return _list_all(conn)
+
+
+@router.get("/{exp_id}", response_model=WorkExperience, dependencies=[conditional(journal("work_experiences"))])
+def get_work_experience(exp_id: int):
     with get_db() as conn:
         return get_or_404(conn, "work_experiences", exp_id, "Work experience", WorkExperience)
 
 
 @router.put("/{exp_id}", response_model=WorkExperience)
-async def update_work_experience(exp_id: int, exp: WorkExperienceUpdate):
+def update_work_experience(exp_id: int, exp: WorkExperienceUpdate):
     with get_db() as conn:
         exists_or_404(conn, "work_experiences", exp_id, "Work experience")
 
@@ -77,13 +93,15 @@ async def update_work_experience(exp_id: int, exp: WorkExperienceUpdate):
             ),
         )
         conn.commit()
+        profile_service.bump_version()
         return fetch_one(conn, "work_experiences", exp_id, WorkExperience)
 
 
 @router.delete("/{exp_id}")
-async def delete_work_experience(exp_id: int):
+def delete_work_experience(exp_id: int):
     with get_db() as conn:
         exists_or_404(conn, "work_experiences", exp_id, "Work experience")
         conn.execute("DELETE FROM work_experiences WHERE id = ?", (exp_id,))
         conn.commit()
+        profile_service.bump_version()
         return {"deleted": exp_id}
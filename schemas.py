@@ -1,6 +1,7 @@
 from enum import Enum
+from typing import Generic, Literal, TypeVar
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 import re
 
 
@@ -25,6 +26,8 @@ class User(BaseModel):
     linkedin_url: str | None = None
     summary: str | None = None
     photo: str | None = None
+    photo_ref: str | None = None
+    photo_thumb_ref: str | None = None
     created_at: str | None = None
     updated_at: str | None = None
 
@@ -190,11 +193,73 @@ class Language(BaseModel):
     updated_at: str | None = None
 
 
+class LanguageOrder(BaseModel):
+    id: int
+    display_order: int
+
+
+# Section batch schemas (PATCH /api/<section>/batch)
+CreateT = TypeVar("CreateT", bound=BaseModel)
+UpdateT = TypeVar("UpdateT", bound=BaseModel)
+
+
+class SectionBatch(BaseModel, Generic[CreateT, UpdateT]):
+    create: list[CreateT] = []
+    update: list[UpdateT] = []
+    delete: list[int] = []
+
+    @model_validator(mode="after")
+    def validate_ids_once(self):
+        ids = [item.id for item in self.update] + self.delete
+        if len(ids) != len(set(ids)):
+            raise ValueError("Each id may be updated or deleted only once per batch")
+        return self
+
+
+class WorkExperienceBatchUpdate(WorkExperienceUpdate):
+    id: int
+
+
+class EducationBatchUpdate(EducationUpdate):
+    id: int
+
+
+class ProjectBatchUpdate(ProjectUpdate):
+    id: int
+
+
+class LanguageBatchUpdate(LanguageUpdate):
+    id: int
+
+
+class WorkExperienceBatch(SectionBatch[WorkExperienceCreate, WorkExperienceBatchUpdate]):
+    pass
+
+
+class EducationBatch(SectionBatch[EducationCreate, EducationBatchUpdate]):
+    pass
+
+
+class ProjectBatch(SectionBatch[ProjectCreate, ProjectBatchUpdate]):
+    pass
+
+
+class LanguageBatch(SectionBatch[LanguageCreate, LanguageBatchUpdate]):
+    reorder: list[LanguageOrder] = []
+
+    @model_validator(mode="after")
+    def validate_reorder_ids(self):
+        if set(self.delete) & {item.id for item in self.reorder}:
+            raise ValueError("A deleted language cannot be reordered")
+        return self
+
+
 # Resume Generation schemas
 class ResumeGenerateRequest(BaseModel):
     job_description: str
     job_id: int | None = None  # Optional: link to existing job
     language: str = "en"
+    bypass_cache: bool = False  # Force a fresh LLM call instead of reusing a cached answer
 
     @field_validator("job_description")
     @classmethod
@@ -287,6 +352,43 @@ class GeneratedResumeResponse(BaseModel):
     job_analysis: JobAnalysis | None = None
     resume: ResumeContent | None = None
     language: str = "en"
+    profile_version: int | None = None
+    created_at: str | None = None
+
+
+class GenerationTask(BaseModel):
+    """A background resume generation; poll until status is succeeded or failed."""
+
+    id: int
+    status: Literal["queued", "running", "succeeded", "failed"]
+    job_id: int | None = None
+    language: str = "en"
+    resume_id: int | None = None
+    resume: GeneratedResumeResponse | None = None
+    error: str | None = None
+    created_at: str | None = None
+    started_at: str | None = None
+    finished_at: str | None = None
+
+
+class ResumeBulkGenerateRequest(BaseModel):
+    job_ids: list[int] = Field(..., min_length=1, max_length=50)
+    language: str = Field(default="en", pattern="^(en|fr|nl)$")
+    bypass_cache: bool = False
+
+
+class GenerationBatch(BaseModel):
+    """Progress of a bulk generation; each task tracks one job."""
+
+    id: int
+    status: Literal["running", "finished"]
+    language: str = "en"
+    total: int
+    queued: int
+    running: int
+    succeeded: int
+    failed: int
+    tasks: list[GenerationTask] = []
     created_at: str | None = None
 
 
@@ -304,7 +406,17 @@ class ResumeUpdateRequest(BaseModel):
     resume: ResumeContent
 
 
+class PdfVariant(BaseModel):
+    template: str = Field("classic", pattern="^(classic|modern|brussels|eu_classic)$")
+    language: str = Field("en", pattern="^(en|fr|nl)$")
+
+
+class PdfBatchRequest(BaseModel):
+    variants: list[PdfVariant] = Field(..., min_length=1, max_length=12)
+
+
 class CompleteProfile(BaseModel):
+    version: int | None = None
     personal_info: dict | None = None
     work_experiences: list[dict] = []
     education: list[dict] = []
@@ -391,6 +503,8 @@ class PhotoUpload(BaseModel):
 
 class PhotoResponse(BaseModel):
     image_data: str | None = None
+    photo_ref: str | None = None
+    thumbnail_url: str | None = None
 
 
 # Profile Import schemas
@@ -484,3 +598,18 @@ class ProfileImport(BaseModel):
 class ProfileImportResponse(BaseModel):
     message: str
     counts: dict[str, int]
+    # Per section: rows inserted, updated, deleted and left unchanged
+    changes: dict[str, dict[str, int]] = {}
+
+
+class SearchResult(BaseModel):
+    """One search hit; highlights are [start, end) character offsets into snippet."""
+
+    kind: Literal["job", "job_version", "resume"]
+    id: int
+    job_id: int | None = None
+    title: str | None = None
+    company_name: str | None = None
+    snippet: str
+    highlights: list[tuple[int, int]] = []
+    score: float
@@ -0,0 +1,196 @@
+# Lean Code — BSD 3-Clause License — Vivian Voss, 2026
+# Scope: Long-lived pool of warm Chromium pages shared by every PDF render.
+
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager
+
+from playwright.async_api import async_playwright
+
+import settings
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledPage:
+    """One warm browser with its pre-created context and page."""
+
+    def __init__(self, browser, context, page):
+        self.browser = browser
+        self.context = context
+        self.page = page
+        self.renders = 0
+
+    def is_healthy(self) -> bool:
+        return self.browser.is_connected() and not self.page.is_closed()
+
+    async def close(self):
+        try:
+            await self.browser.close()
+        except Exception as e:
+            logger.warning(f"Failed to close pooled browser: {type(e).__name__}: {e}")
+
+
+class BrowserPool:
+    """Pool of warm Chromium browsers, each holding one ready page.
+
+    Playwright objects are bound to the event loop that created them, so the
+    pool owns a private loop on a daemon thread and every render runs there.
+    Callers on any thread hand it a coroutine through ``run``.
+
+    Browsers are launched lazily up to ``size``. A slot is recycled when its
+    browser disconnects or its page closes, when a render on it raises, and
+    after ``max_renders`` renders so leaked memory cannot accumulate.
+    """
+
+    def __init__(self, size: int | None = None, max_renders: int | None = None):
+        self.size = size if size is not None else settings.PDF_BROWSER_POOL_SIZE
+        self.max_renders = max_renders if max_renders is not None else settings.PDF_BROWSER_MAX_RENDERS
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._playwright = None
+        self._idle: asyncio.Queue | None = None
+        self._capacity: asyncio.Semaphore | None = None
+        self._launch_lock: asyncio.Lock | None = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="pdf-browser-pool", daemon=True
+                )
+                thread.start()
+                self._idle = asyncio.Queue()
+                self._capacity = asyncio.Semaphore(self.size)
+                self._launch_lock = asyncio.Lock()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def run(self, coro):
+        """Run a coroutine on the pool loop and block until it returns."""
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def run_async(self, coro):
+        """Run a coroutine on the pool loop and await it from the caller's loop."""
+        loop = self._ensure_loop()
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    def start(self):
+        """Warm the pool in the background so the first export skips the cold start."""
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(self._warm_up(), loop)
+        future.add_done_callback(self._log_warm_up_failure)
+        return future
+
+    @staticmethod
+    def _log_warm_up_failure(future):
+        if not future.cancelled() and future.exception() is not None:
+            e = future.exception()
+            logger.warning(f"PDF browser pool warm-up failed: {type(e).__name__}: {e}")
+
+    def close(self):
+        """Close every idle browser, stop Playwright and join the pool thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=30)
+        except Exception as e:
+            logger.warning(f"PDF browser pool shutdown failed: {type(e).__name__}: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        loop.close()
+
+    @asynccontextmanager
+    async def page(self):
+        """Check out a warm page; it goes back to the pool when the block exits."""
+        async with self.pages(1) as pages:
+            yield pages[0]
+
+    @asynccontextmanager
+    async def pages(self, count: int):
+        """Check out one warm browser with ``count`` pages open in its context.
+
+        The pre-created page comes first; the extra pages are closed when the
+        block exits so the slot returns to the pool in its original shape.
+        """
+        slot = await self._acquire()
+        extra = []
+        try:
+            for _ in range(count - 1):
+                extra.append(await slot.context.new_page())
+            yield [slot.page, *extra]
+            for page in extra:
+                await page.close()
+        except BaseException:
+            await self._release(slot, recycle=True)
+            raise
+        slot.renders += count
+        await self._release(slot, recycle=slot.renders >= self.max_renders)
+
+    async def _acquire(self) -> _PooledPage:
+        await self._capacity.acquire()
+        try:
+            while True:
+                try:
+                    slot = self._idle.get_nowait()
+                except asyncio.QueueEmpty:
+                    return await self._launch()
+                if slot.is_healthy():
+                    return slot
+                logger.warning("Recycling unhealthy pooled browser")
+                await slot.close()
+        except BaseException:
+            self._capacity.release()
+            raise
+
+    async def _release(self, slot: _PooledPage, recycle: bool = False):
+        try:
+            if recycle:
+                await slot.close()
+            else:
+                self._idle.put_nowait(slot)
+        finally:
+            self._capacity.release()
+
+    async def _launch(self) -> _PooledPage:
+        async with self._launch_lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+        browser = await self._playwright.chromium.launch()
+        try:
+            context = await browser.new_context()
+            page = await context.new_page()
+        except BaseException:
+            await browser.close()
+            raise
+        return _PooledPage(browser, context, page)
+
+    async def _warm_up(self):
+        results = await asyncio.gather(
+            *(self._acquire() for _ in range(self.size)), return_exceptions=True
+        )
+        failures = []
+        for result in results:
+            if isinstance(result, BaseException):
+                failures.append(result)
+            else:
+                await self._release(result)
+        if failures:
+            raise failures[0]
+
+    async def _shutdown(self):
+        while not self._idle.empty():
+            await self._idle.get_nowait().close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+browser_pool = BrowserPool()
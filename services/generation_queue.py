@@ -0,0 +1,305 @@
+# Lean Code — BSD 3-Clause License — Vivian Voss, 2026
+# Scope: In-process queue running resume generations in the background, with task state persisted in SQLite.
+
+import asyncio
+import logging
+
+import settings
+from database import get_db, run_in_db
+from services.llm import ProviderBusyError
+from services.resume_generator import resume_generator_service
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = frozenset({"succeeded", "failed"})
+
+# Seconds to wait before retrying a generation the provider rejected as busy
+BUSY_RETRY_DELAYS = (5, 20, 60)
+
+
+class GenerationQueue:
+    """Background resume generation backed by the generation_tasks table.
+
+    ``submit`` records a queued task and returns at once; ``workers`` asyncio
+    tasks on the application loop pick task ids off an in-memory queue and
+    run ``resume_generator_service.generate``, so a finished task's resume is
+    written exactly as a synchronous generation would write it. The table is
+    the source of truth: tasks left queued or running by a previous process
+    are re-queued when the workers start.
+
+    ``submit_bulk`` groups one task per saved job into a batch. A batch
+    reads the profile once and runs its tasks itself, at most
+    BULK_GENERATION_CONCURRENCY at a time; provider calls are additionally
+    paced by llm_service's token bucket, and busy (429) rejections are
+    retried after BUSY_RETRY_DELAYS instead of failing the task.
+    """
+
+    def __init__(self, workers: int | None = None):
+        self.workers = workers if workers is not None else settings.GENERATION_WORKERS
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue | None = None
+        self._changed: asyncio.Condition | None = None
+        self._workers: list[asyncio.Task] = []
+        self._batches: set[asyncio.Task] = set()
+
+    def start(self):
+        """Start the workers on the running loop and re-queue unfinished tasks."""
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._changed = asyncio.Condition()
+        self._workers = [
+            asyncio.create_task(self._work(), name=f"generation-worker-{i}")
+            for i in range(self.workers)
+        ]
+        with get_db() as conn:
+            conn.execute("UPDATE generation_tasks SET status = 'queued' WHERE status = 'running'")
+            conn.commit()
+            rows = conn.execute(
+                "SELECT id FROM generation_tasks WHERE status = 'queued' ORDER BY id"
+            ).fetchall()
+        for row in rows:
+            self._queue.put_nowait(row["id"])
+
+    async def stop(self):
+        """Cancel the workers; interrupted tasks resume on the next start."""
+        workers, self._workers = self._workers + list(self._batches), []
+        self._batches.clear()
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._loop = self._queue = self._changed = None
+
+    async def submit(
+        self,
+        job_description: str,
+        job_id: int | None = None,
+        language: str = "en",
+        bypass_cache: bool = False,
+    ) -> dict:
+        if self._loop is not asyncio.get_running_loop():
+            self.start()
+        task = await run_in_db(self._insert_task, job_description, job_id, language, bypass_cache)
+        self._queue.put_nowait(task["id"])
+        return task
+
+    def _insert_task(self, job_description, job_id, language, bypass_cache) -> dict:
+        with get_db() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO generation_tasks (job_description, job_id, language, bypass_cache)
+                VALUES (?, ?, ?, ?)
+                """,
+                (job_description, job_id, language, int(bypass_cache)),
+            )
+            conn.commit()
+        return self.get(cursor.lastrowid)
+
+    async def submit_bulk(self, job_ids: list[int], language: str = "en", bypass_cache: bool = False) -> dict:
+        """Queue one generation per saved job and return the new batch.
+
+        Raises ProfileIncompleteError, or ValueError naming unknown job ids,
+        before anything is queued.
+        """
+        profile_dict, profile_meta = await run_in_db(resume_generator_service.load_profile)
+        job_ids = list(dict.fromkeys(job_ids))
+        if self._loop is not asyncio.get_running_loop():
+            self.start()
+        batch_id, tasks = await run_in_db(self._insert_batch, job_ids, language, bypass_cache)
+
+        runner = asyncio.create_task(
+            self._run_batch(tasks, profile_dict, profile_meta, language, bypass_cache),
+            name=f"generation-batch-{batch_id}",
+        )
+        self._batches.add(runner)
+        runner.add_done_callback(self._batches.discard)
+        return await run_in_db(self.get_batch, batch_id)
+
+    @staticmethod
+    def _insert_batch(job_ids: list[int], language: str, bypass_cache: bool) -> tuple[int, list]:
+        placeholders = ", ".join("?" for _ in job_ids)
+        with get_db() as conn:
+            rows = conn.execute(
+                f"SELECT id, original_text FROM jobs WHERE id IN ({placeholders})", job_ids
+            ).fetchall()
+            job_texts = {row["id"]: row["original_text"] for row in rows}
+            missing = [job_id for job_id in job_ids if job_id not in job_texts]
+            if missing:
+                raise ValueError(f"Jobs not found: {', '.join(map(str, missing))}")
+
+            batch_id = conn.execute(
+                "INSERT INTO generation_batches (language) VALUES (?)", (language,)
+            ).lastrowid
+            tasks = []
+            for job_id in job_ids:
+                cursor = conn.execute(
+                    """
+                    INSERT INTO generation_tasks
+                        (job_description, job_id, language, bypass_cache, batch_id)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (job_texts[job_id], job_id, language, int(bypass_cache), batch_id),
+                )
+                tasks.append((cursor.lastrowid, job_id, job_texts[job_id]))
+            conn.commit()
+        return batch_id, tasks
+
+    def get_batch(self, batch_id: int) -> dict | None:
+        """Return a batch with its tasks and a count per status."""
+        with get_db() as conn:
+            batch = conn.execute(
+                "SELECT id, language, created_at FROM generation_batches WHERE id = ?",
+                (batch_id,),
+            ).fetchone()
+            if batch is None:
+                return None
+            tasks = conn.execute(
+                """
+                SELECT id, status, job_id, language, resume_id, error,
+                       created_at, started_at, finished_at
+                FROM generation_tasks WHERE batch_id = ? ORDER BY id
+                """,
+                (batch_id,),
+            ).fetchall()
+        tasks = [dict(task) for task in tasks]
+        counts = {status: 0 for status in ("queued", "running", "succeeded", "failed")}
+        for task in tasks:
+            counts[task["status"]] += 1
+        finished = counts["succeeded"] + counts["failed"] == len(tasks)
+        return {
+            **dict(batch),
+            "status": "finished" if finished else "running",
+            "total": len(tasks),
+            **counts,
+            "tasks": tasks,
+        }
+
+    def get(self, task_id: int) -> dict | None:
+        with get_db() as conn:
+            row = conn.execute(
+                """
+                SELECT id, status, job_id, language, resume_id, error,
+                       created_at, started_at, finished_at
+                FROM generation_tasks WHERE id = ?
+                """,
+                (task_id,),
+            ).fetchone()
+        return dict(row) if row else None
+
+    async def watch(self, task_id: int, poll_interval: float = 2.0):
+        """Yield the task each time its status changes, ending once it finishes."""
+        last_status = None
+        while True:
+            task = await run_in_db(self.get, task_id)
+            if task is None:
+                return
+            if task["status"] != last_status:
+                last_status = task["status"]
+                yield task
+            if last_status in TERMINAL_STATUSES:
+                return
+            await self._wait_for_change(poll_interval)
+
+    async def _wait_for_change(self, timeout: float):
+        changed = self._changed
+        if changed is None or self._loop is not asyncio.get_running_loop():
+            await asyncio.sleep(timeout)
+            return
+        async with changed:
+            try:
+                await asyncio.wait_for(changed.wait(), timeout)
+            except TimeoutError:
+                pass
+
+    async def _notify(self):
+        async with self._changed:
+            self._changed.notify_all()
+
+    async def _work(self):
+        while True:
+            task_id = await self._queue.get()
+            try:
+                await self._execute(task_id, lambda task: resume_generator_service.generate(
+                    task["job_description"],
+                    task["job_id"],
+                    task["language"],
+                    bypass_cache=bool(task["bypass_cache"]),
+                ))
+            except Exception:
+                logger.exception(f"Generation task {task_id} crashed")
+            finally:
+                self._queue.task_done()
+
+    async def _run_batch(self, tasks, profile_dict, profile_meta, language, bypass_cache):
+        concurrency = asyncio.Semaphore(max(1, settings.BULK_GENERATION_CONCURRENCY))
+
+        async def run_one(task_id, job_id, job_description):
+            async with concurrency:
+                await self._execute(task_id, lambda task: resume_generator_service.generate_for_profile(
+                    profile_dict, profile_meta, job_description, job_id, language, bypass_cache
+                ))
+
+        results = await asyncio.gather(*(run_one(*task) for task in tasks), return_exceptions=True)
+        for (task_id, _, _), result in zip(tasks, results):
+            if isinstance(result, Exception):
+                logger.error(f"Generation task {task_id} crashed: {type(result).__name__}: {result}")
+
+    async def _execute(self, task_id: int, generate):
+        """Claim a queued task, run ``generate(task)`` and record the outcome."""
+        task = await run_in_db(self._claim, task_id)
+        if task is None:
+            return
+        await self._notify()
+
+        try:
+            resume = await self._retry_when_busy(task_id, lambda: generate(task))
+        except Exception as e:
+            logger.error(f"Generation task {task_id} failed: {type(e).__name__}: {e}")
+            await run_in_db(self._finish, task_id, "failed", error=str(e))
+        else:
+            await run_in_db(self._finish, task_id, "succeeded", resume_id=resume.id)
+        await self._notify()
+
+    @staticmethod
+    def _claim(task_id: int):
+        with get_db() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE generation_tasks
+                SET status = 'running', started_at = CURRENT_TIMESTAMP
+                WHERE id = ? AND status = 'queued'
+                """,
+                (task_id,),
+            )
+            conn.commit()
+            if cursor.rowcount == 0:
+                return None
+            return conn.execute(
+                "SELECT * FROM generation_tasks WHERE id = ?", (task_id,)
+            ).fetchone()
+
+    @staticmethod
+    async def _retry_when_busy(task_id: int, generate):
+        for delay in (*BUSY_RETRY_DELAYS, None):
+            try:
+                return await generate()
+            except ProviderBusyError:
+                if delay is None:
+                    raise
+                logger.warning(f"AI service busy; retrying generation task {task_id} in {delay}s")
+                await asyncio.sleep(delay)
+
+    @staticmethod
+    def _finish(task_id: int, status: str, resume_id: int | None = None, error: str | None = None):
+        with get_db() as conn:
+            conn.execute(
+                """
+                UPDATE generation_tasks
+                SET status = ?, resume_id = ?, error = ?, finished_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+                """,
+                (status, resume_id, error, task_id),
+            )
+            conn.commit()
+
+
+generation_queue = GenerationQueue()
@@ -1,114 +1,125 @@
 import json
 from datetime import datetime
-from database import get_db
+from database import get_db, AsyncService, decode_cursor, encode_cursor, like_pattern
+
+# Columns of a job as the detail endpoints return it; resume_count is kept by triggers
+_JOB_COLUMNS = "id, title, company_name, original_text, created_at, updated_at, resume_count"
 
 
 class JobService:
-    def list_all(self) -> list[dict]:
-        """Get all saved jobs with resume count, ordered by updated_at DESC"""
+    def list_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        title: str | None = None,
+        company: str | None = None,
+    ) -> tuple[list[dict], str | None]:
+        """One page of saved jobs, newest update first, and the cursor of the next page.
+
+        Pages are keyed on (updated_at, id), which idx_jobs_saved_updated
+        serves in order, so a page costs the same at any depth. The preview
+        is cut in SQL: full job texts are not read for the list.
+        """
+        where, params = ["j.is_saved = 1"], []
+        if title:
+            where.append("j.title LIKE ? ESCAPE '\\'")
+            params.append(like_pattern(title))
+        if company:
+            where.append("j.company_name LIKE ? ESCAPE '\\'")
+            params.append(like_pattern(company))
+        if cursor:
+            where.append("(j.updated_at, j.id) < (?, ?)")
+            params.extend(decode_cursor(cursor, (str, int)))
+
         with get_db() as conn:
             cursor = conn.execute(
-                """
+                f"""
                 SELECT
-                    j.id, j.title, j.company_name, j.original_text,
-                    j.created_at, j.updated_at,
-                    COUNT(gr.id) as resume_count
+                    j.id, j.title, j.company_name,
+                    substr(j.original_text, 1, 200) AS text_preview,
+                    j.created_at, j.updated_at, j.resume_count
                 FROM jobs j
-                LEFT JOIN generated_resumes gr ON j.id = gr.job_id
-                WHERE j.is_saved = 1
-                GROUP BY j.id
-                ORDER BY j.updated_at DESC
-                """
+                WHERE {" AND ".join(where)}
+                ORDER BY j.updated_at DESC, j.id DESC
+                LIMIT ?
+                """,
+                (*params, limit + 1),
             )
-            rows = cursor.fetchall()
-            return [
-                {
-                    **dict(row),
-                    "text_preview": dict(row)["original_text"][:200],
-                }
-                for row in rows
-            ]
+            rows = [dict(row) for row in cursor.fetchall()]
+
+        if len(rows) <= limit:
+            return rows, None
+        last = rows[limit - 1]
+        return rows[:limit], encode_cursor(last["updated_at"], last["id"])
 
     def get(self, job_id: int) -> dict | None:
         """Get single job by ID"""
         with get_db() as conn:
-            cursor = conn.execute(
-                """
-                SELECT
-                    j.id, j.title, j.company_name, j.original_text,
-                    j.created_at, j.updated_at,
-                    COUNT(gr.id) as resume_count
-                FROM jobs j
-                LEFT JOIN generated_resumes gr ON j.id = gr.job_id
-                WHERE j.id = ?
-                GROUP BY j.id
-                """,
-                (job_id,),
-            )
-            row = cursor.fetchone()
+            row = conn.execute(f"SELECT {_JOB_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
             return dict(row) if row else None
 
     def create(self, original_text: str) -> dict:
         """Save new job with default title"""
         now = datetime.now().isoformat()
         with get_db() as conn:
-            cursor = conn.execute(
-                """
+            row = conn.execute(
+                f"""
                 INSERT INTO jobs (original_text, title, updated_at, is_saved)
                 VALUES (?, ?, ?, ?)
+                RETURNING {_JOB_COLUMNS}
                 """,
                 (original_text, "Untitled Job", now, 1),
-            )
+            ).fetchone()
             conn.commit()
-            job_id = cursor.lastrowid
-            return self.get(job_id)
+            return dict(row)
 
     def update(self, job_id: int, data: dict) -> dict | None:
         """Update job title or text, create version if text changed"""
-        current = self.get(job_id)
-        if not current:
-            return None
-
         with get_db() as conn:
-            # If original_text changed, create version
-            if data.get("original_text") and data["original_text"] != current["original_text"]:
-                cursor = conn.execute(
-                    "SELECT MAX(version_number) as max_version FROM job_versions WHERE job_id = ?",
-                    (job_id,),
-                )
-                row = cursor.fetchone()
-                max_version = row["max_version"] if row and row["max_version"] else 0
+            job = self._update(conn, job_id, data)
+            conn.commit()
+            return job
 
-                conn.execute(
-                    """
-                    INSERT INTO job_versions (job_id, original_text, version_number)
-                    VALUES (?, ?, ?)
-                    """,
-                    (job_id, current["original_text"], max_version + 1),
-                )
+    def _update(self, conn, job_id: int, data: dict) -> dict | None:
+        """Apply an update inside the caller's transaction; None if the job does not exist.
 
-            # Build update query
-            updates = []
-            params = []
-            if data.get("title") is not None:
-                updates.append("title = ?")
-                params.append(data["title"])
-            if data.get("original_text") is not None:
-                updates.append("original_text = ?")
-                params.append(data["original_text"])
-
-            if updates:
-                updates.append("updated_at = ?")
-                params.append(datetime.now().isoformat())
-                params.append(job_id)
-
-                conn.execute(
-                    f"UPDATE jobs SET {', '.join(updates)} WHERE id = ?",
-                    params,
-                )
-                conn.commit()
+        The replaced text is copied into job_versions by the same statement
+        that checks it changed, and the UPDATE returns the new row, so no
+        separate read is needed before or after.
+        """
+        if data.get("original_text"):
+            conn.execute(
+                """
+                INSERT INTO job_versions (job_id, original_text, version_number)
+                SELECT j.id, j.original_text,
+                       COALESCE((SELECT MAX(version_number) FROM job_versions WHERE job_id = j.id), 0) + 1
+                FROM jobs j
+                WHERE j.id = ? AND j.original_text != ?
+                """,
+                (job_id, data["original_text"]),
+            )
 
-            return self.get(job_id)
+        # Build update query
+        updates = []
+        params = []
+        if data.get("title") is not None:
+            updates.append("title = ?")
+            params.append(data["title"])
+        if data.get("original_text") is not None:
+            updates.append("original_text = ?")
+            params.append(data["original_text"])
+
+        if updates:
+            updates.append("updated_at = ?")
+            params.append(datetime.now().isoformat())
+            params.append(job_id)
+            row = conn.execute(
+                f"UPDATE jobs SET {', '.join(updates)} WHERE id = ? RETURNING {_JOB_COLUMNS}",
+                params,
+            ).fetchone()
+        else:
+            row = conn.execute(f"SELECT {_JOB_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
 
     def delete(self, job_id: int) -> bool:
         """Delete job - FK CASCADE handles generated_resumes and versions automatically"""
@@ -159,9 +170,10 @@ class JobService:
             if not version:
                 return None
 
-            # Update with version text (this will create a new version via update())
-            return self.update(job_id, {"original_text": version["original_text"]})
-
+            # Same transaction as the lookup: the version cannot vanish in between
+            job = self._update(conn, job_id, {"original_text": version["original_text"]})
+            conn.commit()
+            return job
 
     def save_job_analysis(
         self,
@@ -194,33 +206,24 @@ class JobService:
                 conn.commit()
                 return cursor.lastrowid
             else:
-                # UPDATE: Check if existing job needs title update
-                cursor = conn.execute(
-                    "SELECT title FROM jobs WHERE id = ?",
-                    (job_id,)
-                )
-                existing = cursor.fetchone()
-                if not existing:
+                # UPDATE: title and company only replace the placeholder title
+                row = conn.execute(
+                    """
+                    UPDATE jobs
+                    SET title = CASE WHEN title = 'Untitled Job' THEN ? ELSE title END,
+                        company_name = CASE WHEN title = 'Untitled Job' THEN ? ELSE company_name END,
+                        parsed_data = ?,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                    RETURNING id
+                    """,
+                    (title, company_name, parsed_data_json, job_id),
+                ).fetchone()
+                if not row:
                     raise ValueError(f"Job with id {job_id} not found")
-
-                if existing["title"] == "Untitled Job":
-                    # Update title, company_name, and parsed_data
-                    conn.execute(
-                        """
-                        UPDATE jobs
-                        SET title = ?, company_name = ?, parsed_data = ?, updated_at = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                        """,
-                        (title, company_name, parsed_data_json, job_id)
-                    )
-                else:
-                    # Only update parsed_data and timestamp
-                    conn.execute(
-                        "UPDATE jobs SET parsed_data = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
-                        (parsed_data_json, job_id)
-                    )
                 conn.commit()
                 return job_id
 
 
 job_service = JobService()
+async_job_service = AsyncService(job_service)
@@ -7,12 +7,22 @@ Usage:
     from services.llm import llm_service
 
     result = await llm_service.analyze_and_generate(job_description, profile)
+
+Responses are cached by (provider, model, prompt_hash); pass
+bypass_cache=True to force a fresh call. Provider calls are paced by a
+shared token bucket (LLM_RATE_LIMIT_PER_MINUTE).
 """
 
-from .base import LLMProvider
+import time
+
+from database import run_in_db
+
+from .base import LLMProvider, ProviderBusyError
+from .cache import llm_response_cache
 from .factory import get_provider
+from .rate_limit import provider_rate_limit
 
-__all__ = ["llm_service", "get_provider", "LLMProvider"]
+__all__ = ["llm_service", "get_provider", "LLMProvider", "ProviderBusyError"]
 
 
 class _LazyLLMService:
@@ -34,16 +44,74 @@ class _LazyLLMService:
         job_description: str,
         profile: dict,
         language: str = "en",
+        bypass_cache: bool = False,
     ) -> tuple[dict, dict]:
-        """Delegate to the underlying provider.
+        """Delegate to the underlying provider, answering from the cache when possible.
+
+        A cached answer reports the lookup time as latency_ms and zero tokens,
+        since no call was made. With bypass_cache the provider is always
+        called and its answer replaces the cached one.
 
         Returns:
             A tuple (parsed, breadcrumbs) — see LLMProvider.analyze_and_generate
             for the dict shapes.
         """
-        return await self._get_instance().analyze_and_generate(
+        provider = self._get_instance()
+        key = provider.cache_key(job_description, profile, language)
+        if not bypass_cache:
+            cached = await _cached_result(key)
+            if cached is not None:
+                return cached
+
+        await provider_rate_limit.acquire()
+        parsed, breadcrumbs = await provider.analyze_and_generate(
             job_description, profile, language
         )
+        await run_in_db(llm_response_cache.put, *key, parsed, breadcrumbs)
+        return parsed, breadcrumbs
+
+    async def stream_analyze_and_generate(
+        self,
+        job_description: str,
+        profile: dict,
+        language: str = "en",
+        bypass_cache: bool = False,
+    ):
+        """Delegate to the underlying provider's streaming variant.
+
+        Yields ("delta", text) events, then one ("done", (parsed, breadcrumbs)).
+        A cache hit is replayed as a single delta carrying the stored output.
+        """
+        provider = self._get_instance()
+        key = provider.cache_key(job_description, profile, language)
+        if not bypass_cache:
+            cached = await _cached_result(key)
+            if cached is not None:
+                yield "delta", cached[1]["raw_output"]
+                yield "done", cached
+                return
+
+        await provider_rate_limit.acquire()
+        async for kind, payload in provider.stream_analyze_and_generate(
+            job_description, profile, language
+        ):
+            if kind == "done":
+                await run_in_db(llm_response_cache.put, *key, *payload)
+            yield kind, payload
+
+
+async def _cached_result(key: tuple[str, str, str]) -> tuple[dict, dict] | None:
+    start_time = time.monotonic()
+    cached = await run_in_db(llm_response_cache.get, *key)
+    if cached is None:
+        return None
+    parsed, breadcrumbs = cached
+    breadcrumbs.update(
+        latency_ms=int((time.monotonic() - start_time) * 1000),
+        input_tokens=0,
+        output_tokens=0,
+    )
+    return parsed, breadcrumbs
 
 
 # Global singleton - lazily initialized on first use
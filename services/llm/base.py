@@ -4,12 +4,24 @@ This module defines the protocol for LLM providers and shared constants
 used across all provider implementations.
 """
 
-from typing import Protocol
+from typing import AsyncIterator, Protocol
+
+
+class ProviderBusyError(RuntimeError):
+    """The provider rejected the call for rate or capacity reasons (HTTP 429).
+
+    A RuntimeError so existing handlers keep treating it as a service error;
+    callers that can wait, such as bulk generation, retry it instead.
+    """
 
 
 class LLMProvider(Protocol):
     """Protocol defining the interface for LLM providers."""
 
+    def cache_key(self, job_description: str, profile: dict, language: str = "en") -> tuple[str, str, str]:
+        """Return (provider, model, prompt_hash) identifying this generation's prompt."""
+        ...
+
     async def analyze_and_generate(
         self,
         job_description: str,
@@ -33,6 +45,20 @@ class LLMProvider(Protocol):
         """
         ...
 
+    def stream_analyze_and_generate(
+        self,
+        job_description: str,
+        profile: dict,
+        language: str = "en",
+    ) -> AsyncIterator[tuple[str, object]]:
+        """Stream the same generation as analyze_and_generate.
+
+        Yields ("delta", text) for each chunk of model output as it arrives,
+        then exactly one ("done", (parsed, breadcrumbs)) with the shapes
+        documented on analyze_and_generate.
+        """
+        ...
+
 
 # Language instructions shared across all providers
 LANGUAGE_INSTRUCTIONS = {
@@ -0,0 +1,88 @@
+"""Persistent cache of LLM responses.
+
+Generation is deterministic enough that an identical prompt — same system
+prompt, job description, profile and language, hence the same prompt_hash —
+can reuse the earlier answer instead of paying for another call. Entries
+live in the llm_response_cache table, keyed by (provider, model,
+prompt_hash), expire after LLM_CACHE_TTL_SECONDS and are evicted
+least-recently-used beyond LLM_CACHE_MAX_ENTRIES.
+"""
+
+import json
+import logging
+import sqlite3
+import time
+
+import settings
+from database import get_db
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    def get(self, provider: str, model: str, prompt_hash: str) -> tuple[dict, dict] | None:
+        """Return the cached (parsed, breadcrumbs) pair, or None on a miss."""
+        now = time.time()
+        try:
+            with get_db() as conn:
+                row = conn.execute(
+                    "SELECT parsed, breadcrumbs, created_at FROM llm_response_cache "
+                    "WHERE provider = ? AND model = ? AND prompt_hash = ?",
+                    (provider, model, prompt_hash),
+                ).fetchone()
+                if row is None:
+                    return None
+                if now - row["created_at"] > settings.LLM_CACHE_TTL_SECONDS:
+                    conn.execute(
+                        "DELETE FROM llm_response_cache "
+                        "WHERE provider = ? AND model = ? AND prompt_hash = ?",
+                        (provider, model, prompt_hash),
+                    )
+                    conn.commit()
+                    return None
+                conn.execute(
+                    "UPDATE llm_response_cache SET last_used_at = ? "
+                    "WHERE provider = ? AND model = ? AND prompt_hash = ?",
+                    (now, provider, model, prompt_hash),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read LLM response cache: {e}")
+            return None
+        return json.loads(row["parsed"]), json.loads(row["breadcrumbs"])
+
+    def put(self, provider: str, model: str, prompt_hash: str, parsed: dict, breadcrumbs: dict):
+        now = time.time()
+        try:
+            with get_db() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO llm_response_cache
+                        (provider, model, prompt_hash, parsed, breadcrumbs, created_at, last_used_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (provider, model, prompt_hash, json.dumps(parsed), json.dumps(breadcrumbs), now, now),
+                )
+                self._evict(conn, now)
+                conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Could not write LLM response cache: {e}")
+
+    @staticmethod
+    def _evict(conn, now: float):
+        conn.execute(
+            "DELETE FROM llm_response_cache WHERE created_at < ?",
+            (now - settings.LLM_CACHE_TTL_SECONDS,),
+        )
+        conn.execute(
+            """
+            DELETE FROM llm_response_cache WHERE rowid NOT IN (
+                SELECT rowid FROM llm_response_cache
+                ORDER BY last_used_at DESC LIMIT ?
+            )
+            """,
+            (settings.LLM_CACHE_MAX_ENTRIES,),
+        )
+
+
+llm_response_cache = LLMResponseCache()
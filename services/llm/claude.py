@@ -14,6 +14,7 @@ from .base import (
     LANGUAGE_INSTRUCTIONS,
     SYSTEM_PROMPT,
     USER_PROMPT_TEMPLATE,
+    ProviderBusyError,
 )
 
 logger = logging.getLogger(__name__)
@@ -38,9 +39,73 @@ def _get_model() -> str:
     return settings.CLAUDE_MODEL
 
 
+def _build_prompt(job_description: str, profile: dict, language: str) -> tuple[str, str, str]:
+    """Return (user_prompt, prompt_hash, profile_snapshot) for a generation."""
+    profile_json = json.dumps(profile, indent=2)
+    language_instruction = LANGUAGE_INSTRUCTIONS.get(
+        language, LANGUAGE_INSTRUCTIONS["en"]
+    )
+    user_prompt = USER_PROMPT_TEMPLATE.format(
+        job_description=job_description,
+        profile_json=profile_json,
+        language_instruction=language_instruction,
+    )
+
+    profile_snapshot = json.dumps(profile, sort_keys=True, ensure_ascii=False)
+    prompt_text = SYSTEM_PROMPT + "\n\n" + user_prompt
+    prompt_hash = hashlib.sha1(prompt_text.encode("utf-8")).hexdigest()
+    return user_prompt, prompt_hash, profile_snapshot
+
+
+def _parse_response(response_text: str) -> dict:
+    """Extract the JSON object from the model's response text."""
+    json_start = response_text.find("{")
+    json_end = response_text.rfind("}") + 1
+    if json_start == -1:
+        raise ValueError("No JSON found in response")
+    if json_end == 0:
+        # Has opening brace but no closing brace - truncated
+        raise ValueError(
+            "AI response was truncated. Try a shorter job description."
+        )
+
+    json_str = response_text[json_start:json_end]
+    return json.loads(json_str)
+
+
+def _translate_error(e: Exception, response_text: str | None) -> Exception:
+    """Map an API or parsing failure onto the errors the routes understand."""
+    if isinstance(e, anthropic.APIConnectionError):
+        logger.error(f"API connection error: {e}")
+        return ConnectionError(f"Could not connect to AI service: {e}")
+    if isinstance(e, anthropic.RateLimitError):
+        logger.error(f"Rate limit error: {e}")
+        return ProviderBusyError("AI service is busy, please try again later")
+    if isinstance(e, anthropic.APIStatusError):
+        logger.error(f"API status error: {e.status_code} - {e.message}")
+        return RuntimeError(f"AI service error: {e.status_code} - {e.message}")
+    if isinstance(e, json.JSONDecodeError):
+        logger.error(f"JSON decode error: {e}")
+        logger.error(
+            f"Response text (last 500 chars): {response_text[-500:] if response_text else 'None'}"
+        )
+        if response_text and not response_text.rstrip().endswith("}"):
+            return ValueError(
+                "AI response was truncated. Try a shorter job description."
+            )
+        return ValueError(f"Invalid response from AI service: {e}")
+    logger.error(f"Unexpected error in Claude provider: {type(e).__name__}: {e}")
+    return e
+
+
 class ClaudeProvider:
     """Claude LLM provider using Anthropic's API."""
 
+    def cache_key(self, job_description: str, profile: dict, language: str = "en") -> tuple[str, str, str]:
+        """Return the (provider, model, prompt_hash) a generation would be recorded under."""
+        _, prompt_hash, _ = _build_prompt(job_description, profile, language)
+        return "claude", _get_model(), prompt_hash
+
     async def analyze_and_generate(
         self,
         job_description: str,
@@ -65,22 +130,12 @@ class ClaudeProvider:
             ValueError: When response cannot be parsed as JSON
         """
         client = _get_client()
-
-        profile_json = json.dumps(profile, indent=2)
-        language_instruction = LANGUAGE_INSTRUCTIONS.get(
-            language, LANGUAGE_INSTRUCTIONS["en"]
-        )
-        user_prompt = USER_PROMPT_TEMPLATE.format(
-            job_description=job_description,
-            profile_json=profile_json,
-            language_instruction=language_instruction,
+        user_prompt, prompt_hash, profile_snapshot = _build_prompt(
+            job_description, profile, language
         )
-
-        profile_snapshot = json.dumps(profile, sort_keys=True, ensure_ascii=False)
-        prompt_text = SYSTEM_PROMPT + "\n\n" + user_prompt
-        prompt_hash = hashlib.sha1(prompt_text.encode("utf-8")).hexdigest()
         model_id = _get_model()
 
+        response_text = None
         start_time = time.monotonic()
         try:
             message = await client.messages.create(
@@ -92,52 +147,74 @@ class ClaudeProvider:
             latency_ms = int((time.monotonic() - start_time) * 1000)
 
             response_text = message.content[0].text
+            result = _parse_response(response_text)
+        except Exception as e:
+            translated = _translate_error(e, response_text)
+            if translated is e:
+                raise
+            raise translated
+
+        breadcrumbs = {
+            "provider": "claude",
+            "model": model_id,
+            "prompt_path": "services/llm/base.py:SYSTEM_PROMPT",
+            "prompt_hash": prompt_hash,
+            "raw_output": response_text,
+            "latency_ms": latency_ms,
+            "input_tokens": message.usage.input_tokens,
+            "output_tokens": message.usage.output_tokens,
+            "profile_snapshot": profile_snapshot,
+        }
+        return result, breadcrumbs
+
+    async def stream_analyze_and_generate(
+        self,
+        job_description: str,
+        profile: dict,
+        language: str = "en",
+    ):
+        """Stream the generation using Claude's streaming Messages API.
 
-            json_start = response_text.find("{")
-            json_end = response_text.rfind("}") + 1
-            if json_start == -1:
-                raise ValueError("No JSON found in response")
-            if json_end == 0:
-                # Has opening brace but no closing brace - truncated
-                raise ValueError(
-                    "AI response was truncated. Try a shorter job description."
-                )
-
-            json_str = response_text[json_start:json_end]
-            result = json.loads(json_str)
-
-            breadcrumbs = {
-                "provider": "claude",
-                "model": model_id,
-                "prompt_path": "services/llm/base.py:SYSTEM_PROMPT",
-                "prompt_hash": prompt_hash,
-                "raw_output": response_text,
-                "latency_ms": latency_ms,
-                "input_tokens": message.usage.input_tokens,
-                "output_tokens": message.usage.output_tokens,
-                "profile_snapshot": profile_snapshot,
-            }
-            return result, breadcrumbs
-
-        except anthropic.APIConnectionError as e:
-            logger.error(f"API connection error: {e}")
-            raise ConnectionError(f"Could not connect to AI service: {e}")
-        except anthropic.RateLimitError as e:
-            logger.error(f"Rate limit error: {e}")
-            raise RuntimeError("AI service is busy, please try again later")
-        except anthropic.APIStatusError as e:
-            logger.error(f"API status error: {e.status_code} - {e.message}")
-            raise RuntimeError(f"AI service error: {e.status_code} - {e.message}")
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error: {e}")
-            logger.error(
-                f"Response text (last 500 chars): {response_text[-500:] if response_text else 'None'}"
-            )
-            if response_text and not response_text.rstrip().endswith("}"):
-                raise ValueError(
-                    "AI response was truncated. Try a shorter job description."
-                )
-            raise ValueError(f"Invalid response from AI service: {e}")
+        Yields ("delta", text) for every text chunk as it arrives, then a
+        final ("done", (parsed, breadcrumbs)) with the same shapes as
+        analyze_and_generate. Errors are mapped the same way.
+        """
+        client = _get_client()
+        user_prompt, prompt_hash, profile_snapshot = _build_prompt(
+            job_description, profile, language
+        )
+        model_id = _get_model()
+
+        response_text = ""
+        start_time = time.monotonic()
+        try:
+            async with client.messages.stream(
+                model=model_id,
+                max_tokens=8192,
+                system=SYSTEM_PROMPT,
+                messages=[{"role": "user", "content": user_prompt}],
+            ) as stream:
+                async for text in stream.text_stream:
+                    response_text += text
+                    yield "delta", text
+                message = await stream.get_final_message()
+            latency_ms = int((time.monotonic() - start_time) * 1000)
+            result = _parse_response(response_text)
         except Exception as e:
-            logger.error(f"Unexpected error in Claude provider: {type(e).__name__}: {e}")
-            raise
+            translated = _translate_error(e, response_text)
+            if translated is e:
+                raise
+            raise translated
+
+        breadcrumbs = {
+            "provider": "claude",
+            "model": model_id,
+            "prompt_path": "services/llm/base.py:SYSTEM_PROMPT",
+            "prompt_hash": prompt_hash,
+            "raw_output": response_text,
+            "latency_ms": latency_ms,
+            "input_tokens": message.usage.input_tokens,
+            "output_tokens": message.usage.output_tokens,
+            "profile_snapshot": profile_snapshot,
+        }
+        yield "done", (result, breadcrumbs)
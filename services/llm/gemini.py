@@ -14,6 +14,7 @@ from .base import (
     LANGUAGE_INSTRUCTIONS,
     SYSTEM_PROMPT,
     USER_PROMPT_TEMPLATE,
+    ProviderBusyError,
 )
 
 logger = logging.getLogger(__name__)
@@ -38,9 +39,97 @@ def _get_model() -> str:
     return settings.GEMINI_MODEL
 
 
+def _build_prompt(job_description: str, profile: dict, language: str) -> tuple[str, str, str]:
+    """Return (full_prompt, prompt_hash, profile_snapshot) for a generation."""
+    profile_json = json.dumps(profile, indent=2)
+    language_instruction = LANGUAGE_INSTRUCTIONS.get(
+        language, LANGUAGE_INSTRUCTIONS["en"]
+    )
+    user_prompt = USER_PROMPT_TEMPLATE.format(
+        job_description=job_description,
+        profile_json=profile_json,
+        language_instruction=language_instruction,
+    )
+
+    # Combine system prompt and user prompt for Gemini
+    full_prompt = f"{SYSTEM_PROMPT}\n\n{user_prompt}"
+
+    profile_snapshot = json.dumps(profile, sort_keys=True, ensure_ascii=False)
+    prompt_hash = hashlib.sha1(full_prompt.encode("utf-8")).hexdigest()
+    return full_prompt, prompt_hash, profile_snapshot
+
+
+def _parse_response(response_text: str) -> dict:
+    """Extract the JSON object from the model's response text."""
+    json_start = response_text.find("{")
+    json_end = response_text.rfind("}") + 1
+    if json_start == -1:
+        raise ValueError("No JSON found in response")
+    if json_end == 0:
+        # Has opening brace but no closing brace - truncated
+        raise ValueError(
+            "AI response was truncated. Try a shorter job description."
+        )
+
+    json_str = response_text[json_start:json_end]
+    return json.loads(json_str)
+
+
+def _token_counts(usage) -> tuple[int | None, int | None]:
+    """Read (input_tokens, output_tokens) from usage_metadata, if exposed."""
+    input_tokens = None
+    output_tokens = None
+    if usage is not None:
+        prompt_count = getattr(usage, "prompt_token_count", None)
+        candidate_count = getattr(usage, "candidates_token_count", None)
+        if prompt_count is not None:
+            input_tokens = prompt_count
+        if candidate_count is not None:
+            output_tokens = candidate_count
+    return input_tokens, output_tokens
+
+
+def _translate_error(e: Exception, response_text: str | None, model: str) -> Exception:
+    """Map an API or parsing failure onto the errors the routes understand."""
+    if isinstance(e, errors.APIError):
+        logger.error(f"Gemini API error: {e.code} - {e.message}")
+
+        if e.code == 401:
+            return ValueError("Invalid GEMINI_API_KEY")
+        elif e.code == 404:
+            return ValueError(f"Model not found: {model}")
+        elif e.code == 429:
+            return ProviderBusyError("AI service is busy, please try again later")
+        else:
+            return RuntimeError(f"AI service error: {e.code} - {e.message}")
+
+    if isinstance(e, json.JSONDecodeError):
+        logger.error(f"JSON decode error: {e}")
+        logger.error(
+            f"Response text (last 500 chars): {response_text[-500:] if response_text else 'None'}"
+        )
+        if response_text and not response_text.rstrip().endswith("}"):
+            return ValueError(
+                "AI response was truncated. Try a shorter job description."
+            )
+        return ValueError(f"Invalid response from AI service: {e}")
+
+    # Handle connection errors
+    if "connect" in str(e).lower() or "network" in str(e).lower():
+        logger.error(f"Connection error: {e}")
+        return ConnectionError(f"Could not connect to AI service: {e}")
+    logger.error(f"Unexpected error in Gemini provider: {type(e).__name__}: {e}")
+    return e
+
+
 class GeminiProvider:
     """Gemini LLM provider using Google's GenAI API."""
 
+    def cache_key(self, job_description: str, profile: dict, language: str = "en") -> tuple[str, str, str]:
+        """Return the (provider, model, prompt_hash) a generation would be recorded under."""
+        _, prompt_hash, _ = _build_prompt(job_description, profile, language)
+        return "gemini", _get_model(), prompt_hash
+
     async def analyze_and_generate(
         self,
         job_description: str,
@@ -68,23 +157,11 @@ class GeminiProvider:
         """
         client = _get_client()
         model = _get_model()
-
-        profile_json = json.dumps(profile, indent=2)
-        language_instruction = LANGUAGE_INSTRUCTIONS.get(
-            language, LANGUAGE_INSTRUCTIONS["en"]
-        )
-        user_prompt = USER_PROMPT_TEMPLATE.format(
-            job_description=job_description,
-            profile_json=profile_json,
-            language_instruction=language_instruction,
+        full_prompt, prompt_hash, profile_snapshot = _build_prompt(
+            job_description, profile, language
         )
 
-        # Combine system prompt and user prompt for Gemini
-        full_prompt = f"{SYSTEM_PROMPT}\n\n{user_prompt}"
-
-        profile_snapshot = json.dumps(profile, sort_keys=True, ensure_ascii=False)
-        prompt_hash = hashlib.sha1(full_prompt.encode("utf-8")).hexdigest()
-
+        response_text = None
         start_time = time.monotonic()
         try:
             response = await client.aio.models.generate_content(
@@ -97,71 +174,80 @@ class GeminiProvider:
             latency_ms = int((time.monotonic() - start_time) * 1000)
 
             response_text = response.text
+            result = _parse_response(response_text)
+        except Exception as e:
+            translated = _translate_error(e, response_text, model)
+            if translated is e:
+                raise
+            raise translated
+
+        input_tokens, output_tokens = _token_counts(getattr(response, "usage_metadata", None))
+        breadcrumbs = {
+            "provider": "gemini",
+            "model": model,
+            "prompt_path": "services/llm/base.py:SYSTEM_PROMPT",
+            "prompt_hash": prompt_hash,
+            "raw_output": response_text,
+            "latency_ms": latency_ms,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "profile_snapshot": profile_snapshot,
+        }
+        return result, breadcrumbs
+
+    async def stream_analyze_and_generate(
+        self,
+        job_description: str,
+        profile: dict,
+        language: str = "en",
+    ):
+        """Stream the generation using Gemini's generate_content_stream.
+
+        Yields ("delta", text) for every text chunk as it arrives, then a
+        final ("done", (parsed, breadcrumbs)) with the same shapes as
+        analyze_and_generate. Usage is read from the last chunk that
+        carries usage_metadata.
+        """
+        client = _get_client()
+        model = _get_model()
+        full_prompt, prompt_hash, profile_snapshot = _build_prompt(
+            job_description, profile, language
+        )
 
-            # Parse JSON from response
-            json_start = response_text.find("{")
-            json_end = response_text.rfind("}") + 1
-            if json_start == -1:
-                raise ValueError("No JSON found in response")
-            if json_end == 0:
-                # Has opening brace but no closing brace - truncated
-                raise ValueError(
-                    "AI response was truncated. Try a shorter job description."
-                )
-
-            json_str = response_text[json_start:json_end]
-            result = json.loads(json_str)
-
-            usage = getattr(response, "usage_metadata", None)
-            input_tokens = None
-            output_tokens = None
-            if usage is not None:
-                prompt_count = getattr(usage, "prompt_token_count", None)
-                candidate_count = getattr(usage, "candidates_token_count", None)
-                if prompt_count is not None:
-                    input_tokens = prompt_count
-                if candidate_count is not None:
-                    output_tokens = candidate_count
-
-            breadcrumbs = {
-                "provider": "gemini",
-                "model": model,
-                "prompt_path": "services/llm/base.py:SYSTEM_PROMPT",
-                "prompt_hash": prompt_hash,
-                "raw_output": response_text,
-                "latency_ms": latency_ms,
-                "input_tokens": input_tokens,
-                "output_tokens": output_tokens,
-                "profile_snapshot": profile_snapshot,
-            }
-            return result, breadcrumbs
-
-        except errors.APIError as e:
-            logger.error(f"Gemini API error: {e.code} - {e.message}")
-
-            if e.code == 401:
-                raise ValueError("Invalid GEMINI_API_KEY")
-            elif e.code == 404:
-                raise ValueError(f"Model not found: {model}")
-            elif e.code == 429:
-                raise RuntimeError("AI service is busy, please try again later")
-            else:
-                raise RuntimeError(f"AI service error: {e.code} - {e.message}")
-
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error: {e}")
-            logger.error(
-                f"Response text (last 500 chars): {response_text[-500:] if response_text else 'None'}"
+        response_text = ""
+        usage = None
+        start_time = time.monotonic()
+        try:
+            stream = await client.aio.models.generate_content_stream(
+                model=model,
+                contents=full_prompt,
+                config=types.GenerateContentConfig(
+                    response_mime_type="application/json",
+                ),
             )
-            if response_text and not response_text.rstrip().endswith("}"):
-                raise ValueError(
-                    "AI response was truncated. Try a shorter job description."
-                )
-            raise ValueError(f"Invalid response from AI service: {e}")
+            async for chunk in stream:
+                usage = getattr(chunk, "usage_metadata", None) or usage
+                if chunk.text:
+                    response_text += chunk.text
+                    yield "delta", chunk.text
+            latency_ms = int((time.monotonic() - start_time) * 1000)
+            result = _parse_response(response_text)
         except Exception as e:
-            # Handle connection errors
-            if "connect" in str(e).lower() or "network" in str(e).lower():
-                logger.error(f"Connection error: {e}")
-                raise ConnectionError(f"Could not connect to AI service: {e}")
-            logger.error(f"Unexpected error in Gemini provider: {type(e).__name__}: {e}")
-            raise
+            translated = _translate_error(e, response_text, model)
+            if translated is e:
+                raise
+            raise translated
+
+        input_tokens, output_tokens = _token_counts(usage)
+        breadcrumbs = {
+            "provider": "gemini",
+            "model": model,
+            "prompt_path": "services/llm/base.py:SYSTEM_PROMPT",
+            "prompt_hash": prompt_hash,
+            "raw_output": response_text,
+            "latency_ms": latency_ms,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "profile_snapshot": profile_snapshot,
+        }
+        yield "done", (result, breadcrumbs)
@@ -0,0 +1,41 @@
+"""Client-side rate limiting for provider calls.
+
+Every uncached call through llm_service takes a token first, so bulk
+generation and concurrent single requests share one budget and stay under
+the provider's request limit instead of discovering it through 429s.
+"""
+
+import asyncio
+import time
+
+import settings
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``per_minute`` tokens per minute.
+
+    ``acquire`` reserves a token immediately, letting the balance go
+    negative, and then sleeps off its share of the deficit. Reservation
+    happens without awaiting, so callers on one event loop need no lock and
+    are served in arrival order. A non-positive rate disables limiting.
+    """
+
+    def __init__(self, per_minute: int | None = None, capacity: int | None = None):
+        self.per_minute = per_minute if per_minute is not None else settings.LLM_RATE_LIMIT_PER_MINUTE
+        self.capacity = capacity if capacity is not None else max(1, self.per_minute)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+
+    async def acquire(self):
+        if self.per_minute <= 0:
+            return
+        rate = self.per_minute / 60
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / rate)
+
+
+provider_rate_limit = TokenBucket()
@@ -0,0 +1,133 @@
+"""Incremental JSON parsing for streamed LLM output.
+
+Providers stream the resume JSON as text deltas. IncrementalJsonParser scans
+the deltas once, character by character, and reports each watched value as
+soon as its closing token arrives, so the caller can forward job_title,
+match_score, job_analysis and every work experience long before the whole
+document is complete.
+"""
+
+import json
+
+# Paths reported while streaming; "*" matches any array index.
+STREAMED_PATHS = (
+    ("job_title",),
+    ("company_name",),
+    ("match_score",),
+    ("job_analysis",),
+    ("resume", "summary"),
+    ("resume", "work_experiences", "*"),
+)
+
+_WHITESPACE = " \t\r\n"
+
+
+class _Frame:
+    """An open object or array on the parser stack."""
+
+    def __init__(self, kind: str, path: tuple, start: int):
+        self.kind = kind
+        self.path = path
+        self.start = start
+        self.key = None
+        self.index = 0
+        self.expecting = "key" if kind == "object" else "value"
+
+    def child_path(self) -> tuple:
+        return self.path + ((self.key,) if self.kind == "object" else (self.index,))
+
+
+class IncrementalJsonParser:
+    """Report watched values of a JSON document while it is still arriving.
+
+    Text before the first "{" (preambles, code fences) is skipped, as is
+    anything after the root object closes. ``text`` keeps everything fed so
+    far for the raw_output breadcrumb.
+    """
+
+    def __init__(self, paths=STREAMED_PATHS):
+        self.paths = paths
+        self.text = ""
+        self._pos = 0
+        self._stack: list[_Frame] = []
+        self._started = False
+        self._done = False
+        self._string_start = None
+        self._escape = False
+        self._scalar_start = None
+
+    def feed(self, delta: str) -> list[tuple[tuple, object]]:
+        """Consume a text delta and return the (path, value) pairs it completed."""
+        self.text += delta
+        completed = []
+        text = self.text
+        while self._pos < len(text) and not self._done:
+            char = text[self._pos]
+            if self._string_start is not None:
+                self._scan_string(char, completed)
+            elif self._scalar_start is not None and (char in ",}]" or char in _WHITESPACE):
+                self._complete(self._scalar_start, self._pos, completed)
+                self._scalar_start = None
+                continue
+            elif self._scalar_start is None:
+                self._scan_structure(char, completed)
+            self._pos += 1
+        return completed
+
+    def _scan_string(self, char: str, completed: list):
+        if self._escape:
+            self._escape = False
+        elif char == "\\":
+            self._escape = True
+        elif char == '"':
+            start, self._string_start = self._string_start, None
+            frame = self._stack[-1]
+            if frame.kind == "object" and frame.expecting == "key":
+                frame.key = json.loads(self.text[start:self._pos + 1])
+                frame.expecting = "colon"
+            else:
+                self._complete(start, self._pos + 1, completed)
+
+    def _scan_structure(self, char: str, completed: list):
+        if not self._started:
+            if char == "{":
+                self._stack.append(_Frame("object", (), self._pos))
+                self._started = True
+            return
+        if char in _WHITESPACE:
+            return
+        frame = self._stack[-1]
+        if char == '"':
+            self._string_start = self._pos
+        elif char == ":":
+            frame.expecting = "value"
+        elif char == ",":
+            if frame.kind == "object":
+                frame.expecting = "key"
+            else:
+                frame.index += 1
+                frame.expecting = "value"
+        elif char in "{[":
+            kind = "object" if char == "{" else "array"
+            self._stack.append(_Frame(kind, frame.child_path(), self._pos))
+        elif char in "}]":
+            closed = self._stack.pop()
+            if not self._stack:
+                self._done = True
+            else:
+                self._complete(closed.start, self._pos + 1, completed)
+        else:
+            self._scalar_start = self._pos
+
+    def _complete(self, start: int, end: int, completed: list):
+        frame = self._stack[-1]
+        path = frame.child_path()
+        frame.expecting = "comma"
+        if any(self._matches(pattern, path) for pattern in self.paths):
+            completed.append((path, json.loads(self.text[start:end])))
+
+    @staticmethod
+    def _matches(pattern: tuple, path: tuple) -> bool:
+        return len(pattern) == len(path) and all(
+            expected == "*" or expected == actual for expected, actual in zip(pattern, path)
+        )
@@ -0,0 +1,130 @@
+# Lean Code — BSD 3-Clause License — Vivian Voss, 2026
+# Scope: Disk-backed, size-bounded LRU cache of rendered PDFs keyed by their render inputs.
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PdfCache:
+    """Rendered PDFs stored as ``{scope}_{key}.pdf`` files.
+
+    The key is a hash of everything that determines the output, so a changed
+    resume, template, stylesheet or language simply misses. The scope (the
+    resume id) lets ``invalidate`` drop a resume's entries as soon as it is
+    edited instead of waiting for eviction. File mtimes record last use;
+    ``put`` evicts least-recently-used files once the directory exceeds
+    PDF_CACHE_MAX_BYTES. The directory size is kept as a running total,
+    so it is scanned on first use and on eviction only.
+
+    Every method does blocking file I/O: async callers run them in a thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # directory -> total bytes of its cached PDFs
+        self._sizes: dict[Path, int] = {}
+
+    @staticmethod
+    def key(context: dict, template: str, template_hash: str, language: str) -> str:
+        payload = json.dumps(
+            [context, template, template_hash, language],
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _dir(self) -> Path:
+        return Path(settings.PDF_CACHE_DIR)
+
+    def _path(self, key: str, scope: int | None) -> Path:
+        return self._dir() / f"{scope if scope is not None else 'adhoc'}_{key}.pdf"
+
+    def get(self, key: str, scope: int | None = None) -> bytes | None:
+        path = self._path(key, scope)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def put(self, key: str, data: bytes, scope: int | None = None):
+        directory = self._dir()
+        path = self._path(key, scope)
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            with self._lock:
+                total = self._total(directory) - _size(path)
+                os.replace(tmp_path, path)
+                total += len(data)
+                if total > settings.PDF_CACHE_MAX_BYTES:
+                    total = self._evict(directory)
+                self._sizes[directory] = total
+        except OSError as e:
+            logger.warning(f"Could not write PDF cache entry: {e}")
+
+    def invalidate(self, scope: int):
+        directory = self._dir()
+        with self._lock:
+            removed = 0
+            for path in directory.glob(f"{scope}_*.pdf"):
+                size = _size(path)
+                path.unlink(missing_ok=True)
+                removed += size
+            if directory in self._sizes:
+                self._sizes[directory] -= removed
+
+    def _total(self, directory: Path) -> int:
+        if directory not in self._sizes:
+            self._sizes[directory] = sum(size for _, size, _ in self._scan(directory))
+        return self._sizes[directory]
+
+    @staticmethod
+    def _scan(directory: Path) -> list[tuple[float, int, str]]:
+        entries = []
+        for entry in os.scandir(directory):
+            if entry.name.endswith(".pdf"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self, directory: Path) -> int:
+        """Delete least-recently-used files down to the limit; returns the bytes left.
+
+        Rescans the directory, so the running total also picks up files
+        written or removed by other processes.
+        """
+        entries = self._scan(directory)
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= settings.PDF_CACHE_MAX_BYTES:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        return total
+
+
+def _size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+pdf_cache = PdfCache()
@@ -1,13 +1,26 @@
 # Lean Code — BSD 3-Clause License — Vivian Voss, 2026
-# Scope: Generate PDF resumes from HTML templates using Playwright Chromium.
+# Scope: Generate PDF resumes from HTML templates using pooled Playwright Chromium.
 
+import asyncio
+import hashlib
+import logging
+import math
+import threading
+import time
+import zipfile
+from contextlib import contextmanager
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from playwright.sync_api import sync_playwright
+from jinja2 import Environment, FileSystemLoader, TemplateError, select_autoescape
 
-from services.translations import load_translations, format_date
+import settings
+from database import run_in_db
+from services.browser_pool import browser_pool
+from services.pdf_cache import pdf_cache
+from services.photo_store import photo_store
+from services.translations import load_translations, format_dates
 
+logger = logging.getLogger(__name__)
 
 PAGE_SETTINGS = {
     "classic":    {"format": "A4", "margin": {"top": "20mm", "right": "20mm", "bottom": "20mm", "left": "20mm"}},
@@ -17,54 +30,252 @@ PAGE_SETTINGS = {
 }
 
 
+class PdfQueueFullError(Exception):
+    """Raised when every browser is busy and the render queue is full."""
+
+    def __init__(self, retry_after: int):
+        super().__init__("PDF export is busy, please try again shortly")
+        self.retry_after = retry_after
+
+
 class PdfGeneratorService:
     TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
     VALID_TEMPLATES = ["classic", "modern", "brussels", "eu_classic"]
+    BASE_CSS = "resume_base.css"
 
     def __init__(self):
         self.env = Environment(
             loader=FileSystemLoader(self.TEMPLATES_DIR),
             autoescape=select_autoescape(["html"])
         )
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self._average_export_seconds = 1.0
+        self._compiled: dict[str, tuple] = {}
+        self._fingerprint: tuple = ()
+        self._watcher: threading.Thread | None = None
+        self._watcher_stop = threading.Event()
+        self.compile_templates()
+
+    def compile_templates(self):
+        """Compile every template once with the base stylesheet inlined into its head.
+
+        Each entry is (jinja template, content hash); the hash feeds the PDF
+        cache key. The mtime fingerprint of all source files is kept so
+        ``reload_if_changed`` can tell when a recompile is due.
+        """
+        fingerprint = self._read_fingerprint()
+        css = (self.TEMPLATES_DIR / self.BASE_CSS).read_text()
+        style = "<style>{% raw %}" + css + "{% endraw %}</style></head>"
+        compiled = {}
+        for template in self.VALID_TEMPLATES:
+            source = (self.TEMPLATES_DIR / f"resume_{template}.html").read_text()
+            bundled = source.replace("</head>", style, 1)
+            content_hash = hashlib.sha256(bundled.encode("utf-8")).hexdigest()
+            compiled[template] = (self.env.from_string(bundled), content_hash)
+        self._compiled = compiled
+        self._fingerprint = fingerprint
+
+    def reload_if_changed(self) -> bool:
+        fingerprint = self._read_fingerprint()
+        if fingerprint == self._fingerprint:
+            return False
+        try:
+            self.compile_templates()
+        except (OSError, TemplateError) as e:
+            self._fingerprint = fingerprint
+            logger.warning(f"Keeping previous resume templates, recompile failed: {e}")
+            return False
+        logger.info("Resume templates changed on disk, recompiled")
+        return True
+
+    def watch_templates(self, interval: float = 1.0):
+        """Poll the template files and recompile on change (development only)."""
+        if self._watcher is not None:
+            return
+        self._watcher_stop.clear()
+        self._watcher = threading.Thread(
+            target=self._watch, args=(interval,), name="pdf-template-watcher", daemon=True
+        )
+        self._watcher.start()
+
+    def stop_watching(self):
+        if self._watcher is None:
+            return
+        self._watcher_stop.set()
+        self._watcher.join()
+        self._watcher = None
+
+    def _watch(self, interval: float):
+        while not self._watcher_stop.wait(interval):
+            self.reload_if_changed()
+
+    def _read_fingerprint(self) -> tuple:
+        names = [f"resume_{template}.html" for template in self.VALID_TEMPLATES] + [self.BASE_CSS]
+        return tuple((self.TEMPLATES_DIR / name).stat().st_mtime_ns for name in names)
+
+    def generate_pdf(
+        self, resume_data: dict, template: str = "classic", language: str = "en", resume_id: int | None = None
+    ) -> bytes:
+        context, key = self.prepare_render(resume_data, template, language)
+        pdf_bytes = pdf_cache.get(key, resume_id)
+        if pdf_bytes is None:
+            html = self._build_html(context, template, self._photo_data_url(context))
+            with self._admitted():
+                pdf_bytes = browser_pool.run(self._render(html, PAGE_SETTINGS[template]))
+            pdf_cache.put(key, pdf_bytes, resume_id)
+        return pdf_bytes
+
+    async def generate_pdf_async(
+        self,
+        resume_data: dict,
+        template: str = "classic",
+        language: str = "en",
+        resume_id: int | None = None,
+        prepared: tuple[dict, str] | None = None,
+    ) -> bytes:
+        """Render without holding a worker thread; the caller's loop stays free while Chromium works.
+
+        Cache reads and writes are file I/O and run in a thread as well.
+        ``prepared`` is the ``prepare_render`` result for the same inputs,
+        for callers that already computed it (e.g. for an ETag).
+        """
+        context, key = prepared or self.prepare_render(resume_data, template, language)
+        pdf_bytes = await asyncio.to_thread(pdf_cache.get, key, resume_id)
+        if pdf_bytes is None:
+            html = self._build_html(context, template, await self._photo_data_url_async(context))
+            with self._admitted():
+                pdf_bytes = await browser_pool.run_async(self._render(html, PAGE_SETTINGS[template]))
+            await asyncio.to_thread(pdf_cache.put, key, pdf_bytes, resume_id)
+        return pdf_bytes
+
+    async def generate_pdf_batch(
+        self, resume_data: dict, variants: list[tuple[str, str]], resume_id: int | None = None
+    ) -> list[bytes]:
+        """Render (template, language) variants in parallel pages of one pooled browser.
+
+        Cached variants are served from the PDF cache; the rest are rendered
+        together and count as a single admitted export. Results follow the
+        order of ``variants``.
+        """
+        keyed = [self.prepare_render(resume_data, template, language) for template, language in variants]
+        results = await asyncio.to_thread(lambda: [pdf_cache.get(key, resume_id) for _, key in keyed])
+        misses = [index for index, pdf_bytes in enumerate(results) if pdf_bytes is None]
+        if misses:
+            # Every variant shows the same photo: resolve it once for the batch
+            photo = await self._photo_data_url_async(keyed[misses[0]][0])
+            jobs = [
+                (self._build_html(keyed[index][0], variants[index][0], photo), PAGE_SETTINGS[variants[index][0]])
+                for index in misses
+            ]
+            with self._admitted():
+                rendered = await browser_pool.run_async(self._render_many(jobs))
+            for index, pdf_bytes in zip(misses, rendered):
+                results[index] = pdf_bytes
+
+            def store():
+                for index in misses:
+                    pdf_cache.put(keyed[index][1], results[index], resume_id)
 
-    def generate_pdf(self, resume_data: dict, template: str = "classic", language: str = "en") -> bytes:
+            await asyncio.to_thread(store)
+        return results
+
+    def prepare_render(self, resume_data: dict, template: str = "classic", language: str = "en") -> tuple[dict, str]:
+        """Render context and key for these inputs.
+
+        The key is the content address of the PDF they render to: the PDF
+        cache key, and the export's ETag.
+        """
         if template not in self.VALID_TEMPLATES:
             raise ValueError(f"Invalid template: {template}")
 
-        html_template = self.env.get_template(f"resume_{template}.html")
-        html_content = html_template.render(**self._prepare_context(resume_data, language))
+        context = self._prepare_context(resume_data, language)
+        return context, pdf_cache.key(context, template, self._template_hash(template), language)
 
-        css_content = (self.TEMPLATES_DIR / "resume_base.css").read_text()
-        html_with_style = html_content.replace("</head>", f"<style>{css_content}</style></head>")
+    def _template_hash(self, template: str) -> str:
+        return self._compiled[template][1]
 
-        settings = PAGE_SETTINGS[template]
+    def _build_html(self, context: dict, template: str, photo: str | None = None) -> str:
+        """Render the template; ``photo`` is the data URL of the context's photo_ref, if any."""
+        if photo:
+            context = {**context, "personal_info": {**context["personal_info"], "photo": photo}}
+        return self._compiled[template][0].render(**context)
 
-        with sync_playwright() as playwright:
-            browser = playwright.chromium.launch()
-            page = browser.new_page()
-            page.set_content(html_with_style, wait_until="load")
-            pdf_bytes = page.pdf(
-                format=settings["format"],
-                margin=settings["margin"],
-                print_background=True,
-            )
-            browser.close()
+    @staticmethod
+    def _photo_data_url(context: dict) -> str | None:
+        """The referenced photo as a data URL for Chromium's set_content.
 
-        return pdf_bytes
+        Resolved only when actually rendering, so cache keys hash the short
+        photo_ref instead of the image. Reads the blob store: async callers
+        go through ``_photo_data_url_async``.
+        """
+        return photo_store.data_url(context["personal_info"].get("photo_ref"))
+
+    async def _photo_data_url_async(self, context: dict) -> str | None:
+        if not context["personal_info"].get("photo_ref"):
+            return None
+        return await run_in_db(self._photo_data_url, context)
+
+    @contextmanager
+    def _admitted(self):
+        """Admit one render or raise PdfQueueFullError.
+
+        Concurrency is bounded by the browser pool's capacity; up to
+        PDF_RENDER_QUEUE_SIZE further renders wait for a free page. The
+        Retry-After hint is the running average export latency.
+        """
+        capacity = browser_pool.size + settings.PDF_RENDER_QUEUE_SIZE
+        with self._pending_lock:
+            if self._pending >= capacity:
+                raise PdfQueueFullError(max(1, math.ceil(self._average_export_seconds)))
+            self._pending += 1
+        started = time.monotonic()
+        try:
+            yield
+            elapsed = time.monotonic() - started
+            self._average_export_seconds = 0.8 * self._average_export_seconds + 0.2 * elapsed
+        finally:
+            with self._pending_lock:
+                self._pending -= 1
+
+    async def _render(self, html: str, page_settings: dict) -> bytes:
+        async with browser_pool.page() as page:
+            return await self._render_on(page, html, page_settings)
+
+    async def _render_many(self, jobs: list[tuple[str, dict]]) -> list[bytes]:
+        async with browser_pool.pages(len(jobs)) as pages:
+            return await asyncio.gather(*(
+                self._render_on(page, html, page_settings)
+                for page, (html, page_settings) in zip(pages, jobs)
+            ))
+
+    @staticmethod
+    async def _render_on(page, html: str, page_settings: dict) -> bytes:
+        await page.set_content(html, wait_until="load")
+        return await page.pdf(
+            format=page_settings["format"],
+            margin=page_settings["margin"],
+            print_background=True,
+        )
 
     def _prepare_context(self, resume_data: dict, language: str = "en") -> dict:
-        translations = load_translations(language)
+        work_experiences = [
+            dict(exp) for exp in resume_data.get("work_experiences", []) if exp.get("included", True)
+        ]
+        dates = iter(format_dates(
+            (date for exp in work_experiences for date in (exp.get("start_date"), exp.get("end_date"))),
+            language,
+        ))
+        for exp, start, end in zip(work_experiences, dates, dates):
+            exp["formatted_start_date"], exp["formatted_end_date"] = start, end
 
-        work_experiences = []
-        for exp in resume_data.get("work_experiences", []):
-            if exp.get("included", True):
-                formatted_exp = dict(exp)
-                formatted_exp["formatted_start_date"] = format_date(exp.get("start_date"), language)
-                formatted_exp["formatted_end_date"] = format_date(exp.get("end_date"), language)
-                work_experiences.append(formatted_exp)
+        # A served photo URL cannot load inside set_content; _photo_data_url resolves photo_ref instead
+        personal_info = dict(resume_data.get("personal_info") or {})
+        if not str(personal_info.get("photo") or "").startswith("data:"):
+            personal_info.pop("photo", None)
 
         return {
-            "personal_info": resume_data.get("personal_info", {}),
+            "personal_info": personal_info,
             "summary": resume_data.get("summary"),
             "work_experiences": work_experiences,
             "skills": [
@@ -83,7 +294,8 @@ class PdfGeneratorService:
                 lang for lang in resume_data.get("languages", [])
                 if lang.get("included", True)
             ],
-            "labels": translations,
+            # A copy: the shared bundle is read-only and the context is JSON-hashed for the cache key
+            "labels": dict(load_translations(language)),
             "language": language,
         }
 
@@ -100,4 +312,33 @@ class PdfGeneratorService:
         return f"{name}_Resume_{company}.pdf"
 
 
+class _ZipChunks:
+    """Write-only, unseekable sink; zipfile streams entries into it."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_zip(entries: list[tuple[str, bytes]]):
+    """Yield a ZIP archive of (name, data) entries one entry at a time."""
+    sink = _ZipChunks()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in entries:
+            archive.writestr(name, data)
+            yield sink.drain()
+    yield sink.drain()
+
+
 pdf_generator_service = PdfGeneratorService()
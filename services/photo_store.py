@@ -0,0 +1,150 @@
+# Lean Code — BSD 3-Clause License — Vivian Voss, 2026
+# Scope: Content-addressed photo blobs — decoded bytes keyed by SHA-256, referenced from users.photo_ref.
+
+import base64
+import hashlib
+import io
+import re
+
+from PIL import Image, ImageOps
+
+import settings
+from database import get_db
+
+_DATA_URL_RE = re.compile(r"^data:(image/[\w.+-]+);base64,(.*)$", re.DOTALL)
+
+
+def decode_data_url(data_url: str) -> tuple[str, bytes]:
+    """Split a base64 image data URL into (mime_type, raw bytes)."""
+    match = _DATA_URL_RE.match(data_url)
+    if not match:
+        raise ValueError("Invalid image data format")
+    return match.group(1), base64.b64decode(match.group(2), validate=True)
+
+
+def _encode_variant(image, size: int) -> tuple[str, bytes]:
+    variant = image.copy()
+    variant.thumbnail((size, size), Image.Resampling.LANCZOS)
+    buffer = io.BytesIO()
+    variant.save(buffer, format=settings.PHOTO_FORMAT, quality=settings.PHOTO_QUALITY, optimize=True)
+    return f"image/{settings.PHOTO_FORMAT.lower()}", buffer.getvalue()
+
+
+def normalize_photo(mime_type: str, data: bytes) -> dict[str, tuple[str, bytes]]:
+    """Re-encode an upload into its "print" and "thumb" variants.
+
+    The image is rotated per its EXIF orientation, flattened onto white and
+    downscaled to PHOTO_PRINT_SIZE / PHOTO_THUMB_SIZE on its longest edge;
+    saving without ``exif=`` drops the metadata.
+    """
+    try:
+        with Image.open(io.BytesIO(data)) as source:
+            image = ImageOps.exif_transpose(source)
+            image.load()
+    except (OSError, Image.DecompressionBombError) as e:
+        raise ValueError("Invalid image data") from e
+    if image.mode != "RGB":
+        rgba = image.convert("RGBA")
+        image = Image.new("RGB", rgba.size, "white")
+        image.paste(rgba, mask=rgba.getchannel("A"))
+    return {
+        "print": _encode_variant(image, settings.PHOTO_PRINT_SIZE),
+        "thumb": _encode_variant(image, settings.PHOTO_THUMB_SIZE),
+    }
+
+
+def store_blob(conn, mime_type: str, data: bytes) -> str:
+    """Insert the bytes unless already stored and return their SHA-256 key."""
+    photo_hash = hashlib.sha256(data).hexdigest()
+    conn.execute(
+        "INSERT OR IGNORE INTO photo_blobs (hash, mime_type, data, size) VALUES (?, ?, ?, ?)",
+        (photo_hash, mime_type, data, len(data)),
+    )
+    return photo_hash
+
+
+def prune_blobs(conn):
+    """Delete blobs neither a user nor a generated resume references any more."""
+    conn.execute(
+        """
+        DELETE FROM photo_blobs WHERE hash NOT IN (
+            SELECT photo_ref FROM users WHERE photo_ref IS NOT NULL
+            UNION SELECT photo_thumb_ref FROM users WHERE photo_thumb_ref IS NOT NULL
+            UNION SELECT json_extract(resume_content, '$.personal_info.photo_ref')
+                FROM generated_resumes
+                WHERE json_extract(resume_content, '$.personal_info.photo_ref') IS NOT NULL
+        )
+        """
+    )
+
+
+class PhotoStore:
+    """The user's photo, stored once as binary outside the users row.
+
+    Uploads are normalized into a print variant (``photo_ref``, embedded
+    in PDFs) and a UI thumbnail (``photo_thumb_ref``). Profile reads and
+    generated resumes carry only the refs; the bytes are fetched by hash from
+    ``GET /api/photos/{hash}``, which can be cached forever since a hash
+    never changes meaning.
+    """
+
+    def set_user_photo(self, data_url: str, user_id: int = 1) -> tuple[str, str]:
+        """Store the normalized variants and return (photo_ref, photo_thumb_ref)."""
+        variants = normalize_photo(*decode_data_url(data_url))
+        with get_db() as conn:
+            photo_ref = store_blob(conn, *variants["print"])
+            thumb_ref = store_blob(conn, *variants["thumb"])
+            conn.execute(
+                "UPDATE users SET photo_ref = ?, photo_thumb_ref = ?, updated_at = CURRENT_TIMESTAMP "
+                "WHERE id = ?",
+                (photo_ref, thumb_ref, user_id),
+            )
+            prune_blobs(conn)
+            conn.commit()
+        return photo_ref, thumb_ref
+
+    def clear_user_photo(self, user_id: int = 1) -> bool:
+        with get_db() as conn:
+            cursor = conn.execute(
+                "UPDATE users SET photo_ref = NULL, photo_thumb_ref = NULL, updated_at = CURRENT_TIMESTAMP "
+                "WHERE id = ? AND photo_ref IS NOT NULL",
+                (user_id,),
+            )
+            prune_blobs(conn)
+            conn.commit()
+            return cursor.rowcount > 0
+
+    def get_user_photo_refs(self, user_id: int = 1) -> tuple[str | None, str | None]:
+        """Return (photo_ref, photo_thumb_ref) for the user."""
+        with get_db() as conn:
+            row = conn.execute(
+                "SELECT photo_ref, photo_thumb_ref FROM users WHERE id = ?", (user_id,)
+            ).fetchone()
+        return (row["photo_ref"], row["photo_thumb_ref"]) if row else (None, None)
+
+    def get(self, photo_hash: str) -> tuple[str, bytes] | None:
+        """Return (mime_type, bytes) for a stored photo, or None."""
+        with get_db() as conn:
+            row = conn.execute(
+                "SELECT mime_type, data FROM photo_blobs WHERE hash = ?", (photo_hash,)
+            ).fetchone()
+        return (row["mime_type"], row["data"]) if row else None
+
+    def exists(self, photo_hash: str) -> bool:
+        with get_db() as conn:
+            row = conn.execute("SELECT 1 FROM photo_blobs WHERE hash = ?", (photo_hash,)).fetchone()
+        return row is not None
+
+    def data_url(self, photo_hash: str | None) -> str | None:
+        """Rebuild the data URL for a stored photo, for self-contained HTML such as PDFs."""
+        blob = self.get(photo_hash) if photo_hash else None
+        if blob is None:
+            return None
+        mime_type, data = blob
+        return f"data:{mime_type};base64,{base64.b64encode(data).decode('ascii')}"
+
+    def user_data_url(self, user_id: int = 1) -> str | None:
+        return self.data_url(self.get_user_photo_refs(user_id)[0])
+
+
+photo_store = PhotoStore()
@@ -1,57 +1,106 @@
-from database import get_db
+import json
+import threading
+
+import settings
+from database import get_db, AsyncService, USER_COLUMNS, PROFILE_VERSION_SQL
 from schemas import CompleteProfile
 
+# Each section is aggregated to a JSON array in SQL so the whole profile comes
+# back as one row. json_group_array keeps the order of its ordered subquery.
+_COMPLETE_PROFILE_SQL = f"""
+    SELECT
+        ({PROFILE_VERSION_SQL}) AS version,
+        (SELECT json_object(
+            'id', id, 'full_name', full_name, 'email', email, 'phone', phone,
+            'location', location, 'linkedin_url', linkedin_url, 'summary', summary,
+            'photo_ref', photo_ref, 'photo_thumb_ref', photo_thumb_ref, 'photo', photo,
+            'created_at', created_at, 'updated_at', updated_at)
+         FROM (SELECT {USER_COLUMNS} FROM users WHERE id = :user_id)
+        ) AS personal_info,
+        (SELECT json_group_array(json_object(
+            'id', id, 'company', company, 'title', title, 'start_date', start_date,
+            'end_date', end_date, 'is_current', is_current, 'description', description,
+            'location', location, 'user_id', user_id,
+            'created_at', created_at, 'updated_at', updated_at))
+         FROM (SELECT * FROM work_experiences WHERE user_id = :user_id
+               ORDER BY is_current DESC, start_date DESC)
+        ) AS work_experiences,
+        (SELECT json_group_array(json_object(
+            'id', id, 'institution', institution, 'degree', degree,
+            'field_of_study', field_of_study, 'graduation_year', graduation_year,
+            'gpa', gpa, 'notes', notes, 'user_id', user_id,
+            'created_at', created_at, 'updated_at', updated_at))
+         FROM (SELECT * FROM education WHERE user_id = :user_id ORDER BY graduation_year DESC)
+        ) AS education,
+        (SELECT json_group_array(json_object('id', id, 'name', name, 'user_id', user_id))
+         FROM (SELECT * FROM skills WHERE user_id = :user_id ORDER BY name)
+        ) AS skills,
+        (SELECT json_group_array(json_object(
+            'id', id, 'name', name, 'description', description,
+            'technologies', technologies, 'url', url,
+            'start_date', start_date, 'end_date', end_date, 'user_id', user_id,
+            'created_at', created_at, 'updated_at', updated_at))
+         FROM (SELECT * FROM projects WHERE user_id = :user_id ORDER BY start_date DESC)
+        ) AS projects,
+        (SELECT json_group_array(json_object(
+            'id', id, 'name', name, 'level', level, 'display_order', display_order,
+            'user_id', user_id, 'created_at', created_at, 'updated_at', updated_at))
+         FROM (SELECT * FROM languages WHERE user_id = :user_id ORDER BY display_order ASC, id ASC)
+        ) AS languages
+"""
+
+_SECTIONS = ("work_experiences", "education", "skills", "projects", "languages")
+
 
 class ProfileService:
-    def get_complete(self, user_id: int = 1) -> CompleteProfile:
-        with get_db() as conn:
-            personal_info = None
-            cursor = conn.execute("SELECT * FROM users WHERE id = ?", (user_id,))
-            row = cursor.fetchone()
-            if row:
-                personal_info = dict(row)
+    """Profile reads, memoized per profile version.
 
-            cursor = conn.execute(
-                """
-                SELECT * FROM work_experiences
-                WHERE user_id = ?
-                ORDER BY is_current DESC, start_date DESC
-                """,
-                (user_id,),
-            )
-            work_experiences = [dict(row) for row in cursor.fetchall()]
+    Every route that mutates profile data calls ``bump_version`` after
+    committing; ``get_complete`` reuses the snapshot loaded at the current
+    version and otherwise loads the profile in a single query. Snapshots are
+    shared, so callers must not mutate them (``model_dump`` a copy instead).
+    """
 
-            cursor = conn.execute(
-                "SELECT * FROM education WHERE user_id = ? ORDER BY graduation_year DESC",
-                (user_id,),
-            )
-            education = [dict(row) for row in cursor.fetchall()]
+    def __init__(self):
+        self._version = 0
+        self._snapshots: dict[tuple[str, int], tuple[int, CompleteProfile]] = {}
+        self._lock = threading.Lock()
 
-            cursor = conn.execute(
-                "SELECT * FROM skills WHERE user_id = ? ORDER BY name", (user_id,)
-            )
-            skills = [dict(row) for row in cursor.fetchall()]
+    @property
+    def version(self) -> int:
+        return self._version
 
-            cursor = conn.execute(
-                "SELECT * FROM projects WHERE user_id = ? ORDER BY start_date DESC",
-                (user_id,),
-            )
-            projects = [dict(row) for row in cursor.fetchall()]
+    def bump_version(self):
+        """Mark every cached profile snapshot stale."""
+        with self._lock:
+            self._version += 1
+            self._snapshots.clear()
 
-            cursor = conn.execute(
-                "SELECT * FROM languages WHERE user_id = ? ORDER BY display_order ASC, id ASC",
-                (user_id,),
-            )
-            languages = [dict(row) for row in cursor.fetchall()]
-
-            return CompleteProfile(
-                personal_info=personal_info,
-                work_experiences=work_experiences,
-                education=education,
-                skills=skills,
-                projects=projects,
-                languages=languages,
-            )
+    def get_complete(self, user_id: int = 1) -> CompleteProfile:
+        # Read the version before loading: a write landing mid-load bumps it,
+        # so the snapshot is filed under an already stale version
+        version = self._version
+        key = (settings.DATABASE, user_id)
+        cached = self._snapshots.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        profile = self._load_complete(user_id)
+        with self._lock:
+            if self._version == version:
+                self._snapshots[key] = (version, profile)
+        return profile
+
+    def _load_complete(self, user_id: int) -> CompleteProfile:
+        with get_db() as conn:
+            row = conn.execute(_COMPLETE_PROFILE_SQL, {"user_id": user_id}).fetchone()
+
+        personal_info = json.loads(row["personal_info"]) if row["personal_info"] else None
+        return CompleteProfile(
+            version=row["version"],
+            personal_info=personal_info,
+            **{section: json.loads(row[section]) for section in _SECTIONS},
+        )
 
     def has_work_experience(self, user_id: int = 1) -> bool:
         with get_db() as conn:
@@ -63,3 +112,4 @@ class ProfileService:
 
 
 profile_service = ProfileService()
+async_profile_service = AsyncService(profile_service)
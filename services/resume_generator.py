@@ -1,8 +1,11 @@
 import json
-from database import get_db
+from database import get_db, run_in_db, AsyncService, decode_cursor, encode_cursor, like_pattern
 from services.profile import profile_service
+from services.photo_store import photo_store
 from services.llm import llm_service
+from services.llm.streaming import IncrementalJsonParser
 from services.jobs import job_service
+from services.pdf_cache import pdf_cache
 from schemas import (
     GeneratedResumeResponse,
     JobAnalysis,
@@ -23,22 +26,88 @@ def read_experiences_chronologically(experiences: list[dict]) -> list[dict]:
     return sorted(experiences, key=lambda we: we.get("start_date") or "", reverse=True)
 
 
+def _stream_event_name(path: tuple) -> str:
+    if path[:2] == ("resume", "work_experiences"):
+        return "work_experience"
+    return path[-1]
+
+
 class ResumeGeneratorService:
-    async def generate(self, job_description: str, job_id: int | None = None, language: str = "en") -> GeneratedResumeResponse:
-        if not profile_service.has_work_experience():
-            raise ProfileIncompleteError(
-                "Your profile needs work experience before you can generate a tailored resume."
-            )
+    async def generate(
+        self,
+        job_description: str,
+        job_id: int | None = None,
+        language: str = "en",
+        bypass_cache: bool = False,
+    ) -> GeneratedResumeResponse:
+        profile_dict, profile_meta = await run_in_db(self._prepare_profile, job_id)
+        return await self.generate_for_profile(
+            profile_dict, profile_meta, job_description, job_id, language, bypass_cache
+        )
 
-        profile = profile_service.get_complete()
-        profile_dict = profile.model_dump()
+    async def generate_for_profile(
+        self,
+        profile_dict: dict,
+        profile_meta: dict,
+        job_description: str,
+        job_id: int | None = None,
+        language: str = "en",
+        bypass_cache: bool = False,
+    ) -> GeneratedResumeResponse:
+        """Generate against a profile already returned by load_profile.
+
+        Lets bulk generation read the profile once for many jobs; the
+        profile is not modified.
+        """
+        llm_result, breadcrumbs = await llm_service.analyze_and_generate(
+            job_description, profile_dict, language, bypass_cache=bypass_cache
+        )
+
+        return await run_in_db(
+            self._save_result,
+            llm_result, breadcrumbs, profile_dict, profile_meta, job_description, job_id, language,
+        )
+
+    async def generate_stream(
+        self,
+        job_description: str,
+        job_id: int | None = None,
+        language: str = "en",
+        bypass_cache: bool = False,
+    ):
+        """Start a streamed generation and return its async event iterator.
+
+        Profile and job checks run before this resolves, so their errors can
+        still become ordinary HTTP responses. The iterator yields
+        (event, data) pairs: job_title, company_name, match_score,
+        job_analysis, summary and one work_experience per entry as the model
+        completes them, then "resume" with the persisted record.
+        """
+        profile_dict, profile_meta = await run_in_db(self._prepare_profile, job_id)
+        return self._stream(job_description, job_id, language, profile_dict, profile_meta, bypass_cache)
+
+    async def _stream(self, job_description, job_id, language, profile_dict, profile_meta, bypass_cache):
+        parser = IncrementalJsonParser()
+        llm_result = breadcrumbs = None
+        async for kind, payload in llm_service.stream_analyze_and_generate(
+            job_description, profile_dict, language, bypass_cache=bypass_cache
+        ):
+            if kind == "delta":
+                for path, value in parser.feed(payload):
+                    yield _stream_event_name(path), value
+            else:
+                llm_result, breadcrumbs = payload
+
+        if llm_result is None:
+            raise RuntimeError("AI service ended the stream without a result")
+        resume = await run_in_db(
+            self._save_result,
+            llm_result, breadcrumbs, profile_dict, profile_meta, job_description, job_id, language,
+        )
+        yield "resume", resume.model_dump()
 
-        # Save photo before removing it (we'll restore it later)
-        saved_photo = None
-        if profile_dict.get("personal_info") and "photo" in profile_dict["personal_info"]:
-            saved_photo = profile_dict["personal_info"]["photo"]
-            # Remove photo from profile to avoid sending huge base64 data to LLM
-            del profile_dict["personal_info"]["photo"]
+    def _prepare_profile(self, job_id: int | None) -> tuple[dict, dict]:
+        profile_dict, profile_meta = self.load_profile()
 
         if job_id is not None:
             with get_db() as conn:
@@ -46,12 +115,42 @@ class ResumeGeneratorService:
                 if cursor.fetchone() is None:
                     raise ValueError(f"Job with id {job_id} not found")
 
-        llm_result, breadcrumbs = await llm_service.analyze_and_generate(job_description, profile_dict, language)
+        return profile_dict, profile_meta
+
+    def load_profile(self) -> tuple[dict, dict]:
+        """Return the profile to send to the LLM and what is withheld from it.
 
-        # Restore photo to profile_dict for use in resume
-        if saved_photo and profile_dict.get("personal_info"):
-            profile_dict["personal_info"]["photo"] = saved_photo
+        The second item holds the profile ``version`` the resume is built
+        from and the ``photo_ref`` of the profile photo.
+        """
+        profile = profile_service.get_complete()
+        if not profile.work_experiences:
+            raise ProfileIncompleteError(
+                "Your profile needs work experience before you can generate a tailored resume."
+            )
 
+        profile_dict = profile.model_dump()
+        profile_meta = {"version": profile_dict.pop("version"), "photo_ref": None}
+
+        # Withhold the photo from the LLM; the resume references it again on save
+        personal_info = profile_dict.get("personal_info")
+        if personal_info:
+            personal_info.pop("photo", None)
+            personal_info.pop("photo_thumb_ref", None)
+            profile_meta["photo_ref"] = personal_info.pop("photo_ref", None)
+
+        return profile_dict, profile_meta
+
+    def _save_result(
+        self,
+        llm_result: dict,
+        breadcrumbs: dict,
+        profile_dict: dict,
+        profile_meta: dict,
+        job_description: str,
+        job_id: int | None,
+        language: str,
+    ) -> GeneratedResumeResponse:
         # Build title from LLM result
         job_title = llm_result.get("job_title", "Untitled")
         company_name = llm_result.get("company_name", "Unknown Company")
@@ -72,7 +171,13 @@ class ResumeGeneratorService:
                 resume_content.get("work_experiences", [])
             )
             if profile_dict.get("personal_info"):
-                resume_content["personal_info"] = profile_dict["personal_info"]
+                # Reference the photo withheld from the LLM; copy so a profile
+                # shared by several generations is left untouched. The image
+                # itself stays in the photo store.
+                personal_info = dict(profile_dict["personal_info"])
+                if profile_meta["photo_ref"]:
+                    personal_info["photo_ref"] = profile_meta["photo_ref"]
+                resume_content["personal_info"] = personal_info
 
             # Include languages from profile (all languages are included by default)
             if profile_dict.get("languages"):
@@ -90,8 +195,8 @@ class ResumeGeneratorService:
                 INSERT INTO generated_resumes
                 (job_id, job_title, company_name, match_score, resume_content, language, job_analysis,
                  prompt_path, prompt_hash, provider, model, profile_snapshot,
-                 raw_output, latency_ms, input_tokens, output_tokens)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                 raw_output, latency_ms, input_tokens, output_tokens, profile_version)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     saved_job_id,
@@ -110,6 +215,7 @@ class ResumeGeneratorService:
                     breadcrumbs["latency_ms"],
                     breadcrumbs["input_tokens"],
                     breadcrumbs["output_tokens"],
+                    profile_meta["version"],
                 ),
             )
             conn.commit()
@@ -134,36 +240,59 @@ class ResumeGeneratorService:
 
             return self._row_to_response(dict(row))
 
-    def get_history(self) -> list[dict]:
+    def get_history_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        title: str | None = None,
+        company: str | None = None,
+    ) -> tuple[list[dict], str | None]:
+        """One page of generated resumes, newest first, and the cursor of the next page."""
+        where, params = [], []
+        if title:
+            where.append("job_title LIKE ? ESCAPE '\\'")
+            params.append(like_pattern(title))
+        if company:
+            where.append("company_name LIKE ? ESCAPE '\\'")
+            params.append(like_pattern(company))
+        if cursor:
+            where.append("(created_at, id) < (?, ?)")
+            params.extend(decode_cursor(cursor, (str, int)))
+
         with get_db() as conn:
             cursor = conn.execute(
-                """
+                f"""
                 SELECT id, job_title, company_name, match_score, created_at
                 FROM generated_resumes
-                ORDER BY created_at DESC
-                """
+                {"WHERE " + " AND ".join(where) if where else ""}
+                ORDER BY created_at DESC, id DESC
+                LIMIT ?
+                """,
+                (*params, limit + 1),
             )
-            return [dict(row) for row in cursor.fetchall()]
+            rows = [dict(row) for row in cursor.fetchall()]
+
+        if len(rows) <= limit:
+            return rows, None
+        last = rows[limit - 1]
+        return rows[:limit], encode_cursor(last["created_at"], last["id"])
 
     def update_resume(
         self, resume_id: int, resume_content: ResumeContent
     ) -> GeneratedResumeResponse | None:
         with get_db() as conn:
             cursor = conn.execute(
-                "SELECT id FROM generated_resumes WHERE id = ?", (resume_id,)
-            )
-            if cursor.fetchone() is None:
-                return None
-
-            cursor = conn.execute(
-                "SELECT resume_content FROM generated_resumes WHERE id = ?", (resume_id,)
+                "SELECT json_extract(resume_content, '$.personal_info') AS personal_info "
+                "FROM generated_resumes WHERE id = ?",
+                (resume_id,),
             )
             existing = cursor.fetchone()
-            existing_content = json.loads(existing["resume_content"]) if existing else {}
+            if existing is None:
+                return None
 
             new_content = resume_content.model_dump()
-            if existing_content.get("personal_info"):
-                new_content["personal_info"] = existing_content["personal_info"]
+            if existing["personal_info"]:
+                new_content["personal_info"] = json.loads(existing["personal_info"])
 
             conn.execute(
                 """
@@ -174,6 +303,7 @@ class ResumeGeneratorService:
                 (json.dumps(new_content), resume_id),
             )
             conn.commit()
+            pdf_cache.invalidate(resume_id)
 
             return self.get_resume(resume_id)
 
@@ -186,19 +316,20 @@ class ResumeGeneratorService:
                 (resume_id,),
             )
             conn.commit()
+            pdf_cache.invalidate(resume_id)
             return cursor.rowcount > 0
 
     def _row_to_response(self, row: dict) -> GeneratedResumeResponse:
         resume_content = json.loads(row["resume_content"]) if row.get("resume_content") else {}
 
-        # Ensure photo from current profile is included (for European templates)
+        # Point clients at the photo (for European templates); resumes saved
+        # without one fall back to the current profile photo
         personal_info = resume_content.get("personal_info", {})
-        if personal_info and not personal_info.get("photo"):
-            # Fetch current photo from profile
-            profile = profile_service.get_complete()
-            if profile.personal_info and profile.personal_info.get("photo"):
-                personal_info["photo"] = profile.personal_info["photo"]
-                resume_content["personal_info"] = personal_info
+        if personal_info:
+            photo_ref = personal_info.get("photo_ref") or photo_store.get_user_photo_refs()[0]
+            if photo_ref:
+                personal_info["photo_ref"] = photo_ref
+                personal_info["photo"] = f"/api/photos/{photo_ref}"
 
         work_experiences = [
             ResumeWorkExperience(**we) for we in resume_content.get("work_experiences", [])
@@ -228,6 +359,7 @@ class ResumeGeneratorService:
             id=row["id"],
             job_title=row.get("job_title"),
             company_name=row.get("company_name"),
+            profile_version=row.get("profile_version"),
             match_score=row.get("match_score"),
             job_analysis=job_analysis_obj,
             resume=resume,
@@ -237,3 +369,5 @@ class ResumeGeneratorService:
 
 
 resume_generator_service = ResumeGeneratorService()
+# Awaitable reads and edits; generate is already a coroutine on the service itself
+async_resume_generator_service = AsyncService(resume_generator_service)
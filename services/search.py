@@ -0,0 +1,94 @@
+# Lean Code — BSD 3-Clause License — Vivian Voss, 2026
+# Scope: Full-text search over saved jobs, job versions and generated resumes, ranked by bm25.
+
+import re
+
+from database import get_db, AsyncService
+
+# Snippet highlight markers: control characters never found in stored text
+_OPEN, _CLOSE = "\x02", "\x03"
+_SNIPPET_TOKENS = 16
+
+# bm25 weights per column: title, company, body
+_SEARCH_SQL = f"""
+    SELECT 'job' AS kind, j.id, j.id AS job_id, j.title, j.company_name,
+           snippet(jobs_fts, -1, :open, :close, '…', {_SNIPPET_TOKENS}) AS snippet,
+           bm25(jobs_fts, 10.0, 5.0, 1.0) AS score
+    FROM jobs_fts JOIN jobs j ON j.id = jobs_fts.rowid
+    WHERE jobs_fts MATCH :query AND j.is_saved = 1
+    UNION ALL
+    SELECT 'job_version', v.id, v.job_id, j.title, j.company_name,
+           snippet(job_versions_fts, 0, :open, :close, '…', {_SNIPPET_TOKENS}),
+           bm25(job_versions_fts)
+    FROM job_versions_fts
+    JOIN job_versions v ON v.id = job_versions_fts.rowid
+    JOIN jobs j ON j.id = v.job_id
+    WHERE job_versions_fts MATCH :query AND j.is_saved = 1
+    UNION ALL
+    SELECT 'resume', r.id, r.job_id, r.job_title, r.company_name,
+           snippet(generated_resumes_fts, -1, :open, :close, '…', {_SNIPPET_TOKENS}),
+           bm25(generated_resumes_fts, 10.0, 5.0, 1.0)
+    FROM generated_resumes_fts JOIN generated_resumes r ON r.id = generated_resumes_fts.rowid
+    WHERE generated_resumes_fts MATCH :query
+    ORDER BY score
+    LIMIT :limit
+"""
+
+
+def fts_query(text: str) -> str | None:
+    """Turn free text into an FTS5 query: every word must match, the last as a prefix.
+
+    Words are quoted, so operators and punctuation in user input are never
+    parsed as FTS5 syntax. Returns None when the text has no words.
+    """
+    words = re.findall(r"\w+", text)
+    if not words:
+        return None
+    return " ".join(f'"{word}"' for word in words) + "*"
+
+
+def split_highlights(snippet: str) -> tuple[str, list[tuple[int, int]]]:
+    """Strip the highlight markers and return (text, [(start, end), ...]) in characters."""
+    text, highlights, start = [], [], None
+    length = 0
+    for part in re.split(f"([{_OPEN}{_CLOSE}])", snippet):
+        if part == _OPEN:
+            start = length
+        elif part == _CLOSE:
+            if start is not None:
+                highlights.append((start, length))
+            start = None
+        else:
+            text.append(part)
+            length += len(part)
+    return "".join(text), highlights
+
+
+class SearchService:
+    """Ranked search over the FTS5 indexes that triggers keep in sync.
+
+    Jobs, their earlier versions and generated resumes are searched in one
+    statement; bm25 weighs title and company matches above body text.
+    Snippets come back as plain text with highlight offsets, so clients
+    render them without trusting markup.
+    """
+
+    def search(self, text: str, limit: int = 20) -> list[dict]:
+        query = fts_query(text)
+        if query is None:
+            return []
+        with get_db() as conn:
+            rows = conn.execute(
+                _SEARCH_SQL,
+                {"query": query, "open": _OPEN, "close": _CLOSE, "limit": limit},
+            ).fetchall()
+
+        results = []
+        for row in rows:
+            snippet, highlights = split_highlights(row["snippet"] or "")
+            results.append({**dict(row), "snippet": snippet, "highlights": highlights})
+        return results
+
+
+search_service = SearchService()
+async_search_service = AsyncService(search_service)
@@ -1,6 +1,10 @@
 import json
 import logging
+from collections.abc import Iterable, Mapping
 from pathlib import Path
+from types import MappingProxyType
+
+import settings
 
 logger = logging.getLogger(__name__)
 
@@ -23,18 +27,49 @@ MONTHS = {
     }
 }
 
+# Month names by the "MM" part of a YYYY-MM date, so formatting is one lookup
+MONTH_TABLES = {
+    language: {f"{number:02d}": name for number, name in months.items()}
+    for language, months in MONTHS.items()
+}
+
+# language -> (file mtime when read, read-only translations)
+_cache: dict[str, tuple[float | None, Mapping[str, str]]] = {}
+
 
-def load_translations(language: str = "en") -> dict:
+def load_translations(language: str = "en") -> Mapping[str, str]:
     """Load translations for the given language.
 
-    Falls back to English if language not found.
+    Falls back to English if language not found. Each bundle is read once
+    and shared read-only; with TRANSLATIONS_RELOAD set, a changed file is
+    read again on the next call.
     """
     if language not in SUPPORTED_LANGUAGES:
         logger.warning(f"Unsupported language '{language}', falling back to English")
         language = "en"
 
+    cached = _cache.get(language)
+    if cached is not None and not settings.TRANSLATIONS_RELOAD:
+        return cached[1]
+
     translation_file = TRANSLATIONS_DIR / f"{language}.json"
+    mtime = _mtime(translation_file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    translations = MappingProxyType(_read_translations(translation_file))
+    _cache[language] = (mtime, translations)
+    return translations
 
+
+def _mtime(path: Path) -> float | None:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
+
+def _read_translations(translation_file: Path) -> dict:
     if not translation_file.exists():
         logger.warning(f"Translation file not found: {translation_file}, falling back to English")
         translation_file = TRANSLATIONS_DIR / "en.json"
@@ -68,15 +103,29 @@ def format_date(date_str: str | None, language: str = "en") -> str:
 
     Returns the localized "Present" label if date_str is None.
     """
-    if date_str is None:
-        translations = load_translations(language)
-        return translations.get("present", "Present")
+    return format_dates([date_str], language)[0]
+
+
+def format_dates(dates: Iterable[str | None], language: str = "en") -> list[str]:
+    """Format many YYYY-MM dates at once, e.g. every start and end date of a resume.
+
+    The "Present" label and month table are resolved once for the batch.
+    """
+    present = load_translations(language).get("present", "Present")
+    months = MONTH_TABLES.get(language, MONTH_TABLES["en"])
+    return [present if date_str is None else _format_one(date_str, months) for date_str in dates]
+
 
+def _format_one(date_str: str, months: Mapping[str, str]) -> str:
     try:
         year, month = date_str.split("-")
-        month_num = int(month)
-        month_names = MONTHS.get(language, MONTHS["en"])
-        month_name = month_names.get(month_num, month)
-        return f"{month_name} {year}"
     except (ValueError, AttributeError):
         return date_str
+    month_name = months.get(month)
+    if month_name is None:
+        # Unpadded months ("2024-1") still name the month
+        try:
+            month_name = months.get(f"{int(month):02d}", month)
+        except ValueError:
+            return date_str
+    return f"{month_name} {year}"
@@ -14,3 +14,36 @@ CLAUDE_MODEL = os.environ.get("CLAUDE_MODEL", "claude-sonnet-4-20250514")
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
 GEMINI_MODEL = os.environ.get("GEMINI_MODEL", "gemini-2.5-flash")
 DATABASE = os.environ.get("DATABASE", "app.db")
+SQLITE_POOL_SIZE = int(os.environ.get("SQLITE_POOL_SIZE", "8"))
+SQLITE_JOURNAL_MODE = os.environ.get("SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = os.environ.get("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_MMAP_SIZE = int(os.environ.get("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_CACHE_SIZE = int(os.environ.get("SQLITE_CACHE_SIZE", "-16000"))
+SQLITE_TEMP_STORE = os.environ.get("SQLITE_TEMP_STORE", "MEMORY")
+DB_EXECUTOR_WORKERS = int(os.environ.get("DB_EXECUTOR_WORKERS", "4"))
+LLM_CACHE_TTL_SECONDS = int(os.environ.get("LLM_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+LLM_CACHE_MAX_ENTRIES = int(os.environ.get("LLM_CACHE_MAX_ENTRIES", "500"))
+GENERATION_WORKERS = int(os.environ.get("GENERATION_WORKERS", "2"))
+BULK_GENERATION_CONCURRENCY = int(os.environ.get("BULK_GENERATION_CONCURRENCY", "3"))
+LLM_RATE_LIMIT_PER_MINUTE = int(os.environ.get("LLM_RATE_LIMIT_PER_MINUTE", "50"))
+PDF_BROWSER_POOL_SIZE = int(os.environ.get("PDF_BROWSER_POOL_SIZE", "2"))
+PDF_BROWSER_MAX_RENDERS = int(os.environ.get("PDF_BROWSER_MAX_RENDERS", "200"))
+PDF_RENDER_QUEUE_SIZE = int(os.environ.get("PDF_RENDER_QUEUE_SIZE", "8"))
+PDF_CACHE_DIR = os.environ.get("PDF_CACHE_DIR", "pdf_cache")
+PDF_CACHE_MAX_BYTES = int(os.environ.get("PDF_CACHE_MAX_BYTES", str(200 * 1024 * 1024)))
+PDF_TEMPLATE_RELOAD = os.environ.get("PDF_TEMPLATE_RELOAD", "").lower() in ("1", "true", "yes")
+TRANSLATIONS_RELOAD = os.environ.get("TRANSLATIONS_RELOAD", "").lower() in ("1", "true", "yes")
+PHOTO_PRINT_SIZE = int(os.environ.get("PHOTO_PRINT_SIZE", "320"))
+PHOTO_THUMB_SIZE = int(os.environ.get("PHOTO_THUMB_SIZE", "160"))
+PHOTO_FORMAT = os.environ.get("PHOTO_FORMAT", "JPEG").upper()
+PHOTO_QUALITY = int(os.environ.get("PHOTO_QUALITY", "85"))
+COMPRESSION_MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_ENCODINGS = tuple(
+    encoding.strip().lower()
+    for encoding in os.environ.get("COMPRESSION_ENCODINGS", "br,gzip").split(",")
+    if encoding.strip()
+)
+COMPRESSION_GZIP_LEVEL = int(os.environ.get("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.environ.get("COMPRESSION_BROTLI_QUALITY", "4"))
+PAGE_SIZE_DEFAULT = int(os.environ.get("PAGE_SIZE_DEFAULT", "50"))
+PAGE_SIZE_MAX = int(os.environ.get("PAGE_SIZE_MAX", "200"))
@@ -1,14 +1,25 @@
 const API_BASE = '/api';
 
+// GET responses by URL with their ETag, revalidated with If-None-Match
+const responseCache = new Map();
+
+// With { page: true } a list request resolves to { items, nextCursor }
 async function request(url, options = {}) {
+  const cached = options.method ? null : responseCache.get(url);
   const response = await fetch(`${API_BASE}${url}`, {
     headers: {
       'Content-Type': 'application/json',
+      ...(cached && { 'If-None-Match': cached.etag }),
       ...options.headers
     },
     ...options
   });
 
+  if (response.status === 304 && cached) {
+    const data = structuredClone(cached.data);
+    return options.page ? { items: data, nextCursor: cached.nextCursor } : data;
+  }
+
   if (!response.ok) {
     const error = await response.json().catch(() => ({ detail: 'Request failed' }));
     throw new Error(error.detail || 'Request failed');
@@ -18,7 +29,13 @@ async function request(url, options = {}) {
     return null;
   }
 
-  return response.json();
+  const data = await response.json();
+  const etag = response.headers.get('ETag');
+  const nextCursor = response.headers.get('X-Next-Cursor');
+  if (!options.method && etag) {
+    responseCache.set(url, { etag, nextCursor, data: structuredClone(data) });
+  }
+  return options.page ? { items: data, nextCursor } : data;
 }
 
 // Users
@@ -58,6 +75,14 @@ export async function deleteWorkExperience(id) {
   });
 }
 
+// Applies { create, update, delete } in one transaction, resolves to the new list
+export async function batchWorkExperiences(operations) {
+  return request('/work-experiences/batch', {
+    method: 'PATCH',
+    body: JSON.stringify(operations)
+  });
+}
+
 // Education
 export async function getEducation() {
   return request('/education');
@@ -83,6 +108,13 @@ export async function deleteEducation(id) {
   });
 }
 
+export async function batchEducation(operations) {
+  return request('/education/batch', {
+    method: 'PATCH',
+    body: JSON.stringify(operations)
+  });
+}
+
 // Skills
 export async function getSkills() {
   return request('/skills');
@@ -126,6 +158,13 @@ export async function deleteProject(id) {
   });
 }
 
+export async function batchProjects(operations) {
+  return request('/projects/batch', {
+    method: 'PATCH',
+    body: JSON.stringify(operations)
+  });
+}
+
 // Languages
 export async function getLanguages() {
   return request('/languages');
@@ -158,6 +197,14 @@ export async function reorderLanguages(items) {
   });
 }
 
+// Also accepts { reorder: [{ id, display_order }] }
+export async function batchLanguages(operations) {
+  return request('/languages/batch', {
+    method: 'PATCH',
+    body: JSON.stringify(operations)
+  });
+}
+
 // Month input feature detection
 export function supportsMonthInput() {
   const input = document.createElement('input');
@@ -177,8 +224,99 @@ export async function generateResume(jobDescription, jobId = null, language = 'e
   });
 }
 
-export async function getResumes() {
-  return request('/resumes');
+export async function generateResumeStream(jobDescription, jobId = null, language = 'en', onEvent = () => {}, signal = undefined) {
+  const body = { job_description: jobDescription, language };
+  if (jobId) {
+    body.job_id = jobId;
+  }
+  const response = await fetch(`${API_BASE}/resumes/generate/stream`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(body),
+    signal
+  });
+
+  if (!response.ok) {
+    const error = await response.json().catch(() => ({ detail: 'Request failed' }));
+    throw new Error(error.detail || 'Request failed');
+  }
+
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = '';
+  let resume = null;
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += value;
+
+    let boundary;
+    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+      const message = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+
+      let event = 'message';
+      let data = '';
+      for (const line of message.split('\n')) {
+        if (line.startsWith('event: ')) event = line.slice(7);
+        else if (line.startsWith('data: ')) data += line.slice(6);
+      }
+      const payload = data ? JSON.parse(data) : null;
+
+      if (event === 'error') {
+        throw new Error(payload?.detail || 'Could not generate resume');
+      }
+      if (event === 'resume') {
+        resume = payload;
+      }
+      onEvent(event, payload);
+    }
+  }
+
+  if (!resume) {
+    throw new Error('Resume generation ended unexpectedly');
+  }
+  return resume;
+}
+
+export async function generateResumeInBackground(jobDescription, jobId = null, language = 'en') {
+  const body = { job_description: jobDescription, language };
+  if (jobId) {
+    body.job_id = jobId;
+  }
+  return request('/resumes/generate?async=true', {
+    method: 'POST',
+    body: JSON.stringify(body)
+  });
+}
+
+export async function generateResumesBulk(jobIds, language = 'en') {
+  return request('/resumes/generate/bulk', {
+    method: 'POST',
+    body: JSON.stringify({ job_ids: jobIds, language })
+  });
+}
+
+export async function getBulkGeneration(id) {
+  return request(`/resumes/generate/bulk/${id}`);
+}
+
+export async function getTask(id) {
+  return request(`/tasks/${id}`);
+}
+
+function pageQuery({ cursor, limit, title, company } = {}) {
+  const params = new URLSearchParams();
+  if (cursor) params.set('cursor', cursor);
+  if (limit) params.set('limit', limit);
+  if (title) params.set('title', title);
+  if (company) params.set('company', company);
+  const query = params.toString();
+  return query ? `?${query}` : '';
+}
+
+export async function getResumes(options = {}) {
+  return request(`/resumes${pageQuery(options)}`, { page: true });
 }
 
 export async function getResume(id) {
@@ -223,9 +361,39 @@ export async function downloadPdf(id, template = 'classic', language = 'en') {
   URL.revokeObjectURL(url);
 }
 
+export async function downloadPdfBatch(id, variants) {
+  const response = await fetch(`${API_BASE}/resumes/${id}/pdf/batch`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ variants })
+  });
+
+  if (!response.ok) {
+    const error = await response.json().catch(() => ({ detail: 'PDF generation failed' }));
+    throw new Error(error.detail || 'PDF generation failed');
+  }
+
+  const blob = await response.blob();
+  const url = URL.createObjectURL(blob);
+  const a = document.createElement('a');
+  a.href = url;
+
+  const disposition = response.headers.get('Content-Disposition');
+  const match = disposition?.match(/filename="(.+)"/);
+  a.download = match?.[1] || 'resumes.zip';
+
+  a.click();
+  URL.revokeObjectURL(url);
+}
+
+// Search
+export async function search(q, limit = 20) {
+  return request(`/search?${new URLSearchParams({ q, limit })}`);
+}
+
 // Jobs
-export async function getJobs() {
-  return request('/jobs');
+export async function getJobs(options = {}) {
+  return request(`/jobs${pageQuery(options)}`, { page: true });
 }
 
 export async function createJob(originalText) {
@@ -285,8 +453,9 @@ export async function deletePhoto() {
 }
 
 // Profile Import
-export async function importProfile(data) {
-  return request('/profile/import', {
+// Merge keeps the ids of entries that survive the import; replace re-creates every row
+export async function importProfile(data, mode = 'merge') {
+  return request(`/profile/import?mode=${mode}`, {
     method: 'PUT',
     body: JSON.stringify(data)
   });
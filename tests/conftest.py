@@ -21,10 +21,17 @@ def setup_test_db():
     settings.DATABASE = path
     database.init_db()
     yield
+    database.close_pool()
     settings.DATABASE = original_db
     os.unlink(path)
 
 
+@pytest.fixture(autouse=True)
+def isolate_pdf_cache(tmp_path, monkeypatch):
+    """Keep rendered-PDF cache entries out of the working tree."""
+    monkeypatch.setattr(settings, "PDF_CACHE_DIR", str(tmp_path / "pdf_cache"))
+
+
 @pytest.fixture
 def client():
     """Create a test client."""
@@ -0,0 +1,51 @@
+# Lean Code — BSD 3-Clause License — Vivian Voss, 2026
+# Scope: Tests for database.py — DB executor offloading and AsyncService wrappers.
+
+import threading
+
+from database import run_in_db, AsyncService
+from services.jobs import async_job_service
+
+
+async def test_run_in_db_runs_off_the_loop_thread():
+    loop_thread = threading.get_ident()
+
+    worker_thread = await run_in_db(threading.get_ident)
+
+    assert worker_thread != loop_thread
+
+
+async def test_run_in_db_passes_arguments_and_raises():
+    def divide(a, b=1):
+        return a / b
+
+    assert await run_in_db(divide, 6, b=3) == 2
+    try:
+        await run_in_db(divide, 1, b=0)
+    except ZeroDivisionError:
+        pass
+    else:
+        raise AssertionError("expected ZeroDivisionError")
+
+
+async def test_async_service_wraps_methods():
+    class Counter:
+        limit = 3
+
+        def increment(self, value):
+            return value + 1
+
+    counter = AsyncService(Counter())
+
+    assert await counter.increment(1) == 2
+    assert counter.limit == 3
+
+
+async def test_async_job_service_round_trip():
+    job = await async_job_service.create("Backend engineer at Acme")
+
+    fetched = await async_job_service.get(job["id"])
+
+    assert fetched["id"] == job["id"]
+    jobs, _ = await async_job_service.list_page(10)
+    assert [j["id"] for j in jobs] == [job["id"]]
@@ -0,0 +1,146 @@
+# Lean Code — BSD 3-Clause License — Vivian Voss, 2026
+# Scope: Tests for services/browser_pool.py — slot reuse, health-check recycling, max-render recycling, shutdown.
+
+import pytest
+
+from services.browser_pool import BrowserPool, _PooledPage
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.closed = False
+
+    def is_connected(self):
+        return self.connected
+
+    async def close(self):
+        self.closed = True
+        self.connected = False
+
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = BrowserPool(size=2, max_renders=3)
+    launched = []
+
+    async def fake_launch():
+        slot = _PooledPage(FakeBrowser(), object(), FakePage())
+        launched.append(slot)
+        return slot
+
+    monkeypatch.setattr(pool, "_launch", fake_launch)
+    pool.launched = launched
+    yield pool
+    pool.close()
+
+
+async def _use_page(pool):
+    async with pool.page() as page:
+        return page
+
+
+def test_page_is_reused_between_renders(pool):
+    first = pool.run(_use_page(pool))
+    second = pool.run(_use_page(pool))
+
+    assert first is second
+    assert len(pool.launched) == 1
+
+
+def test_disconnected_browser_is_recycled(pool):
+    pool.run(_use_page(pool))
+    pool.launched[0].browser.connected = False
+
+    page = pool.run(_use_page(pool))
+
+    assert len(pool.launched) == 2
+    assert page is pool.launched[1].page
+    assert pool.launched[0].browser.closed
+
+
+def test_closed_page_is_recycled(pool):
+    pool.run(_use_page(pool))
+    pool.launched[0].page.closed = True
+
+    pool.run(_use_page(pool))
+
+    assert len(pool.launched) == 2
+
+
+def test_browser_recycled_after_max_renders(pool):
+    for _ in range(3):
+        pool.run(_use_page(pool))
+
+    assert pool.launched[0].browser.closed
+
+    pool.run(_use_page(pool))
+    assert len(pool.launched) == 2
+
+
+def test_failed_render_discards_slot(pool):
+    async def failing_render():
+        async with pool.page():
+            raise RuntimeError("page crashed")
+
+    with pytest.raises(RuntimeError):
+        pool.run(failing_render())
+
+    assert pool.launched[0].browser.closed
+    pool.run(_use_page(pool))
+    assert len(pool.launched) == 2
+
+
+def test_warm_up_launches_full_pool(pool):
+    pool.start().result(timeout=5)
+
+    assert len(pool.launched) == 2
+
+
+def test_close_shuts_down_idle_browsers(pool):
+    pool.start().result(timeout=5)
+
+    pool.close()
+
+    assert all(slot.browser.closed for slot in pool.launched)
+
+
+def test_pages_opens_extra_pages_in_one_browser(pool, monkeypatch):
+    opened = []
+
+    class FakeContext:
+        async def new_page(self):
+            page = FakePage()
+
+            async def close():
+                page.closed = True
+
+            page.close = close
+            opened.append(page)
+            return page
+
+    async def fake_launch():
+        slot = _PooledPage(FakeBrowser(), FakeContext(), FakePage())
+        pool.launched.append(slot)
+        return slot
+
+    monkeypatch.setattr(pool, "_launch", fake_launch)
+
+    async def use_pages():
+        async with pool.pages(3) as pages:
+            return pages
+
+    pages = pool.run(use_pages())
+
+    assert len(pages) == 3
+    assert pages[0] is pool.launched[0].page
+    assert all(page.closed for page in opened)
+    assert pool.launched[0].renders == 3
@@ -8,7 +8,7 @@ import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 import anthropic
 
-from services.llm.base import SYSTEM_PROMPT
+from services.llm.base import SYSTEM_PROMPT, ProviderBusyError
 from services.llm.claude import ClaudeProvider
 
 
@@ -160,6 +160,70 @@ class TestClaudeProviderSuccess:
         assert breadcrumbs["prompt_hash"] == expected_hash
 
 
+class _FakeMessageStream:
+    """Stand-in for the async context manager returned by messages.stream()."""
+
+    def __init__(self, chunks, usage):
+        self.chunks = chunks
+        self.usage = usage
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @property
+    async def text_stream(self):
+        for chunk in self.chunks:
+            yield chunk
+
+    async def get_final_message(self):
+        return MagicMock(usage=self.usage)
+
+
+class TestClaudeProviderStreaming:
+    """Tests for streamed Claude generation."""
+
+    @pytest.mark.asyncio
+    @patch("services.llm.claude._get_client")
+    async def test_stream_yields_deltas_then_result(self, mock_get_client, claude_provider, sample_profile):
+        raw_text = '{"job_title": "Engineer", "match_score": 70, "resume": {}}'
+        chunks = [raw_text[i:i + 9] for i in range(0, len(raw_text), 9)]
+        mock_client = MagicMock()
+        mock_client.messages.stream = MagicMock(
+            return_value=_FakeMessageStream(chunks, MagicMock(input_tokens=10, output_tokens=20))
+        )
+        mock_get_client.return_value = mock_client
+
+        events = [
+            event async for event in claude_provider.stream_analyze_and_generate("JD...", sample_profile)
+        ]
+
+        assert [payload for kind, payload in events[:-1]] == chunks
+        kind, (result, breadcrumbs) = events[-1]
+        assert kind == "done"
+        assert result["job_title"] == "Engineer"
+        assert breadcrumbs["raw_output"] == raw_text
+        assert breadcrumbs["input_tokens"] == 10
+        assert breadcrumbs["output_tokens"] == 20
+
+    @pytest.mark.asyncio
+    @patch("services.llm.claude._get_client")
+    async def test_stream_detects_truncation(self, mock_get_client, claude_provider, sample_profile):
+        mock_client = MagicMock()
+        mock_client.messages.stream = MagicMock(
+            return_value=_FakeMessageStream(['{"job_title": "Engineer"'], MagicMock())
+        )
+        mock_get_client.return_value = mock_client
+
+        with pytest.raises(ValueError) as exc_info:
+            async for _ in claude_provider.stream_analyze_and_generate("JD...", sample_profile):
+                pass
+
+        assert "truncated" in str(exc_info.value).lower()
+
+
 class TestClaudeProviderErrors:
     """Tests for Claude provider error handling."""
 
@@ -200,6 +264,7 @@ class TestClaudeProviderErrors:
             await claude_provider.analyze_and_generate("JD...", sample_profile)
 
         assert "busy" in str(exc_info.value).lower()
+        assert isinstance(exc_info.value, ProviderBusyError)
 
     @pytest.mark.asyncio
     @patch("services.llm.claude._get_client")
@@ -0,0 +1,96 @@
+# Lean Code — BSD 3-Clause License — Vivian Voss, 2026
+# Scope: Tests for routes/conditional.py — ETags from change versions and 304 revalidation.
+
+from unittest.mock import patch
+
+from routes.conditional import etag_matches
+from tests.test_photos import VALID_JPEG_DATA
+
+
+def _create_job(client):
+    return client.post("/api/jobs", json={"original_text": "A" * 150}).json()
+
+
+def test_etag_matches_weak_comparison():
+    assert etag_matches('W/"abc"', '"abc"')
+    assert etag_matches('"x", W/"abc"', 'W/"abc"')
+    assert etag_matches("*", 'W/"abc"')
+    assert not etag_matches('"abd"', 'W/"abc"')
+    assert not etag_matches(None, 'W/"abc"')
+
+
+def test_list_sends_validators(client):
+    client.post("/api/skills", json={"names": "Python"})
+    response = client.get("/api/skills")
+
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('W/"')
+    assert response.headers["cache-control"] == "private, no-cache"
+    assert "GMT" in response.headers["last-modified"]
+
+
+def test_matching_etag_answers_304_without_running_handler(client):
+    client.put("/api/users", json={"full_name": "Jane Doe", "email": "jane@example.com"})
+    etag = client.get("/api/profile/complete").headers["etag"]
+
+    with patch("services.profile.profile_service.get_complete") as get_complete:
+        response = client.get("/api/profile/complete", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    get_complete.assert_not_called()
+
+
+def test_profile_write_changes_etag(client):
+    client.post("/api/skills", json={"names": "Python"})
+    etag = client.get("/api/skills").headers["etag"]
+
+    client.post("/api/skills", json={"names": "Go"})
+    response = client.get("/api/skills", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert [s["name"] for s in response.json()] == ["Go", "Python"]
+
+
+def test_write_to_other_section_keeps_etag(client):
+    client.post("/api/skills", json={"names": "Python"})
+    etag = client.get("/api/skills").headers["etag"]
+
+    client.post("/api/languages", json={"name": "Dutch", "level": "C1"})
+
+    assert client.get("/api/skills", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_etag_differs_per_path(client):
+    first = _create_job(client)
+    second = _create_job(client)
+
+    assert (
+        client.get(f"/api/jobs/{first['id']}").headers["etag"]
+        != client.get(f"/api/jobs/{second['id']}").headers["etag"]
+    )
+
+
+def test_job_update_changes_etag(client):
+    job = _create_job(client)
+    etag = client.get("/api/jobs").headers["etag"]
+    assert client.get("/api/jobs", headers={"If-None-Match": etag}).status_code == 304
+
+    client.put(f"/api/jobs/{job['id']}", json={"title": "Senior Dev"})
+    response = client.get("/api/jobs", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json()[0]["title"] == "Senior Dev"
+
+
+def test_photo_blob_revalidates(client):
+    client.put("/api/users", json={"full_name": "Jane Doe", "email": "jane@example.com"})
+    url = client.put("/api/photos", json={"image_data": VALID_JPEG_DATA}).json()["thumbnail_url"]
+    etag = client.get(url).headers["etag"]
+
+    response = client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
@@ -1,6 +1,8 @@
 # Lean Code — BSD 3-Clause License — Vivian Voss, 2026
 # Scope: Tests for database.py — recreate helpers, MIGRATIONS runner, schema_versions, dead-table absence, source-tolerance.
 
+import hashlib
+import json
 import shutil
 import sqlite3
 import traceback
@@ -575,6 +577,63 @@ def test_personal_info_data_migrates_to_users(tmp_path, monkeypatch):
         conn.close()
 
 
+def test_legacy_photo_moves_to_blob_store(tmp_path, monkeypatch):
+    db_path = tmp_path / "photo.db"
+    monkeypatch.setattr(settings, "DATABASE", str(db_path))
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email TEXT NOT NULL, full_name TEXT NOT NULL,
+            phone TEXT, location TEXT, linkedin_url TEXT, summary TEXT, photo TEXT,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+        );
+        INSERT INTO users (id, full_name, email, photo)
+            VALUES (1, 'Photo User', 'photo@example.com', 'data:image/png;base64,aGVsbG8=');
+    """)
+    conn.commit()
+    conn.close()
+
+    database.init_db()
+
+    conn = sqlite3.connect(db_path)
+    try:
+        photo, photo_ref = conn.execute("SELECT photo, photo_ref FROM users WHERE id = 1").fetchone()
+        assert photo is None
+        assert photo_ref == hashlib.sha256(b"hello").hexdigest()
+        assert conn.execute(
+            "SELECT mime_type, data FROM photo_blobs WHERE hash = ?", (photo_ref,)
+        ).fetchone() == ("image/png", b"hello")
+    finally:
+        conn.close()
+
+
+def test_embedded_resume_photos_stripped(tmp_path, monkeypatch):
+    db_path = tmp_path / "resume_photo.db"
+    monkeypatch.setattr(settings, "DATABASE", str(db_path))
+    database.init_db()
+    content = {"personal_info": {"full_name": "A", "photo": "data:image/png;base64,aGVsbG8="}, "skills": []}
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO jobs (id, original_text) VALUES (1, 'JD')")
+    conn.execute(
+        "INSERT INTO generated_resumes (job_id, resume_content) VALUES (1, ?)", (json.dumps(content),)
+    )
+    conn.execute("DELETE FROM schema_versions WHERE version = '20261018_resumes_strip_photos'")
+    conn.commit()
+    conn.close()
+
+    database.init_db()
+
+    conn = sqlite3.connect(db_path)
+    try:
+        stored = json.loads(conn.execute("SELECT resume_content FROM generated_resumes").fetchone()[0])
+        assert stored["personal_info"] == {"full_name": "A", "photo_ref": hashlib.sha256(b"hello").hexdigest()}
+        assert conn.execute("SELECT COUNT(*) FROM photo_blobs").fetchone()[0] == 1
+    finally:
+        conn.close()
+
+
 def test_legacy_job_description_versions_data_preserved(tmp_path, monkeypatch):
     db_path = tmp_path / "legacy_jdv.db"
     monkeypatch.setattr(settings, "DATABASE", str(db_path))
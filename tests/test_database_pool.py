@@ -0,0 +1,68 @@
+# Lean Code — BSD 3-Clause License — Vivian Voss, 2026
+# Scope: Tests for database.py — pooled connections, per-connection PRAGMAs, rollback on return, path switching.
+
+import database
+import settings
+from database import get_db
+
+
+def test_connection_is_reused():
+    with get_db() as first:
+        pass
+    with get_db() as second:
+        pass
+
+    assert first is second
+
+
+def test_nested_checkouts_get_separate_connections():
+    with get_db() as outer:
+        with get_db() as inner:
+            assert inner is not outer
+
+
+def test_pragmas_applied_to_new_connections():
+    with get_db() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == settings.SQLITE_CACHE_SIZE
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+
+def test_uncommitted_work_is_rolled_back_on_return():
+    with get_db() as conn:
+        conn.execute("INSERT INTO skills (name) VALUES ('Uncommitted')")
+
+    with get_db() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM skills").fetchone()[0] == 0
+
+
+def test_idle_connections_capped_at_pool_size(monkeypatch):
+    monkeypatch.setattr(settings, "SQLITE_POOL_SIZE", 1)
+    database.close_pool()
+
+    with get_db():
+        with get_db():
+            pass
+
+    assert len(database._current_pool()._idle) == 1
+
+
+def test_writer_does_not_block_readers():
+    with get_db() as writer:
+        writer.execute("INSERT INTO skills (name) VALUES ('Pending')")
+        with get_db() as reader:
+            assert reader.execute("SELECT COUNT(*) FROM skills").fetchone()[0] == 0
+        writer.commit()
+
+
+def test_pool_follows_database_setting(tmp_path, monkeypatch):
+    with get_db() as original:
+        pass
+
+    monkeypatch.setattr(settings, "DATABASE", str(tmp_path / "other.db"))
+    with get_db() as conn:
+        assert conn is not original
+        assert conn.execute("PRAGMA database_list").fetchone()["file"] == str(tmp_path / "other.db")
+    database.close_pool()
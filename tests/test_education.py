@@ -68,3 +68,22 @@ def test_get_nonexistent_education(client):
     """Test getting education that doesn't exist."""
     response = client.get("/api/education/9999")
     assert response.status_code == 404
+
+
+def test_batch_education(client):
+    """Test one batch creates, updates and deletes education entries."""
+    bachelor = client.post(
+        "/api/education", json={"institution": "State University", "degree": "BS", "graduation_year": 2017}
+    ).json()
+    course = client.post("/api/education", json={"institution": "Bootcamp", "degree": "Certificate"}).json()
+
+    response = client.patch(
+        "/api/education/batch",
+        json={
+            "create": [{"institution": "Tech Institute", "degree": "MS", "graduation_year": 2019}],
+            "update": [{**bachelor, "gpa": 3.8}],
+            "delete": [course["id"]],
+        },
+    )
+    assert response.status_code == 200
+    assert [(edu["degree"], edu["gpa"]) for edu in response.json()] == [("MS", None), ("BS", 3.8)]
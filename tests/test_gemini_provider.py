@@ -6,6 +6,7 @@ import re
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 
+from services.llm.base import ProviderBusyError
 from services.llm.gemini import GeminiProvider
 
 
@@ -266,6 +267,7 @@ class TestGeminiProviderErrors:
             await gemini_provider.analyze_and_generate("JD...", sample_profile)
 
         assert "busy" in str(exc_info.value).lower()
+        assert isinstance(exc_info.value, ProviderBusyError)
 
     @pytest.mark.asyncio
     @patch("services.llm.gemini._get_client")
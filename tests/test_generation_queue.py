@@ -0,0 +1,269 @@
+"""Tests for background resume generation and task polling."""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from database import get_db
+from main import app
+from services.generation_queue import GenerationQueue
+from services.llm import ProviderBusyError
+from services.profile import profile_service
+from tests.conftest import create_llm_result
+
+
+LLM_RESULT = {
+    "job_title": "Software Engineer",
+    "company_name": "TechCorp",
+    "match_score": 85.5,
+    "job_analysis": {"required_skills": [], "preferred_skills": []},
+    "resume": {
+        "summary": "Experienced developer",
+        "work_experiences": [],
+        "skills": [],
+        "education": [],
+        "projects": [],
+    },
+}
+
+
+@pytest.fixture
+def app_client():
+    """Client with the lifespan running, so the queue workers live between requests."""
+    with patch("main.browser_pool"):
+        with TestClient(app) as client:
+            yield client
+
+
+def _create_work_experience(client):
+    client.post(
+        "/api/work-experiences",
+        json={
+            "company": "Acme Corp",
+            "title": "Senior Developer",
+            "start_date": "2020-01",
+            "description": "Led development team",
+        },
+    )
+
+
+def _wait_for(client, task_id, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        task = client.get(f"/api/tasks/{task_id}").json()
+        if task["status"] in ("succeeded", "failed"):
+            return task
+        time.sleep(0.02)
+    raise AssertionError(f"Task {task_id} did not finish: {task}")
+
+
+@patch("services.resume_generator.llm_service.analyze_and_generate")
+def test_async_generate_returns_task_and_saves_resume(mock_llm, app_client):
+    _create_work_experience(app_client)
+    mock_llm.return_value = create_llm_result(LLM_RESULT)
+
+    response = app_client.post(
+        "/api/resumes/generate?async=true",
+        json={"job_description": "A" * 150, "language": "fr"},
+    )
+
+    assert response.status_code == 202
+    task = response.json()
+    assert task["status"] == "queued"
+    assert response.headers["location"] == f"/api/tasks/{task['id']}"
+
+    task = _wait_for(app_client, task["id"])
+    assert task["status"] == "succeeded"
+    assert task["resume"]["job_title"] == "Software Engineer"
+    assert task["resume"]["language"] == "fr"
+    assert app_client.get(f"/api/resumes/{task['resume_id']}").json() == task["resume"]
+
+    with get_db() as conn:
+        row = conn.execute(
+            "SELECT * FROM generated_resumes WHERE id = ?", (task["resume_id"],)
+        ).fetchone()
+    assert row["prompt_hash"] == "a" * 40
+    assert row["input_tokens"] == 1000
+
+
+def test_async_generate_records_failure(app_client):
+    response = app_client.post(
+        "/api/resumes/generate?async=true",
+        json={"job_description": "A" * 150},
+    )
+
+    task = _wait_for(app_client, response.json()["id"])
+    assert task["status"] == "failed"
+    assert "work experience" in task["error"]
+    assert task["resume"] is None
+
+
+@patch("services.resume_generator.llm_service.analyze_and_generate")
+def test_task_events_stream_until_finished(mock_llm, app_client):
+    _create_work_experience(app_client)
+    mock_llm.return_value = create_llm_result(LLM_RESULT)
+
+    task_id = app_client.post(
+        "/api/resumes/generate?async=true",
+        json={"job_description": "A" * 150},
+    ).json()["id"]
+
+    response = app_client.get(f"/api/tasks/{task_id}/events")
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert '"status":"succeeded"' in response.text.split("\n\n")[-2]
+
+
+def test_get_task_not_found(client):
+    assert client.get("/api/tasks/999").status_code == 404
+    assert client.get("/api/tasks/999/events").status_code == 404
+
+
+async def test_start_requeues_unfinished_tasks():
+    with get_db() as conn:
+        conn.execute(
+            "INSERT INTO generation_tasks (job_description, status) VALUES ('JD', 'running')"
+        )
+        conn.commit()
+
+    queue = GenerationQueue(workers=1)
+    with patch(
+        "services.generation_queue.resume_generator_service.generate",
+        side_effect=ValueError("boom"),
+    ) as mock_generate:
+        queue.start()
+        await asyncio.wait_for(queue._queue.join(), timeout=5)
+        await queue.stop()
+
+    mock_generate.assert_called_once()
+    task = queue.get(1)
+    assert task["status"] == "failed"
+    assert task["error"] == "boom"
+
+
+# Bulk generation
+
+
+def _create_jobs(client, count):
+    return [
+        client.post("/api/jobs", json={"original_text": f"Job {i} " + "A" * 150}).json()["id"]
+        for i in range(count)
+    ]
+
+
+def _wait_for_batch(client, batch_id, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        batch = client.get(f"/api/resumes/generate/bulk/{batch_id}").json()
+        if batch["status"] == "finished":
+            return batch
+        time.sleep(0.02)
+    raise AssertionError(f"Batch {batch_id} did not finish: {batch}")
+
+
+@patch("services.resume_generator.llm_service.analyze_and_generate")
+def test_bulk_generate_creates_resume_per_job(mock_llm, app_client):
+    _create_work_experience(app_client)
+    job_ids = _create_jobs(app_client, 3)
+    mock_llm.return_value = create_llm_result(LLM_RESULT)
+
+    with patch(
+        "services.resume_generator.profile_service.get_complete",
+        wraps=profile_service.get_complete,
+    ) as get_complete:
+        response = app_client.post(
+            "/api/resumes/generate/bulk",
+            json={"job_ids": job_ids + [job_ids[0]], "language": "nl"},
+        )
+        assert response.status_code == 202
+        batch = _wait_for_batch(app_client, response.json()["id"])
+
+    assert get_complete.call_count == 1
+    assert batch["total"] == 3
+    assert batch["succeeded"] == 3
+    assert [task["job_id"] for task in batch["tasks"]] == job_ids
+    for task in batch["tasks"]:
+        resume = app_client.get(f"/api/resumes/{task['resume_id']}").json()
+        assert resume["language"] == "nl"
+        assert app_client.get(f"/api/jobs/{task['job_id']}/resumes").json()[0]["id"] == task["resume_id"]
+
+
+def test_bulk_generate_rejects_unknown_jobs(app_client):
+    _create_work_experience(app_client)
+    job_ids = _create_jobs(app_client, 1)
+
+    response = app_client.post(
+        "/api/resumes/generate/bulk",
+        json={"job_ids": job_ids + [999]},
+    )
+
+    assert response.status_code == 400
+    assert "999" in response.json()["detail"]
+
+
+def test_bulk_generate_requires_profile(app_client):
+    job_ids = _create_jobs(app_client, 1)
+
+    response = app_client.post("/api/resumes/generate/bulk", json={"job_ids": job_ids})
+
+    assert response.status_code == 400
+    assert "work experience" in response.json()["detail"].lower()
+
+
+def test_get_bulk_generation_not_found(client):
+    assert client.get("/api/resumes/generate/bulk/999").status_code == 404
+
+
+def test_bulk_generate_bounds_concurrency_and_reports_failures(app_client, monkeypatch):
+    _create_work_experience(app_client)
+    job_ids = _create_jobs(app_client, 5)
+    monkeypatch.setattr("settings.BULK_GENERATION_CONCURRENCY", 2)
+    active = 0
+    peak = 0
+
+    async def generate(job_description, profile, language="en", bypass_cache=False):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if job_description.startswith("Job 3"):
+            raise ValueError("Invalid response from AI service")
+        return create_llm_result(LLM_RESULT)
+
+    with patch("services.resume_generator.llm_service.analyze_and_generate", side_effect=generate):
+        batch_id = app_client.post(
+            "/api/resumes/generate/bulk", json={"job_ids": job_ids}
+        ).json()["id"]
+        batch = _wait_for_batch(app_client, batch_id)
+
+    assert peak == 2
+    assert batch["succeeded"] == 4
+    assert batch["failed"] == 1
+    failed = next(task for task in batch["tasks"] if task["status"] == "failed")
+    assert failed["job_id"] == job_ids[3]
+    assert "Invalid response" in failed["error"]
+
+
+def test_busy_provider_is_retried(app_client, monkeypatch):
+    _create_work_experience(app_client)
+    job_ids = _create_jobs(app_client, 1)
+    monkeypatch.setattr("services.generation_queue.BUSY_RETRY_DELAYS", (0, 0))
+
+    with patch(
+        "services.resume_generator.llm_service.analyze_and_generate",
+        side_effect=[
+            ProviderBusyError("AI service is busy, please try again later"),
+            create_llm_result(LLM_RESULT),
+        ],
+    ) as mock_llm:
+        batch_id = app_client.post(
+            "/api/resumes/generate/bulk", json={"job_ids": job_ids}
+        ).json()["id"]
+        batch = _wait_for_batch(app_client, batch_id)
+
+    assert mock_llm.call_count == 2
+    assert batch["succeeded"] == 1
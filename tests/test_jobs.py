@@ -251,3 +251,127 @@ def test_restore_version_not_found(client):
 
     response = client.post(f"/api/jobs/{job_id}/versions/999/restore")
     assert response.status_code == 404
+
+
+def test_list_jobs_keyset_pages(client):
+    """Pages follow X-Next-Cursor without gaps or repeats."""
+    ids = [_create_job(client, f"Job {i} " + "A" * 100).json()["id"] for i in range(5)]
+
+    first = client.get("/api/jobs", params={"limit": 2})
+    second = client.get("/api/jobs", params={"limit": 2, "cursor": first.headers["x-next-cursor"]})
+    third = client.get("/api/jobs", params={"limit": 2, "cursor": second.headers["x-next-cursor"]})
+
+    pages = [first.json(), second.json(), third.json()]
+    assert [job["id"] for page in pages for job in page] == ids[::-1]
+    assert "x-next-cursor" not in third.headers
+
+
+def test_list_jobs_invalid_cursor(client):
+    response = client.get("/api/jobs", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("values", [["a", {}], [1, "2026-01-01"], ["2026-01-01", True], ["2026-01-01", None]])
+def test_list_jobs_cursor_with_wrong_types(client, values):
+    from database import encode_cursor
+
+    response = client.get("/api/jobs", params={"cursor": encode_cursor(*values)})
+    assert response.status_code == 400
+
+
+def test_list_jobs_text_preview_cut_in_sql(client):
+    text = "Ü" * 150 + "B" * 150
+    _create_job(client, text)
+
+    assert client.get("/api/jobs").json()[0]["text_preview"] == text[:200]
+
+
+def test_list_jobs_filters_by_title_and_company(client):
+    from database import get_db
+
+    for title, company in [("Backend Engineer", "Acme"), ("Frontend Engineer", "Globex"), ("100%_Remote", "Acme")]:
+        job_id = _create_job(client).json()["id"]
+        with get_db() as conn:
+            conn.execute("UPDATE jobs SET title = ?, company_name = ? WHERE id = ?", (title, company, job_id))
+            conn.commit()
+
+    def titles(**params):
+        return sorted(job["title"] for job in client.get("/api/jobs", params=params).json())
+
+    assert titles(title="engineer") == ["Backend Engineer", "Frontend Engineer"]
+    assert titles(company="acme") == ["100%_Remote", "Backend Engineer"]
+    assert titles(title="engineer", company="glob") == ["Frontend Engineer"]
+    # LIKE wildcards in the term are matched literally
+    assert titles(title="0%_") == ["100%_Remote"]
+    assert titles(title="_") == ["100%_Remote"]
+
+
+def _insert_resume(job_id):
+    from database import get_db
+
+    with get_db() as conn:
+        resume_id = conn.execute(
+            "INSERT INTO generated_resumes (job_id, resume_content) VALUES (?, '{}')", (job_id,)
+        ).lastrowid
+        conn.commit()
+    return resume_id
+
+
+def test_resume_count_follows_resume_writes(client):
+    """resume_count is maintained by triggers on generated_resumes."""
+    from database import get_db
+
+    first = _create_job(client).json()["id"]
+    second = _create_job(client).json()["id"]
+    resume_ids = [_insert_resume(first) for _ in range(3)]
+
+    with get_db() as conn:
+        conn.execute("DELETE FROM generated_resumes WHERE id = ?", (resume_ids[0],))
+        conn.execute("UPDATE generated_resumes SET job_id = ? WHERE id = ?", (second, resume_ids[1]))
+        conn.commit()
+
+    counts = {job["id"]: job["resume_count"] for job in client.get("/api/jobs").json()}
+    assert counts == {first: 1, second: 1}
+    assert client.get(f"/api/jobs/{first}").json()["resume_count"] == 1
+
+
+def test_resume_count_backfilled_by_migration(client):
+    from database import get_db, init_db
+
+    job_id = _create_job(client).json()["id"]
+    _insert_resume(job_id)
+    with get_db() as conn:
+        conn.execute("UPDATE jobs SET resume_count = 0")
+        conn.execute("DELETE FROM schema_versions WHERE version = '20261018_jobs_resume_count_backfill'")
+        conn.commit()
+
+    init_db()
+
+    assert client.get(f"/api/jobs/{job_id}").json()["resume_count"] == 1
+
+
+def test_update_job_runs_on_one_connection(client):
+    """Update and restore each use one connection and commit once."""
+    import database
+
+    job_id = _create_job(client, "Original text " + "A" * 100).json()["id"]
+    acquired = []
+    original_acquire = database.ConnectionPool.acquire
+
+    def counting_acquire(pool):
+        acquired.append(pool)
+        return original_acquire(pool)
+
+    with patch.object(database.ConnectionPool, "acquire", counting_acquire):
+        updated = client.put(f"/api/jobs/{job_id}", json={"original_text": "New text " + "B" * 100})
+        assert len(acquired) == 1
+
+        version_id = client.get(f"/api/jobs/{job_id}/versions").json()[0]["id"]
+        acquired.clear()
+        restored = client.post(f"/api/jobs/{job_id}/versions/{version_id}/restore")
+        assert len(acquired) == 1
+
+    assert updated.json()["original_text"].startswith("New text")
+    assert restored.json()["original_text"].startswith("Original text")
+    versions = client.get(f"/api/jobs/{job_id}/versions").json()
+    assert [v["version_number"] for v in versions] == [2, 1]
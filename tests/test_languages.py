@@ -139,3 +139,66 @@ def test_languages_in_profile_complete(client):
     assert len(profile["languages"]) == 1
     assert profile["languages"][0]["name"] == "Japanese"
     assert profile["languages"][0]["level"] == "A1"
+
+
+def test_batch_languages(client):
+    """Test one batch creates, updates, deletes and reorders languages."""
+    english = client.post("/api/languages", json={"name": "English", "level": "C2"}).json()
+    french = client.post("/api/languages", json={"name": "French", "level": "A2"}).json()
+    german = client.post("/api/languages", json={"name": "German", "level": "A1"}).json()
+
+    response = client.patch(
+        "/api/languages/batch",
+        json={
+            "create": [{"name": "Dutch", "level": "B1"}],
+            "update": [{"id": french["id"], "name": "French", "level": "B2"}],
+            "delete": [german["id"]],
+            "reorder": [
+                {"id": french["id"], "display_order": 0},
+                {"id": english["id"], "display_order": 1},
+            ],
+        },
+    )
+    assert response.status_code == 200
+
+    result = response.json()
+    assert [(lang["name"], lang["level"]) for lang in result] == [
+        ("French", "B2"),
+        ("English", "C2"),
+        ("Dutch", "B1"),
+    ]
+    assert result == client.get("/api/languages").json()
+
+
+def test_batch_languages_unknown_id_changes_nothing(client):
+    """Test a batch with an unknown id is rejected as a whole."""
+    english = client.post("/api/languages", json={"name": "English", "level": "C2"}).json()
+
+    response = client.patch(
+        "/api/languages/batch",
+        json={
+            "create": [{"name": "Dutch", "level": "B1"}],
+            "delete": [english["id"]],
+            "update": [{"id": 9999, "name": "Ghost", "level": "A1"}],
+        },
+    )
+    assert response.status_code == 404
+    assert "9999" in response.json()["detail"]
+    assert [lang["name"] for lang in client.get("/api/languages").json()] == ["English"]
+
+
+def test_batch_languages_rejects_conflicting_operations(client):
+    """Test an id cannot be both deleted and updated or reordered in one batch."""
+    english = client.post("/api/languages", json={"name": "English", "level": "C2"}).json()
+
+    response = client.patch(
+        "/api/languages/batch",
+        json={"delete": [english["id"]], "reorder": [{"id": english["id"], "display_order": 0}]},
+    )
+    assert response.status_code == 422
+
+    response = client.patch(
+        "/api/languages/batch",
+        json={"delete": [english["id"]], "update": [{"id": english["id"], "name": "English", "level": "C1"}]},
+    )
+    assert response.status_code == 422
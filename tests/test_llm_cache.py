@@ -0,0 +1,116 @@
+"""Tests for the LLM response cache and its use by the service wrapper."""
+
+import time
+
+import pytest
+from unittest.mock import patch
+
+import settings
+from services.llm import llm_service
+from services.llm.cache import llm_response_cache
+from tests.conftest import create_llm_result
+
+
+PARSED = {"job_title": "Engineer", "match_score": 80, "resume": {"summary": "Builds things"}}
+
+
+class FakeProvider:
+    """Provider double that counts calls and derives the hash from its inputs."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def cache_key(self, job_description, profile, language="en"):
+        return "claude", "claude-test-model", f"{job_description}|{language}"
+
+    async def analyze_and_generate(self, job_description, profile, language="en"):
+        self.calls += 1
+        return create_llm_result(dict(PARSED))
+
+    async def stream_analyze_and_generate(self, job_description, profile, language="en"):
+        self.calls += 1
+        parsed, breadcrumbs = create_llm_result(dict(PARSED))
+        yield "delta", breadcrumbs["raw_output"]
+        yield "done", (parsed, breadcrumbs)
+
+
+@pytest.fixture
+def provider():
+    fake = FakeProvider()
+    with patch.object(llm_service, "_instance", fake):
+        yield fake
+
+
+def test_get_returns_stored_response():
+    parsed, breadcrumbs = create_llm_result(PARSED)
+    llm_response_cache.put("claude", "m", "h", parsed, breadcrumbs)
+
+    assert llm_response_cache.get("claude", "m", "h") == (parsed, breadcrumbs)
+    assert llm_response_cache.get("claude", "other-model", "h") is None
+
+
+def test_expired_entry_is_a_miss(monkeypatch):
+    llm_response_cache.put("claude", "m", "h", *create_llm_result(PARSED))
+    monkeypatch.setattr(settings, "LLM_CACHE_TTL_SECONDS", -1)
+
+    assert llm_response_cache.get("claude", "m", "h") is None
+
+
+def test_least_recently_used_entries_are_evicted(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_CACHE_MAX_ENTRIES", 2)
+    now = time.time()
+    with patch("services.llm.cache.time.time", side_effect=[now - 4, now - 3, now - 2, now - 1]):
+        llm_response_cache.put("claude", "m", "first", *create_llm_result(PARSED))
+        llm_response_cache.put("claude", "m", "second", *create_llm_result(PARSED))
+        llm_response_cache.get("claude", "m", "first")
+        llm_response_cache.put("claude", "m", "third", *create_llm_result(PARSED))
+
+    assert llm_response_cache.get("claude", "m", "first") is not None
+    assert llm_response_cache.get("claude", "m", "second") is None
+    assert llm_response_cache.get("claude", "m", "third") is not None
+
+
+async def test_identical_generation_is_served_from_cache(provider):
+    first, _ = await llm_service.analyze_and_generate("JD", {}, "en")
+    second, breadcrumbs = await llm_service.analyze_and_generate("JD", {}, "en")
+
+    assert provider.calls == 1
+    assert second == first
+    assert breadcrumbs["prompt_hash"] == "a" * 40
+    assert breadcrumbs["input_tokens"] == 0
+    assert breadcrumbs["output_tokens"] == 0
+
+
+async def test_different_language_misses(provider):
+    await llm_service.analyze_and_generate("JD", {}, "en")
+    await llm_service.analyze_and_generate("JD", {}, "fr")
+
+    assert provider.calls == 2
+
+
+async def test_bypass_cache_calls_provider(provider):
+    await llm_service.analyze_and_generate("JD", {}, "en")
+    _, breadcrumbs = await llm_service.analyze_and_generate("JD", {}, "en", bypass_cache=True)
+
+    assert provider.calls == 2
+    assert breadcrumbs["input_tokens"] == 1000
+
+
+async def test_stream_replays_cached_response(provider):
+    await llm_service.analyze_and_generate("JD", {}, "en")
+
+    events = [event async for event in llm_service.stream_analyze_and_generate("JD", {}, "en")]
+
+    assert provider.calls == 1
+    assert events[0] == ("delta", create_llm_result(PARSED)[1]["raw_output"])
+    assert events[1][0] == "done"
+    assert events[1][1][0] == PARSED
+
+
+async def test_stream_result_is_cached(provider):
+    async for _ in llm_service.stream_analyze_and_generate("JD", {}, "en"):
+        pass
+
+    await llm_service.analyze_and_generate("JD", {}, "en")
+
+    assert provider.calls == 1
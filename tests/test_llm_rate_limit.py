@@ -0,0 +1,37 @@
+"""Tests for the provider token bucket."""
+
+from unittest.mock import patch, AsyncMock
+
+from services.llm.rate_limit import TokenBucket
+
+
+async def test_burst_up_to_capacity_does_not_wait():
+    bucket = TokenBucket(per_minute=60, capacity=3)
+
+    with patch("services.llm.rate_limit.asyncio.sleep", new_callable=AsyncMock) as sleep:
+        for _ in range(3):
+            await bucket.acquire()
+
+    sleep.assert_not_called()
+
+
+async def test_waiters_sleep_for_their_share_of_the_deficit():
+    bucket = TokenBucket(per_minute=60, capacity=1)
+
+    with patch("services.llm.rate_limit.time.monotonic", return_value=100.0), \
+            patch("services.llm.rate_limit.asyncio.sleep", new_callable=AsyncMock) as sleep:
+        bucket._updated = 100.0
+        for _ in range(3):
+            await bucket.acquire()
+
+    assert [call.args[0] for call in sleep.await_args_list] == [1.0, 2.0]
+
+
+async def test_zero_rate_disables_limit():
+    bucket = TokenBucket(per_minute=0)
+
+    with patch("services.llm.rate_limit.asyncio.sleep", new_callable=AsyncMock) as sleep:
+        for _ in range(100):
+            await bucket.acquire()
+
+    sleep.assert_not_called()
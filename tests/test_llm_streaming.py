@@ -0,0 +1,77 @@
+"""Tests for incremental JSON parsing of streamed LLM output."""
+
+import json
+
+import pytest
+
+from services.llm.streaming import IncrementalJsonParser
+
+
+DOCUMENT = {
+    "job_title": "Backend Engineer",
+    "company_name": "Acme \"Labs\" {EU}",
+    "match_score": 82.5,
+    "job_analysis": {
+        "required_skills": [{"name": "Python", "matched": True}],
+        "preferred_skills": [],
+    },
+    "resume": {
+        "summary": "Builds APIs, \\ ships [often]\nand tests.",
+        "work_experiences": [
+            {"id": 1, "company": "Acme", "title": "Developer", "included": True},
+            {"id": 2, "company": "Initech", "title": "Lead", "end_date": None},
+        ],
+        "skills": [{"name": "Python", "included": True}],
+    },
+}
+
+
+def _feed_in_chunks(text, size):
+    parser = IncrementalJsonParser()
+    events = []
+    for i in range(0, len(text), size):
+        events.extend(parser.feed(text[i:i + size]))
+    return parser, events
+
+
+@pytest.mark.parametrize("size", [1, 3, 17, 10_000])
+def test_reports_watched_values_regardless_of_chunking(size):
+    text = json.dumps(DOCUMENT, indent=2)
+
+    parser, events = _feed_in_chunks(text, size)
+
+    assert events == [
+        (("job_title",), "Backend Engineer"),
+        (("company_name",), "Acme \"Labs\" {EU}"),
+        (("match_score",), 82.5),
+        (("job_analysis",), DOCUMENT["job_analysis"]),
+        (("resume", "summary"), DOCUMENT["resume"]["summary"]),
+        (("resume", "work_experiences", 0), DOCUMENT["resume"]["work_experiences"][0]),
+        (("resume", "work_experiences", 1), DOCUMENT["resume"]["work_experiences"][1]),
+    ]
+    assert parser.text == text
+
+
+def test_value_reported_only_once_complete():
+    parser = IncrementalJsonParser()
+
+    assert parser.feed('{"job_title": "Data Eng') == []
+    assert parser.feed('ineer", "match_score": 7') == [(("job_title",), "Data Engineer")]
+    assert parser.feed("1,") == [(("match_score",), 71)]
+
+
+def test_skips_preamble_and_code_fence():
+    text = "Here is the resume:\n```json\n" + json.dumps(DOCUMENT) + "\n```\nDone {not json}"
+
+    _, events = _feed_in_chunks(text, 5)
+
+    assert [path for path, _ in events][:3] == [("job_title",), ("company_name",), ("match_score",)]
+    assert len(events) == 7
+
+
+def test_unwatched_nested_values_are_ignored():
+    parser = IncrementalJsonParser(paths=(("resume", "summary"),))
+
+    events = parser.feed(json.dumps(DOCUMENT))
+
+    assert events == [(("resume", "summary"), DOCUMENT["resume"]["summary"])]
@@ -181,3 +181,154 @@ def test_export_pdf_eu_classic_template(mock_llm, client):
     assert response.status_code == 200
     assert response.headers["content-type"] == "application/pdf"
     assert response.content[:4] == b"%PDF"
+
+
+@patch("services.resume_generator.llm_service.analyze_and_generate")
+def test_export_pdf_queue_full_returns_429(mock_llm, client):
+    """Test a full render queue answers 429 with Retry-After."""
+    from services.pdf_generator import PdfQueueFullError
+
+    resume_id = _generate_resume(client, mock_llm)
+
+    with patch(
+        "routes.resumes.pdf_generator_service.generate_pdf_async",
+        side_effect=PdfQueueFullError(retry_after=3),
+    ):
+        response = client.get(f"/api/resumes/{resume_id}/pdf")
+
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "3"
+
+
+@patch("services.resume_generator.llm_service.analyze_and_generate")
+def test_export_pdf_sets_etag_and_honours_if_none_match(mock_llm, client):
+    """Test a matching If-None-Match answers 304 without rendering."""
+    resume_id = _generate_resume(client, mock_llm)
+
+    with patch(
+        "routes.resumes.pdf_generator_service.generate_pdf_async",
+        return_value=b"%PDF-fake",
+    ) as mock_render:
+        first = client.get(f"/api/resumes/{resume_id}/pdf")
+        etag = first.headers["etag"]
+        second = client.get(
+            f"/api/resumes/{resume_id}/pdf", headers={"If-None-Match": etag}
+        )
+        other_template = client.get(
+            f"/api/resumes/{resume_id}/pdf?template=modern", headers={"If-None-Match": etag}
+        )
+
+    assert first.status_code == 200
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert other_template.status_code == 200
+    assert mock_render.call_count == 2
+
+
+@patch("services.resume_generator.llm_service.analyze_and_generate")
+def test_export_pdf_cached_until_resume_updated(mock_llm, client):
+    """Test repeat exports hit the PDF cache and an edit invalidates it."""
+    resume_id = _generate_resume(client, mock_llm)
+
+    with patch(
+        "services.pdf_generator.browser_pool.run_async",
+        side_effect=_fake_render,
+    ) as mock_run:
+        client.get(f"/api/resumes/{resume_id}/pdf")
+        client.get(f"/api/resumes/{resume_id}/pdf")
+        assert mock_run.call_count == 1
+
+        resume = client.get(f"/api/resumes/{resume_id}").json()["resume"]
+        resume["summary"] = "Edited summary"
+        client.put(f"/api/resumes/{resume_id}", json={"resume": resume})
+        response = client.get(f"/api/resumes/{resume_id}/pdf")
+
+    assert response.status_code == 200
+    assert mock_run.call_count == 2
+
+
+async def _fake_render(coro):
+    coro.close()
+    return b"%PDF-fake"
+
+
+@patch("services.resume_generator.llm_service.analyze_and_generate")
+def test_export_pdf_miss_prepares_render_once(mock_llm, client):
+    """Test a cache miss reuses the context and key computed for the ETag."""
+    from services.pdf_cache import PdfCache
+
+    resume_id = _generate_resume(client, mock_llm)
+
+    with patch(
+        "services.pdf_generator.browser_pool.run_async",
+        side_effect=_fake_render,
+    ), patch(
+        "services.pdf_generator.pdf_cache.key",
+        side_effect=PdfCache.key,
+    ) as mock_key:
+        response = client.get(f"/api/resumes/{resume_id}/pdf")
+
+    assert response.status_code == 200
+    assert response.content == b"%PDF-fake"
+    assert mock_key.call_count == 1
+
+
+@patch("services.resume_generator.llm_service.analyze_and_generate")
+def test_export_pdf_batch_returns_zip(mock_llm, client):
+    """Test POST /api/resumes/{id}/pdf/batch zips one PDF per distinct variant."""
+    import io
+    import zipfile
+
+    resume_id = _generate_resume(client, mock_llm)
+
+    async def fake_render_many(self, jobs):
+        return [f"%PDF-{index}".encode() for index in range(len(jobs))]
+
+    with patch(
+        "services.pdf_generator.browser_pool.run_async",
+        side_effect=_fake_run,
+    ), patch(
+        "services.pdf_generator.PdfGeneratorService._render_many",
+        fake_render_many,
+    ):
+        response = client.post(
+            f"/api/resumes/{resume_id}/pdf/batch",
+            json={"variants": [
+                {"template": "classic", "language": "en"},
+                {"template": "brussels", "language": "fr"},
+                {"template": "classic", "language": "en"},
+            ]},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    assert 'filename="John_Doe_Resume_TechCorp.zip"' in response.headers["content-disposition"]
+    names = zipfile.ZipFile(io.BytesIO(response.content)).namelist()
+    assert names == [
+        "John_Doe_Resume_TechCorp_classic_en.pdf",
+        "John_Doe_Resume_TechCorp_brussels_fr.pdf",
+    ]
+
+
+def test_export_pdf_batch_rejects_invalid_variant(client):
+    """Test 422 for an unknown template in the batch body."""
+    response = client.post(
+        "/api/resumes/1/pdf/batch",
+        json={"variants": [{"template": "invalid", "language": "en"}]},
+    )
+
+    assert response.status_code == 422
+
+
+def test_export_pdf_batch_resume_not_found(client):
+    """Test 404 when resume not found."""
+    response = client.post(
+        "/api/resumes/9999/pdf/batch",
+        json={"variants": [{"template": "classic", "language": "en"}]},
+    )
+
+    assert response.status_code == 404
+
+
+async def _fake_run(coro):
+    return await coro
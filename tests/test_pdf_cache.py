@@ -0,0 +1,89 @@
+# Lean Code — BSD 3-Clause License — Vivian Voss, 2026
+# Scope: Tests for services/pdf_cache.py — key derivation, hit/miss, LRU eviction, per-resume invalidation.
+
+import os
+import time
+
+import settings
+from services.pdf_cache import PdfCache
+
+
+def test_key_is_stable_and_input_sensitive():
+    context = {"summary": "Engineer", "work_experiences": []}
+
+    key = PdfCache.key(context, "classic", "abc", "en")
+
+    assert key == PdfCache.key(dict(context), "classic", "abc", "en")
+    assert key != PdfCache.key(context, "modern", "abc", "en")
+    assert key != PdfCache.key(context, "classic", "def", "en")
+    assert key != PdfCache.key(context, "classic", "abc", "fr")
+    assert key != PdfCache.key({**context, "summary": "Manager"}, "classic", "abc", "en")
+
+
+def test_get_returns_stored_bytes():
+    cache = PdfCache()
+
+    assert cache.get("k1", 1) is None
+    cache.put("k1", b"%PDF-one", 1)
+
+    assert cache.get("k1", 1) == b"%PDF-one"
+    assert cache.get("k1", 2) is None
+
+
+def test_invalidate_drops_only_that_resume():
+    cache = PdfCache()
+    cache.put("k1", b"%PDF-one", 1)
+    cache.put("k2", b"%PDF-two", 2)
+
+    cache.invalidate(1)
+
+    assert cache.get("k1", 1) is None
+    assert cache.get("k2", 2) == b"%PDF-two"
+
+
+def test_eviction_removes_least_recently_used(monkeypatch):
+    monkeypatch.setattr(settings, "PDF_CACHE_MAX_BYTES", 25)
+    cache = PdfCache()
+    cache.put("old", b"x" * 10, 1)
+    cache.put("used", b"y" * 10, 1)
+    past = time.time() - 60
+    os.utime(cache._path("old", 1), (past, past))
+    os.utime(cache._path("used", 1), (past + 1, past + 1))
+    cache.get("used", 1)
+
+    cache.put("new", b"z" * 10, 1)
+
+    assert cache.get("old", 1) is None
+    assert cache.get("used", 1) == b"y" * 10
+    assert cache.get("new", 1) == b"z" * 10
+
+
+def test_put_keeps_running_size_without_rescanning(monkeypatch):
+    monkeypatch.setattr(settings, "PDF_CACHE_MAX_BYTES", 1000)
+    cache = PdfCache()
+    cache.put("first", b"x" * 10, 1)
+    scans = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda path: scans.append(path) or real_scandir(path))
+
+    cache.put("second", b"y" * 20, 1)
+    cache.put("second", b"y" * 5, 1)
+    cache.invalidate(1)
+    cache.put("third", b"z" * 7, 2)
+
+    assert scans == []
+    assert cache._sizes[cache._dir()] == 7
+
+
+def test_eviction_rescans_and_resyncs_total(monkeypatch):
+    monkeypatch.setattr(settings, "PDF_CACHE_MAX_BYTES", 25)
+    cache = PdfCache()
+    cache.put("a", b"x" * 10, 1)
+    cache.put("b", b"y" * 10, 1)
+    past = time.time() - 60
+    os.utime(cache._path("a", 1), (past, past))
+
+    cache.put("c", b"z" * 10, 1)
+
+    assert cache.get("a", 1) is None
+    assert cache._sizes[cache._dir()] == 20
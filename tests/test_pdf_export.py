@@ -355,3 +355,181 @@ class TestFilenameGeneration:
         filename = pdf_generator_service.generate_filename(resume_data, company)
 
         assert filename == "Resume_Resume_TestCo.pdf"
+
+
+class TestPdfAdmission:
+    def test_queue_full_raises(self, monkeypatch):
+        import settings
+        from services.browser_pool import browser_pool
+        from services.pdf_generator import PdfQueueFullError
+
+        service = PdfGeneratorService()
+        monkeypatch.setattr(settings, "PDF_RENDER_QUEUE_SIZE", 0)
+        service._pending = browser_pool.size
+
+        with pytest.raises(PdfQueueFullError) as exc_info:
+            service.generate_pdf({"personal_info": {"full_name": "Test"}}, "classic")
+
+        assert exc_info.value.retry_after >= 1
+
+    def test_pending_released_after_render(self, monkeypatch):
+        from services.browser_pool import browser_pool
+
+        def fake_run(coro):
+            coro.close()
+            return b"%PDF"
+
+        service = PdfGeneratorService()
+        monkeypatch.setattr(browser_pool, "run", fake_run)
+
+        assert service.generate_pdf({"personal_info": {"full_name": "Test"}}, "classic") == b"%PDF"
+        assert service._pending == 0
+
+    async def test_generate_pdf_async_uses_pool(self, monkeypatch):
+        from services.browser_pool import browser_pool
+
+        async def fake_run_async(coro):
+            coro.close()
+            return b"%PDF"
+
+        service = PdfGeneratorService()
+        monkeypatch.setattr(browser_pool, "run_async", fake_run_async)
+
+        pdf_bytes = await service.generate_pdf_async({"personal_info": {"full_name": "Test"}}, "modern", "fr")
+
+        assert pdf_bytes == b"%PDF"
+        assert service._pending == 0
+
+    async def test_batch_resolves_photo_once_off_the_loop(self, monkeypatch):
+        from services import pdf_generator
+        from services.browser_pool import browser_pool
+
+        resolved = []
+
+        async def fake_run_in_db(func, *args):
+            resolved.append(func)
+            return "data:image/png;base64,cG5n"
+
+        async def fake_run_async(coro):
+            coro.close()
+            return [b"%PDF-a", b"%PDF-b"]
+
+        service = PdfGeneratorService()
+        monkeypatch.setattr(pdf_generator, "run_in_db", fake_run_in_db)
+        monkeypatch.setattr(browser_pool, "run_async", fake_run_async)
+        resume_data = {"personal_info": {"full_name": "Test", "photo_ref": "ab" * 32}}
+
+        pdfs = await service.generate_pdf_batch(resume_data, [("classic", "en"), ("modern", "fr")])
+
+        assert pdfs == [b"%PDF-a", b"%PDF-b"]
+        assert resolved == [service._photo_data_url]
+
+    async def test_async_cache_io_runs_in_threads(self, monkeypatch):
+        import threading
+
+        from services import pdf_generator
+        from services.browser_pool import browser_pool
+
+        loop_thread = threading.get_ident()
+        io_threads = []
+
+        class RecordingCache:
+            key = staticmethod(pdf_generator.pdf_cache.key)
+
+            def get(self, key, scope=None):
+                io_threads.append(threading.get_ident())
+                return None
+
+            def put(self, key, data, scope=None):
+                io_threads.append(threading.get_ident())
+
+        async def fake_run_async(coro):
+            coro.close()
+            return b"%PDF"
+
+        service = PdfGeneratorService()
+        monkeypatch.setattr(pdf_generator, "pdf_cache", RecordingCache())
+        monkeypatch.setattr(browser_pool, "run_async", fake_run_async)
+
+        await service.generate_pdf_async({"personal_info": {"full_name": "Test"}}, "classic")
+
+        assert len(io_threads) == 2
+        assert loop_thread not in io_threads
+
+
+class TestCompiledTemplates:
+    @pytest.fixture
+    def service(self, tmp_path, monkeypatch):
+        import shutil
+
+        for path in PdfGeneratorService.TEMPLATES_DIR.iterdir():
+            shutil.copy(path, tmp_path / path.name)
+        monkeypatch.setattr(PdfGeneratorService, "TEMPLATES_DIR", tmp_path)
+        return PdfGeneratorService()
+
+    def test_base_css_inlined_without_file_reads(self, service, monkeypatch):
+        from pathlib import Path
+
+        css = (service.TEMPLATES_DIR / "resume_base.css").read_text()
+        monkeypatch.setattr(Path, "read_text", lambda *a, **kw: pytest.fail("template file read on render"))
+
+        html = service._build_html(service._prepare_context({"personal_info": {"full_name": "Test"}}), "classic")
+
+        assert f"<style>{css}</style></head>" in html
+
+    def test_photo_ref_embedded_only_at_render(self, service):
+        from database import get_db
+        from services.photo_store import store_blob
+
+        with get_db() as conn:
+            photo_ref = store_blob(conn, "image/png", b"png-bytes")
+            conn.commit()
+        resume_data = {"personal_info": {"full_name": "Test", "photo_ref": photo_ref, "photo": f"/api/photos/{photo_ref}"}}
+
+        context = service._prepare_context(resume_data)
+        html = service._build_html(context, "eu_classic", service._photo_data_url(context))
+
+        assert "photo" not in context["personal_info"]
+        assert "data:image/png;base64,cG5nLWJ5dGVz" in html
+        assert "/api/photos/" not in html
+
+    def test_reload_if_changed_recompiles_edited_template(self, service):
+        import os
+
+        path = service.TEMPLATES_DIR / "resume_classic.html"
+        before = service._template_hash("classic")
+        assert service.reload_if_changed() is False
+
+        path.write_text(path.read_text().replace("<body", "<!-- edited --><body", 1))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert service.reload_if_changed() is True
+        assert service._template_hash("classic") != before
+        assert "<!-- edited -->" in service._build_html(service._prepare_context({}), "classic")
+
+    def test_reload_keeps_previous_templates_on_syntax_error(self, service):
+        import os
+
+        path = service.TEMPLATES_DIR / "resume_modern.html"
+        before = service._template_hash("modern")
+        path.write_text("{% if %}")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert service.reload_if_changed() is False
+        assert service._template_hash("modern") == before
+
+
+def test_stream_zip_yields_valid_archive():
+    import io
+    import zipfile
+
+    from services.pdf_generator import stream_zip
+
+    chunks = list(stream_zip([("a.pdf", b"%PDF-a"), ("b.pdf", b"%PDF-b")]))
+
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+    assert len(chunks) == 3
+    assert archive.read("a.pdf") == b"%PDF-a"
+    assert archive.read("b.pdf") == b"%PDF-b"
@@ -1,8 +1,15 @@
 import base64
+import hashlib
+import io
+
+from PIL import Image
+
+import settings
+from database import get_db
 
 
 # Sample valid base64 image data (small 1x1 JPEG)
-VALID_JPEG_DATA = "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDAAgGBgcGBQgHBwcJCQgKDBQNDAsLDBkSEw8UHRofHh0aHBwgJC4nICIsIxwcKDcpLDAxNDQ0Hyc5PTgyPC4zNDL/2wBDAQkJCQwLDBgNDRgyIRwhMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjL/wAARCAABAAEDASIAAhEBAxEB/8QAFQABAQAAAAAAAAAAAAAAAAAAAAn/xAAUEAEAAAAAAAAAAAAAAAAAAAAA/8QAFQEBAQAAAAAAAAAAAAAAAAAAAAX/xAAUEQEAAAAAAAAAAAAAAAAAAAAA/9oADAMBEQCEAwEPwAB//9k="
+VALID_JPEG_DATA = "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDAAMCAgMCAgMDAwMEAwMEBQgFBQQEBQoHBwYIDAoMDAsKCwsNDhIQDQ4RDgsLEBYQERMUFRUVDA8XGBYUGBIUFRT/2wBDAQMEBAUEBQkFBQkUDQsNFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBT/wAARCAABAAEDASIAAhEBAxEB/8QAHwAAAQUBAQEBAQEAAAAAAAAAAAECAwQFBgcICQoL/8QAtRAAAgEDAwIEAwUFBAQAAAF9AQIDAAQRBRIhMUEGE1FhByJxFDKBkaEII0KxwRVS0fAkM2JyggkKFhcYGRolJicoKSo0NTY3ODk6Q0RFRkdISUpTVFVWV1hZWmNkZWZnaGlqc3R1dnd4eXqDhIWGh4iJipKTlJWWl5iZmqKjpKWmp6ipqrKztLW2t7i5usLDxMXGx8jJytLT1NXW19jZ2uHi4+Tl5ufo6erx8vP09fb3+Pn6/8QAHwEAAwEBAQEBAQEBAQAAAAAAAAECAwQFBgcICQoL/8QAtREAAgECBAQDBAcFBAQAAQJ3AAECAxEEBSExBhJBUQdhcRMiMoEIFEKRobHBCSMzUvAVYnLRChYkNOEl8RcYGRomJygpKjU2Nzg5OkNERUZHSElKU1RVVldYWVpjZGVmZ2hpanN0dXZ3eHl6goOEhYaHiImKkpOUlZaXmJmaoqOkpaanqKmqsrO0tba3uLm6wsPExcbHyMnK0tPU1dbX2Nna4uPk5ebn6Onq8vP09fb3+Pn6/9oADAMBAAIRAxEAPwDdooor8nP3M//Z"
 VALID_PNG_DATA = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
 
 
@@ -40,31 +47,32 @@ def test_upload_photo(client):
     create_personal_info(client)
     response = client.put("/api/photos", json={"image_data": VALID_JPEG_DATA})
     assert response.status_code == 200
-    assert response.json()["image_data"] == VALID_JPEG_DATA
+    assert response.json()["image_data"].startswith("data:image/")
+    assert response.json()["thumbnail_url"].startswith("/api/photos/")
 
 
 def test_get_photo_after_upload(client):
     """GET /api/photos returns uploaded photo."""
     create_personal_info(client)
-    client.put("/api/photos", json={"image_data": VALID_JPEG_DATA})
+    uploaded = client.put("/api/photos", json={"image_data": VALID_JPEG_DATA}).json()
 
     response = client.get("/api/photos")
     assert response.status_code == 200
-    assert response.json()["image_data"] == VALID_JPEG_DATA
+    assert response.json() == uploaded
 
 
 def test_replace_photo(client):
     """PUT /api/photos replaces existing photo."""
     create_personal_info(client)
-    client.put("/api/photos", json={"image_data": VALID_JPEG_DATA})
+    first = client.put("/api/photos", json={"image_data": VALID_JPEG_DATA}).json()
 
     response = client.put("/api/photos", json={"image_data": VALID_PNG_DATA})
     assert response.status_code == 200
-    assert response.json()["image_data"] == VALID_PNG_DATA
+    assert response.json()["photo_ref"] != first["photo_ref"]
 
     # Verify it was actually replaced
     get_response = client.get("/api/photos")
-    assert get_response.json()["image_data"] == VALID_PNG_DATA
+    assert get_response.json() == response.json()
 
 
 def test_delete_photo(client):
@@ -130,4 +138,97 @@ def test_photo_included_in_personal_info(client):
 
     response = client.get("/api/users")
     assert response.status_code == 200
-    assert response.json()["photo"] == VALID_JPEG_DATA
+    photo_ref = response.json()["photo_ref"]
+    assert response.json()["photo"] == f"/api/photos/{response.json()['photo_thumb_ref']}"
+    assert photo_ref
+
+
+def test_photo_stored_by_content_hash(client):
+    """Photos are stored decoded, keyed by the SHA-256 of their bytes."""
+    create_personal_info(client)
+    response = client.put("/api/photos", json={"image_data": VALID_PNG_DATA})
+
+    with get_db() as conn:
+        row = conn.execute("SELECT photo, photo_ref FROM users WHERE id = 1").fetchone()
+        blob = conn.execute(
+            "SELECT data FROM photo_blobs WHERE hash = ?", (row["photo_ref"],)
+        ).fetchone()
+    assert row["photo"] is None
+    assert row["photo_ref"] == response.json()["photo_ref"]
+    assert hashlib.sha256(blob["data"]).hexdigest() == row["photo_ref"]
+
+
+def test_get_photo_blob_is_immutable(client):
+    """GET /api/photos/{hash} serves the bytes with long-lived cache headers."""
+    create_personal_info(client)
+    uploaded = client.put("/api/photos", json={"image_data": VALID_PNG_DATA}).json()
+
+    response = client.get(f"/api/photos/{uploaded['photo_ref']}")
+    assert response.status_code == 200
+    assert "immutable" in response.headers["cache-control"]
+    mime_type, encoded = uploaded["image_data"][len("data:"):].split(";base64,")
+    assert response.headers["content-type"] == mime_type
+    assert response.content == base64.b64decode(encoded)
+
+
+def test_get_photo_blob_not_found(client):
+    response = client.get("/api/photos/" + "0" * 64)
+    assert response.status_code == 404
+
+
+def test_replaced_photo_blob_is_pruned(client):
+    """Replacing or deleting the photo drops blobs nothing references."""
+    create_personal_info(client)
+    old_ref = client.put("/api/photos", json={"image_data": VALID_JPEG_DATA}).json()["photo_ref"]
+    client.put("/api/photos", json={"image_data": VALID_PNG_DATA})
+
+    assert client.get(f"/api/photos/{old_ref}").status_code == 404
+    client.delete("/api/photos")
+    with get_db() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM photo_blobs").fetchone()[0] == 0
+
+
+def _image_data_url(image, fmt="PNG", **save_args):
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt, **save_args)
+    mime_type = f"image/{fmt.lower()}"
+    return f"data:{mime_type};base64,{base64.b64encode(buffer.getvalue()).decode()}"
+
+
+def test_upload_downscaled_and_stripped(client):
+    """Large uploads become a print variant and a smaller thumbnail, without EXIF."""
+    create_personal_info(client)
+    exif = Image.Exif()
+    exif[0x010F] = "PhoneMaker"
+    source = Image.new("RGB", (3000, 2000), "teal")
+    data_url = _image_data_url(source, "JPEG", exif=exif.tobytes())
+
+    uploaded = client.put("/api/photos", json={"image_data": data_url}).json()
+
+    print_bytes = client.get(f"/api/photos/{uploaded['photo_ref']}").content
+    thumb_bytes = client.get(uploaded["thumbnail_url"]).content
+    with Image.open(io.BytesIO(print_bytes)) as printed, Image.open(io.BytesIO(thumb_bytes)) as thumb:
+        assert max(printed.size) == settings.PHOTO_PRINT_SIZE
+        assert max(thumb.size) == settings.PHOTO_THUMB_SIZE
+        assert printed.format == settings.PHOTO_FORMAT
+        assert not printed.getexif()
+    assert len(print_bytes) < len(base64.b64decode(data_url.split(",", 1)[1]))
+
+
+def test_upload_transparent_png_flattened(client):
+    create_personal_info(client)
+    data_url = _image_data_url(Image.new("RGBA", (40, 40), (0, 0, 0, 0)))
+
+    uploaded = client.put("/api/photos", json={"image_data": data_url}).json()
+
+    with Image.open(io.BytesIO(client.get(f"/api/photos/{uploaded['photo_ref']}").content)) as printed:
+        assert printed.mode == "RGB"
+        assert printed.getpixel((20, 20))[0] > 240
+
+
+def test_undecodable_image_rejected(client):
+    create_personal_info(client)
+    data_url = "data:image/png;base64," + base64.b64encode(b"not an image").decode()
+
+    response = client.put("/api/photos", json={"image_data": data_url})
+    assert response.status_code == 422
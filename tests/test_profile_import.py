@@ -271,3 +271,87 @@ def test_import_graduation_year_validation(client):
 
     response = client.put("/api/profile/import", json=data)
     assert response.status_code == 422
+
+
+def _merge_profile(**sections):
+    return {
+        "personal_info": {"full_name": "Jane Doe", "email": "jane@example.com"},
+        "work_experiences": [
+            {"company": "Tech Corp", "title": "Engineer", "start_date": "2020-01", "description": "Backend"},
+            {"company": "Old Corp", "title": "Intern", "start_date": "2018-01", "end_date": "2019-01"},
+        ],
+        "skills": [{"name": "Python"}, {"name": "Go"}],
+        "languages": [{"name": "English", "level": "C2"}, {"name": "Dutch", "level": "B1"}],
+        **sections,
+    }
+
+
+def test_import_skills_duplicates_skipped(client):
+    data = _merge_profile(skills=[{"name": "Python"}, {"name": "Python"}, {"name": "Go"}])
+
+    response = client.put("/api/profile/import", json=data)
+
+    assert response.status_code == 200
+    assert response.json()["changes"]["skills"]["inserted"] == 2
+    assert sorted(s["name"] for s in client.get("/api/skills").json()) == ["Go", "Python"]
+
+
+def test_import_merge_keeps_ids_and_updates_only_changes(client):
+    client.put("/api/profile/import", json=_merge_profile())
+    before = {we["company"]: we for we in client.get("/api/work-experiences").json()}
+    skill_ids = {s["name"]: s["id"] for s in client.get("/api/skills").json()}
+
+    data = _merge_profile(
+        work_experiences=[
+            {"company": "Tech Corp", "title": "Engineer", "start_date": "2020-01", "description": "Platform"},
+            {"company": "Old Corp", "title": "Intern", "start_date": "2018-01", "end_date": "2019-01"},
+            {"company": "New Corp", "title": "Lead", "start_date": "2023-01", "is_current": True},
+        ],
+        skills=[{"name": "Python"}, {"name": "Rust"}],
+        languages=[{"name": "Dutch", "level": "B2"}, {"name": "English", "level": "C2"}],
+    )
+    response = client.put("/api/profile/import?mode=merge", json=data)
+
+    assert response.status_code == 200
+    changes = response.json()["changes"]
+    assert changes["work_experiences"] == {"inserted": 1, "updated": 1, "deleted": 0, "unchanged": 1}
+    assert changes["skills"] == {"inserted": 1, "updated": 0, "deleted": 1, "unchanged": 1}
+    assert changes["languages"]["updated"] == 2
+
+    after = {we["company"]: we for we in client.get("/api/work-experiences").json()}
+    assert after["Tech Corp"]["id"] == before["Tech Corp"]["id"]
+    assert after["Tech Corp"]["description"] == "Platform"
+    assert after["Old Corp"]["id"] == before["Old Corp"]["id"]
+    assert after["Old Corp"]["updated_at"] == before["Old Corp"]["updated_at"]
+    skills = {s["name"]: s["id"] for s in client.get("/api/skills").json()}
+    assert skills["Python"] == skill_ids["Python"] and "Go" not in skills
+    assert [(l["name"], l["level"]) for l in client.get("/api/languages").json()] == [("Dutch", "B2"), ("English", "C2")]
+
+
+def test_import_merge_matches_replace_content(client):
+    data = _merge_profile()
+    client.put("/api/profile/import?mode=merge", json=data)
+    merged = client.get("/api/profile/complete").json()
+
+    client.put("/api/profile/import", json=data)
+    replaced = client.get("/api/profile/complete").json()
+
+    def content(profile):
+        strip = lambda rows: [{k: v for k, v in r.items() if k not in ("id", "created_at", "updated_at")} for r in rows]
+        return {section: strip(profile[section]) for section in ("work_experiences", "skills", "languages")}
+
+    assert content(merged) == content(replaced)
+
+
+def test_import_merge_unchanged_profile_writes_nothing(client):
+    client.put("/api/profile/import", json=_merge_profile())
+    with database.get_db() as conn:
+        journal = conn.execute("SELECT COUNT(*) FROM profile_changes WHERE table_name != 'users'").fetchone()[0]
+
+    response = client.put("/api/profile/import?mode=merge", json=_merge_profile())
+
+    assert all(c["inserted"] == c["updated"] == c["deleted"] == 0 for c in response.json()["changes"].values())
+    with database.get_db() as conn:
+        assert conn.execute(
+            "SELECT COUNT(*) FROM profile_changes WHERE table_name != 'users'"
+        ).fetchone()[0] == journal
@@ -0,0 +1,116 @@
+# Lean Code — BSD 3-Clause License — Vivian Voss, 2026
+# Scope: Tests for services/profile.py — single-query loader, snapshot cache and the profile change journal.
+
+from unittest.mock import patch
+
+from database import get_db, get_profile_version
+from services.profile import profile_service
+from tests.conftest import create_llm_result
+
+
+def _create_profile(client):
+    client.put("/api/users", json={"full_name": "Jane Doe", "email": "jane@example.com"})
+    client.post(
+        "/api/work-experiences",
+        json={"company": "Old Co", "title": "Dev", "start_date": "2015-01", "end_date": "2018-01"},
+    )
+    client.post(
+        "/api/work-experiences",
+        json={"company": "Now Co", "title": "Lead", "start_date": "2019-01", "is_current": True},
+    )
+    client.post("/api/skills", json={"names": "Rust, Go"})
+    client.post("/api/languages", json={"name": "Dutch", "level": "C1"})
+
+
+def test_complete_profile_loaded_in_one_query(client):
+    _create_profile(client)
+    profile_service.bump_version()
+    statements = []
+
+    with get_db() as conn:
+        conn.set_trace_callback(statements.append)
+    try:
+        profile = profile_service.get_complete()
+    finally:
+        with get_db() as conn:
+            conn.set_trace_callback(None)
+
+    assert len([sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]) == 1
+    assert profile.personal_info["full_name"] == "Jane Doe"
+    assert [we["company"] for we in profile.work_experiences] == ["Now Co", "Old Co"]
+    assert [skill["name"] for skill in profile.skills] == ["Go", "Rust"]
+    assert profile.languages[0]["level"] == "C1"
+    assert profile.education == [] and profile.projects == []
+
+
+def test_snapshot_reused_until_a_route_mutates_the_profile(client):
+    _create_profile(client)
+
+    with patch.object(profile_service, "_load_complete", wraps=profile_service._load_complete) as load:
+        first = client.get("/api/profile/complete").json()
+        second = client.get("/api/profile/complete").json()
+        assert load.call_count == 1
+        assert first == second
+
+        client.post("/api/skills", json={"names": "Zig"})
+        third = client.get("/api/profile/complete").json()
+
+    assert load.call_count == 2
+    assert "Zig" in [skill["name"] for skill in third["skills"]]
+
+
+def test_profile_import_bumps_version(client):
+    _create_profile(client)
+    before = profile_service.version
+
+    response = client.put(
+        "/api/profile/import",
+        json={"personal_info": {"full_name": "Imported", "email": "imp@example.com"}},
+    )
+
+    assert response.status_code == 200
+    assert profile_service.version > before
+    assert profile_service.get_complete().personal_info["full_name"] == "Imported"
+
+
+def test_profile_writes_are_journaled(client):
+    with get_db() as conn:
+        start = get_profile_version(conn)
+
+    _create_profile(client)
+    skill_id = client.get("/api/skills").json()[0]["id"]
+    client.delete(f"/api/skills/{skill_id}")
+
+    with get_db() as conn:
+        version = get_profile_version(conn)
+        changes = conn.execute(
+            "SELECT table_name, operation FROM profile_changes WHERE id > ? ORDER BY id", (start,)
+        ).fetchall()
+    assert version > start
+    assert ("users", "insert") in [tuple(change) for change in changes]
+    assert tuple(changes[-1]) == ("skills", "delete")
+    assert profile_service.get_complete().version == version
+
+
+def test_unrelated_writes_leave_version_alone(client):
+    _create_profile(client)
+    with get_db() as conn:
+        before = get_profile_version(conn)
+
+    client.post("/api/jobs", json={"original_text": "A job posting " * 10})
+
+    with get_db() as conn:
+        assert get_profile_version(conn) == before
+
+
+@patch("services.resume_generator.llm_service.analyze_and_generate")
+def test_resume_records_profile_version(mock_llm, client):
+    _create_profile(client)
+    mock_llm.return_value = create_llm_result({"job_title": "Eng", "company_name": "X", "resume": {}})
+    with get_db() as conn:
+        version = get_profile_version(conn)
+
+    response = client.post("/api/resumes/generate", json={"job_description": "Engineer " * 20})
+
+    assert response.json()["profile_version"] == version
+    assert client.get(f"/api/resumes/{response.json()['id']}").json()["profile_version"] == version
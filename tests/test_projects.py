@@ -60,3 +60,26 @@ def test_get_nonexistent_project(client):
     """Test getting a project that doesn't exist."""
     response = client.get("/api/projects/9999")
     assert response.status_code == 404
+
+
+def test_batch_projects(client):
+    """Test one batch creates, updates and deletes projects."""
+    first = client.post("/api/projects", json={"name": "Portfolio"}).json()
+    second = client.post("/api/projects", json={"name": "CLI Tool"}).json()
+
+    response = client.patch(
+        "/api/projects/batch",
+        json={
+            "create": [{"name": "Game Engine", "technologies": "Rust"}],
+            "update": [{"id": first["id"], "name": "Portfolio Website", "url": "https://example.com"}],
+            "delete": [second["id"]],
+        },
+    )
+    assert response.status_code == 200
+    assert sorted(proj["name"] for proj in response.json()) == ["Game Engine", "Portfolio Website"]
+
+
+def test_batch_projects_unknown_delete(client):
+    """Test deleting an unknown project id in a batch returns 404."""
+    response = client.patch("/api/projects/batch", json={"delete": [9999]})
+    assert response.status_code == 404
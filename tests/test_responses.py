@@ -0,0 +1,95 @@
+# Lean Code — BSD 3-Clause License — Vivian Voss, 2026
+# Scope: Tests for routes/responses.py — JSON rendering, encoding negotiation and response compression.
+
+import gzip
+import json
+
+import brotli
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from routes.responses import CompressionMiddleware, FastJSONResponse, negotiate
+
+LONG_TEXT = "Senior developer with a decade of backend experience. " * 100
+
+
+def _job(client):
+    return client.post("/api/jobs", json={"original_text": LONG_TEXT}).json()
+
+
+def test_fast_json_renders_compact_utf8():
+    assert FastJSONResponse({"name": "Zoë", "n": [1, 2]}).body == '{"name":"Zoë","n":[1,2]}'.encode()
+
+
+def test_negotiate_prefers_configured_order():
+    assert negotiate("gzip, deflate", ("br", "gzip")) == "gzip"
+    assert negotiate("gzip;q=0, deflate", ("gzip",)) is None
+    assert negotiate("", ("gzip",)) is None
+    assert negotiate("gzip", ()) is None
+
+
+def test_large_json_is_gzipped(client):
+    _job(client)
+    response = client.get("/api/jobs/1", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(LONG_TEXT)
+    assert response.json()["original_text"] == LONG_TEXT.strip()
+
+
+def test_brotli_preferred_when_accepted(client):
+    _job(client)
+    with client.stream("GET", "/api/jobs/1", headers={"Accept-Encoding": "gzip, br"}) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["content-encoding"] == "br"
+    assert json.loads(brotli.decompress(raw))["original_text"] == LONG_TEXT.strip()
+
+
+def test_small_response_not_compressed(client):
+    response = client.get("/api/skills", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+
+
+def test_identity_when_not_accepted(client):
+    _job(client)
+    response = client.get("/api/jobs/1", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in response.headers
+
+
+def _app(response):
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=10)
+    app.get("/")(lambda: response())
+    return TestClient(app)
+
+
+def test_streamed_body_compressed_per_chunk():
+    client = _app(lambda: StreamingResponse(iter([b"a" * 100, b"b" * 100]), media_type="text/plain"))
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.content == b"a" * 100 + b"b" * 100
+
+
+def test_precompressed_and_event_stream_pass_through():
+    for media_type in ("application/pdf", "image/jpeg", "text/event-stream"):
+        client = _app(lambda: Response(b"x" * 100, media_type=media_type))
+        response = client.get("/", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.content == b"x" * 100
+
+
+def test_gzip_body_is_standard_gzip():
+    client = _app(lambda: Response(b"y" * 500, media_type="text/plain"))
+    with client.stream("GET", "/", headers={"Accept-Encoding": "gzip"}) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert gzip.decompress(raw) == b"y" * 500
@@ -383,9 +383,9 @@ def test_profile_snapshot_omits_photo(mock_llm, client):
             "email": "jane@example.com",
         },
     )
-    client.post(
-        "/api/photo",
-        json={"photo": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkAAIAAAoAAv/lxKUAAAAASUVORK5CYII="},
+    client.put(
+        "/api/photos",
+        json={"image_data": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkAAIAAAoAAv/lxKUAAAAASUVORK5CYII="},
     )
     client.post(
         "/api/work-experiences",
@@ -397,7 +397,7 @@ def test_profile_snapshot_omits_photo(mock_llm, client):
         },
     )
 
-    async def create_snapshot_result(job_description, profile, language="en"):
+    async def create_snapshot_result(job_description, profile, language="en", bypass_cache=False):
         snapshot = json.dumps(profile, sort_keys=True, ensure_ascii=False)
         parsed, breadcrumbs = create_llm_result({
             "job_title": "Engineer",
@@ -431,6 +431,38 @@ def test_profile_snapshot_omits_photo(mock_llm, client):
         ).fetchone()
     snapshot = json.loads(row["profile_snapshot"])
     assert "photo" not in snapshot.get("personal_info", {})
+    assert "photo_ref" not in snapshot.get("personal_info", {})
+
+
+@patch("services.resume_generator.llm_service.analyze_and_generate")
+def test_resume_references_photo_instead_of_embedding(mock_llm, client):
+    """resume_content stores the photo_ref; clients get the URL it is served from."""
+    _setup_profile(client)
+    photo_ref = client.put(
+        "/api/photos",
+        json={"image_data": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="},
+    ).json()["photo_ref"]
+    mock_llm.return_value = create_llm_result({
+        "job_title": "Engineer",
+        "company_name": "X",
+        "match_score": 70,
+        "resume": {"summary": "S", "work_experiences": [], "skills": [], "education": [], "projects": []},
+    })
+
+    response = client.post(
+        "/api/resumes/generate",
+        json={"job_description": "Looking for an engineer. " + "A" * 150},
+    )
+
+    personal_info = response.json()["resume"]["personal_info"]
+    assert personal_info["photo"] == f"/api/photos/{photo_ref}"
+    with get_db() as conn:
+        row = conn.execute(
+            "SELECT resume_content FROM generated_resumes WHERE id = ?", (response.json()["id"],)
+        ).fetchone()
+    stored = json.loads(row["resume_content"])["personal_info"]
+    assert stored["photo_ref"] == photo_ref
+    assert "photo" not in stored
 
 
 @patch("services.resume_generator.llm_service.analyze_and_generate")
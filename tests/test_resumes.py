@@ -3,7 +3,7 @@ import json
 import pytest
 from unittest.mock import patch, AsyncMock
 
-from database import get_db
+from database import encode_cursor, get_db
 from tests.conftest import create_llm_result
 
 
@@ -798,3 +798,152 @@ def test_two_resumes_same_jd_independent_job_analysis(mock_llm, client):
     # Verify they're linked to the same JD
     jd_resumes = client.get(f"/api/jobs/{jd_id}/resumes")
     assert len(jd_resumes.json()) == 2
+
+
+# Tests for streamed generation
+
+
+def _stream_events(text):
+    events = []
+    for block in text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def _streaming_llm(parsed, chunk_size=7):
+    raw = json.dumps(parsed)
+
+    async def stream(job_description, profile, language="en", bypass_cache=False):
+        for i in range(0, len(raw), chunk_size):
+            yield "delta", raw[i:i + chunk_size]
+        yield "done", create_llm_result(parsed)
+
+    return stream
+
+
+STREAMED_RESULT = {
+    "job_title": "Software Engineer",
+    "company_name": "TechCorp",
+    "match_score": 85.5,
+    "job_analysis": {"required_skills": [{"name": "Python", "matched": True}], "preferred_skills": []},
+    "resume": {
+        "summary": "Experienced developer",
+        "work_experiences": [
+            {
+                "id": 1,
+                "company": "Acme Corp",
+                "title": "Senior Developer",
+                "start_date": "2020-01",
+                "description": "Led team",
+                "match_reasons": ["Python"],
+                "included": True,
+                "order": 1,
+            }
+        ],
+        "skills": [{"name": "Python", "matched": True, "included": True}],
+        "education": [],
+        "projects": [],
+    },
+}
+
+
+def test_generate_stream_emits_fields_then_saved_resume(client):
+    """Streamed generation sends fields as they complete and persists like /generate."""
+    _create_work_experience(client)
+
+    with patch(
+        "services.resume_generator.llm_service.stream_analyze_and_generate",
+        _streaming_llm(STREAMED_RESULT),
+    ):
+        response = client.post(
+            "/api/resumes/generate/stream",
+            json={"job_description": "A" * 150},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _stream_events(response.text)
+    assert [name for name, _ in events] == [
+        "job_title", "company_name", "match_score", "job_analysis",
+        "summary", "work_experience", "resume",
+    ]
+    assert events[0][1] == "Software Engineer"
+    assert events[5][1]["title"] == "Senior Developer"
+
+    resume = events[-1][1]
+    assert resume["job_title"] == "Software Engineer"
+    assert resume["resume"]["summary"] == "Experienced developer"
+    assert client.get(f"/api/resumes/{resume['id']}").json() == resume
+
+    with get_db() as conn:
+        row = conn.execute(
+            "SELECT * FROM generated_resumes WHERE id = ?", (resume["id"],)
+        ).fetchone()
+    assert row["provider"] == "claude"
+    assert row["prompt_hash"] == "a" * 40
+    assert row["job_id"] is not None
+
+
+def test_generate_stream_no_profile(client):
+    """Profile checks run before the stream starts and return a normal 400."""
+    response = client.post(
+        "/api/resumes/generate/stream",
+        json={"job_description": "A" * 150},
+    )
+    assert response.status_code == 400
+    assert "work experience" in response.json()["detail"].lower()
+
+
+def test_generate_stream_reports_llm_failure_as_event(client):
+    """Errors after the stream has started arrive as an error event."""
+    _create_work_experience(client)
+
+    async def failing_stream(job_description, profile, language="en", bypass_cache=False):
+        yield "delta", '{"job_title": "Engineer", '
+        raise ConnectionError("Could not connect to AI service")
+
+    with patch(
+        "services.resume_generator.llm_service.stream_analyze_and_generate",
+        failing_stream,
+    ):
+        response = client.post(
+            "/api/resumes/generate/stream",
+            json={"job_description": "A" * 150},
+        )
+
+    events = _stream_events(response.text)
+    assert events == [
+        ("job_title", "Engineer"),
+        ("error", {"detail": "Could not connect to AI service"}),
+    ]
+    assert client.get("/api/resumes").json() == []
+
+
+def test_list_resumes_invalid_cursor(client):
+    for cursor in ("not-a-cursor", encode_cursor("a", {}), encode_cursor("2026-01-01", "7")):
+        response = client.get("/api/resumes", params={"cursor": cursor})
+        assert response.status_code == 400
+
+
+def test_list_resumes_paginated_and_filtered(client):
+    job_id = _create_job(client).json()["id"]
+    with get_db() as conn:
+        for i, company in enumerate(["Acme", "Globex", "Acme"]):
+            conn.execute(
+                "INSERT INTO generated_resumes (job_id, job_title, company_name, resume_content, created_at) "
+                "VALUES (?, ?, ?, '{}', ?)",
+                (job_id, f"Role {i}", company, f"2026-01-0{i + 1} 10:00:00"),
+            )
+        conn.commit()
+
+    first = client.get("/api/resumes", params={"limit": 2})
+    second = client.get("/api/resumes", params={"limit": 2, "cursor": first.headers["x-next-cursor"]})
+
+    assert [r["job_title"] for r in first.json()] == ["Role 2", "Role 1"]
+    assert [r["job_title"] for r in second.json()] == ["Role 0"]
+    assert "x-next-cursor" not in second.headers
+    assert [r["job_title"] for r in client.get("/api/resumes", params={"company": "acme"}).json()] == [
+        "Role 2",
+        "Role 0",
+    ]
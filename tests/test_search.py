@@ -0,0 +1,121 @@
+# Lean Code — BSD 3-Clause License — Vivian Voss, 2026
+# Scope: Tests for services/search.py and GET /api/search — FTS5 indexes kept in sync by triggers.
+
+import json
+
+from database import get_db, init_db
+from services.search import fts_query, split_highlights
+
+JOB_TEXT = "We are hiring a Kubernetes platform engineer to run our clusters in Brussels. " * 3
+
+
+def _create_job(client, text=JOB_TEXT):
+    return client.post("/api/jobs", json={"original_text": text}).json()
+
+
+def _insert_resume(job_id, content, job_title="Platform Engineer", company_name="Acme"):
+    with get_db() as conn:
+        resume_id = conn.execute(
+            "INSERT INTO generated_resumes (job_id, job_title, company_name, resume_content) VALUES (?, ?, ?, ?)",
+            (job_id, job_title, company_name, json.dumps(content)),
+        ).lastrowid
+        conn.commit()
+    return resume_id
+
+
+def _search(client, q):
+    response = client.get("/api/search", params={"q": q})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_fts_query_quotes_words():
+    assert fts_query('kube AND "ops" -x') == '"kube" "AND" "ops" "x"*'
+    assert fts_query("  --  ") is None
+
+
+def test_split_highlights():
+    text, highlights = split_highlights("a \x02kube\x03 b \x02ops\x03")
+    assert text == "a kube b ops"
+    assert highlights == [(2, 6), (9, 12)]
+
+
+def test_search_finds_job_with_snippet(client):
+    job = _create_job(client)
+
+    results = _search(client, "kubernetes")
+
+    assert [(r["kind"], r["id"]) for r in results] == [("job", job["id"])]
+    hit = results[0]
+    start, end = hit["highlights"][0]
+    assert hit["snippet"][start:end] == "Kubernetes"
+
+
+def test_search_prefix_and_diacritics(client):
+    _create_job(client, "Développeur backend à Liège, expérience requise. " * 4)
+
+    assert _search(client, "develop")
+    assert _search(client, "liege experience")
+
+
+def test_search_follows_updates_and_versions(client):
+    job = _create_job(client)
+    client.put(f"/api/jobs/{job['id']}", json={"original_text": "Rust compiler engineer wanted. " * 6})
+
+    kinds = {(r["kind"], r["job_id"]) for r in _search(client, "kubernetes")}
+    assert kinds == {("job_version", job["id"])}
+    assert [r["kind"] for r in _search(client, "rust")] == ["job"]
+
+
+def test_search_forgets_deleted_jobs(client):
+    job = _create_job(client)
+    _insert_resume(job["id"], {"summary": "Kubernetes operator"})
+
+    client.delete(f"/api/jobs/{job['id']}")
+
+    assert _search(client, "kubernetes") == []
+
+
+def test_search_indexes_resume_text_without_photo_refs(client):
+    job = _create_job(client, "Generic role description, nothing specific in here at all. " * 3)
+    resume_id = _insert_resume(
+        job["id"],
+        {
+            "personal_info": {"full_name": "Jane Doe", "photo_ref": "deadbeef"},
+            "summary": "Seasoned Terraform practitioner",
+            "skills": [{"name": "Ansible", "matched": True}],
+        },
+    )
+
+    assert [(r["kind"], r["id"]) for r in _search(client, "ansible")] == [("resume", resume_id)]
+    assert _search(client, "deadbeef") == []
+
+
+def test_title_match_ranks_first(client):
+    body_only = _create_job(client, "Mentions golang once among many other words here. " * 3)
+    titled = _create_job(client, "Backend role with plenty of unrelated description text. " * 3)
+    client.put(f"/api/jobs/{titled['id']}", json={"title": "Golang Engineer"})
+
+    results = _search(client, "golang")
+
+    assert [r["id"] for r in results] == [titled["id"], body_only["id"]]
+
+
+def test_search_syntax_is_not_interpreted(client):
+    _create_job(client)
+
+    assert _search(client, 'kubernetes: ("brussels') != []
+    assert client.get("/api/search", params={"q": ""}).status_code == 422
+
+
+def test_search_index_backfilled_by_migration(client):
+    job = _create_job(client)
+    with get_db() as conn:
+        conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('delete-all')")
+        conn.execute("DELETE FROM schema_versions WHERE version = '20261018_search_index'")
+        conn.commit()
+    assert _search(client, "kubernetes") == []
+
+    init_db()
+
+    assert [r["id"] for r in _search(client, "kubernetes")] == [job["id"]]
@@ -64,3 +64,37 @@ def test_delete_nonexistent_skill(client):
     """Test deleting a skill that doesn't exist."""
     response = client.delete("/api/skills/9999")
     assert response.status_code == 404
+
+
+def test_add_skills_dedupes_case_insensitively(client):
+    """Input repeats and case variants of stored skills resolve to one skill each."""
+    client.post("/api/skills", json={"names": "Python"})
+
+    response = client.post("/api/skills", json={"names": "python, Go,  go , PYTHON,Machine   Learning,,"})
+
+    assert response.status_code == 200
+    assert [s["name"] for s in response.json()] == ["Python", "Go", "Machine Learning"]
+    assert len(client.get("/api/skills").json()) == 3
+
+
+def test_add_skills_batch_uses_two_statements(client):
+    """A pasted list is resolved set-wise, not one query per name."""
+    from database import get_db
+
+    names = ", ".join(f"Skill {i}" for i in range(150))
+    statements = []
+    with get_db() as conn:
+        conn.set_trace_callback(statements.append)
+    try:
+        response = client.post("/api/skills", json={"names": names})
+    finally:
+        with get_db() as conn:
+            conn.set_trace_callback(None)
+
+    assert len(response.json()) == 150
+    # Trigger programs re-report their outer statement, so count distinct texts
+    skill_statements = {
+        sql for sql in statements
+        if "skills" in sql and sql.lstrip().upper().startswith(("SELECT", "INSERT"))
+    }
+    assert len(skill_statements) == 2
@@ -1,7 +1,13 @@
 """Tests for the translations service."""
 
+import os
+
 import pytest
-from services.translations import load_translations, format_date, MONTHS, SUPPORTED_LANGUAGES
+from unittest.mock import patch
+
+import settings
+from services import translations as translations_module
+from services.translations import load_translations, format_date, format_dates, MONTHS, SUPPORTED_LANGUAGES
 
 
 class TestLoadTranslations:
@@ -55,6 +61,47 @@ class TestLoadTranslations:
         assert set(en.keys()) == set(fr.keys()) == set(nl.keys())
 
 
+class TestTranslationsCache:
+    """Tests for the in-memory translation bundles."""
+
+    def test_bundle_read_once(self):
+        load_translations("fr")
+        with patch("builtins.open", side_effect=AssertionError("read from disk")):
+            assert load_translations("fr")["present"] == "Présent"
+            assert format_date(None, "fr") == "Présent"
+
+    def test_bundle_is_shared_and_read_only(self):
+        translations = load_translations("nl")
+        assert load_translations("nl") is translations
+        with pytest.raises(TypeError):
+            translations["present"] = "Nu"
+
+    def test_reload_on_mtime_change(self, tmp_path, monkeypatch):
+        bundle = tmp_path / "en.json"
+        bundle.write_text('{"present": "Now"}', encoding="utf-8")
+        monkeypatch.setattr(translations_module, "TRANSLATIONS_DIR", tmp_path)
+        monkeypatch.setattr(translations_module, "_cache", {})
+        monkeypatch.setattr(settings, "TRANSLATIONS_RELOAD", True)
+        assert load_translations("en")["present"] == "Now"
+
+        bundle.write_text('{"present": "Ongoing"}', encoding="utf-8")
+        os.utime(bundle, (1, 1))
+
+        assert load_translations("en")["present"] == "Ongoing"
+
+    def test_no_reload_by_default(self, tmp_path, monkeypatch):
+        bundle = tmp_path / "en.json"
+        bundle.write_text('{"present": "Now"}', encoding="utf-8")
+        monkeypatch.setattr(translations_module, "TRANSLATIONS_DIR", tmp_path)
+        monkeypatch.setattr(translations_module, "_cache", {})
+        monkeypatch.setattr(settings, "TRANSLATIONS_RELOAD", False)
+        load_translations("en")
+
+        bundle.write_text('{"present": "Ongoing"}', encoding="utf-8")
+
+        assert load_translations("en")["present"] == "Now"
+
+
 class TestFormatDate:
     """Tests for format_date function."""
 
@@ -88,6 +135,14 @@ class TestFormatDate:
         assert format_date("2024", "en") == "2024"
 
 
+    def test_format_dates_batch(self):
+        """format_dates matches format_date item by item."""
+        dates = ["2020-03", None, "2024-1", "invalid", "2024-13"]
+        for lang in SUPPORTED_LANGUAGES:
+            assert format_dates(dates, lang) == [format_date(d, lang) for d in dates]
+        assert format_dates(dates, "fr") == ["Mars 2020", "Présent", "Janv 2024", "invalid", "13 2024"]
+
+
 class TestMonthsDict:
     """Tests for MONTHS dictionary."""
 
@@ -135,3 +135,48 @@ def test_get_nonexistent_work_experience(client):
     """Test getting a work experience that doesn't exist."""
     response = client.get("/api/work-experiences/9999")
     assert response.status_code == 404
+
+
+def test_batch_work_experiences(client):
+    """Test one batch creates, updates and deletes work experiences."""
+    old = client.post(
+        "/api/work-experiences",
+        json={"company": "Old Co", "title": "Intern", "start_date": "2015-01", "end_date": "2015-06"},
+    ).json()
+    kept = client.post(
+        "/api/work-experiences",
+        json={"company": "Acme Corp", "title": "Developer", "start_date": "2018-01", "end_date": "2021-12"},
+    ).json()
+
+    response = client.patch(
+        "/api/work-experiences/batch",
+        json={
+            "create": [{"company": "Tech Inc", "title": "Lead", "start_date": "2022-01", "is_current": True}],
+            "update": [{**kept, "title": "Senior Developer"}],
+            "delete": [old["id"]],
+        },
+    )
+    assert response.status_code == 200
+
+    result = response.json()
+    assert [(exp["company"], exp["title"]) for exp in result] == [
+        ("Tech Inc", "Lead"),
+        ("Acme Corp", "Senior Developer"),
+    ]
+    assert result[0]["is_current"] is True
+    assert result[1]["id"] == kept["id"]
+
+
+def test_batch_work_experiences_validates_every_entry(client):
+    """Test an invalid entry anywhere in the batch rejects it before writing."""
+    response = client.patch(
+        "/api/work-experiences/batch",
+        json={
+            "create": [
+                {"company": "Tech Inc", "title": "Lead", "start_date": "2022-01"},
+                {"company": "Bad Co", "title": "Dev", "start_date": "January 2020"},
+            ]
+        },
+    )
+    assert response.status_code == 422
+    assert client.get("/api/work-experiences").json() == []